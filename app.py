@@ -1,20 +1,40 @@
+import hmac
+import json
 import os
 import random
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, wait as wait_futures
 from datetime import datetime, timedelta
 from flask import (
     Flask, render_template, request, redirect,
-    url_for, flash, jsonify
+    url_for, flash, jsonify, Response
 )
 from apscheduler.schedulers.background import BackgroundScheduler
 from flask_mail import Mail, Message
 from dotenv import load_dotenv
+from config import (
+    CRAWL_CANCEL_WAIT_SECONDS,
+    DIGEST_WATERMARK_GRACE_SECONDS,
+    SEARCH_API_PAGE_SIZE,
+    VERIFICATION_CODE_TTL_SECONDS,
+)
 from db import get_connection
+from db_migrations import require_migrations
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 from urllib.parse import urlparse
-import subprocess
 import atexit
 
+from crawl_linkareer import LinkareerCrawler
+from digest import build_digest_messages
+import metrics
+from outbox import OutboxWorker, enqueue, enqueue_many
+from search import InvalidCursor, cache_key, parse_keywords, search_jobs, search_jobs_page
+from search_cache import QueryCache
+from crawl_saramin import SaraminCrawler
+from project01_test import JasoseolCrawler
+
 
 load_dotenv()
 
@@ -31,18 +51,31 @@ app.config["MAIL_DEFAULT_SENDER"] = os.getenv("MAIL_DEFAULT_SENDER")
 
 mail = Mail(app)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CRAWLER_SCRIPTS = [
-    "crawl_saramin.py",
-    "crawl_linkareer.py",
-    "project01_test.py",
+CRAWLERS = [
+    SaraminCrawler,
+    LinkareerCrawler,
+    JasoseolCrawler,
 ]
 
 VERIFICATION_CODE_LENGTH = 6
 
+# /metrics 접근 토큰 (Authorization: Bearer <토큰>). 비워 두면 같은 서버(loopback)에서 온 요청만 허용
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# 메일 일괄 발송: SMTP 연결 하나로 보낼 메일 수 / 동시에 연결을 여는 발송 워커 수
+MAIL_MESSAGES_PER_CONNECTION = int(os.getenv("MAIL_MESSAGES_PER_CONNECTION", 50))
+MAIL_SENDER_WORKERS = int(os.getenv("MAIL_SENDER_WORKERS", 4))
+# 메일 한 통을 보내다 연결이 끊겼을 때 다시 연결해 시도하는 최대 횟수
+MAIL_MAX_RECONNECTS = int(os.getenv("MAIL_MAX_RECONNECTS", 3))
+
+
+def mail_configured() -> bool:
+    return bool(app.config.get("MAIL_SERVER") and app.config.get("MAIL_USERNAME"))
+
 
 def send_email(to_email: str, subject: str, body: str):
     """실제 메일 설정이 없으면 콘솔에만 출력, 있으면 Flask-Mail로 발송"""
-    if not app.config.get("MAIL_SERVER") or not app.config.get("MAIL_USERNAME"):
+    if not mail_configured():
         print("\nTest")
         print(f"To: {to_email}")
         print(f"Subject: {subject}")
@@ -56,112 +89,316 @@ def send_email(to_email: str, subject: str, body: str):
     mail.send(msg)
 
 
-def send_keyword_emails(since_hours: int = 24) -> dict:
+def _close_quietly(conn):
+    # 끊긴 소켓에 quit() 을 보내면 다시 SMTPServerDisconnected 가 나므로 정리 중 오류는 무시한다
+    try:
+        conn.__exit__(None, None, None)
+    except Exception:
+        pass
+
+
+def _send_chunk(chunk: list) -> list:
+    """
+    SMTP 연결 하나를 열어 chunk 의 메일을 차례로 보낸다. 연결이 끊기면 새로 열어 이어서 보내고,
+    한 메일에서 MAIL_MAX_RECONNECTS 번 넘게 끊기면 그 메일은 실패로 두고 다음 메일로 넘어간다.
+    연결을 새로 열지 못할 때만 남은 메일을 모두 실패로 기록한다.
+    """
+    results = []
+    pending = list(chunk)
+    reconnects = 0
+
+    with app.app_context():
+        while pending:
+            conn = mail.connect()
+            try:
+                conn.__enter__()
+            except Exception as exc:
+                _close_quietly(conn)
+                results.extend((to_email, repr(exc)) for to_email, _, _ in pending)
+                break
+
+            try:
+                while pending:
+                    to_email, subject, body = pending[0]
+                    msg = Message(subject=subject, recipients=[to_email])
+                    msg.body = body
+                    try:
+                        with metrics.timer("smtp_send"):
+                            conn.send(msg)
+                    except smtplib.SMTPServerDisconnected as exc:
+                        reconnects += 1
+                        if reconnects > MAIL_MAX_RECONNECTS:
+                            results.append((to_email, repr(exc)))
+                            pending.pop(0)
+                            reconnects = 0
+                        # 새 연결로 이어서 보낸다
+                        break
+                    except Exception as exc:
+                        results.append((to_email, repr(exc)))
+                    else:
+                        results.append((to_email, None))
+                    pending.pop(0)
+                    reconnects = 0
+            finally:
+                _close_quietly(conn)
+
+    return results
+
+
+def _send_chunk_timed(chunk: list) -> list:
+    # 연결 수립부터 마지막 메일까지 SMTP 연결 하나가 쓴 시간
+    with metrics.timer("smtp_chunk"):
+        return _send_chunk(chunk)
+
+
+def send_emails_batched(messages: list) -> list:
+    """
+    (수신자, 제목, 본문) 목록을 보내고 입력 순서대로 [(수신자, 실패 사유 또는 None)] 을 돌려준다.
+    MAIL_MESSAGES_PER_CONNECTION 개씩 SMTP 연결을 재사용하고,
+    MAIL_SENDER_WORKERS 개의 워커가 동시에 보낸다.
+    """
+    if not messages:
+        return []
+
+    if not mail_configured():
+        for to_email, subject, body in messages:
+            send_email(to_email, subject, body)
+        return [(to_email, None) for to_email, _, _ in messages]
+
+    size = max(1, MAIL_MESSAGES_PER_CONNECTION)
+    chunks = [messages[i:i + size] for i in range(0, len(messages), size)]
+    results = []
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(MAIL_SENDER_WORKERS, len(chunks))),
+        thread_name_prefix="mail-sender",
+    ) as executor:
+        for chunk_results in executor.map(_send_chunk_timed, chunks):
+            results.extend(chunk_results)
+    return results
+
+
+# 인증 메일/다이제스트는 email_outbox 에 쌓이고 이 워커가 보낸다
+outbox_worker = OutboxWorker(send_emails_batched)
+
+
+# 스케줄러와 GET /send-daily 가 동시에 다이제스트를 만들지 않도록 잡는 MySQL 이름 잠금
+DIGEST_LOCK_NAME = "job_finder.send_keyword_emails"
+
+
+def _enqueue_keyword_digests(conn, since: datetime, grace_seconds: int) -> dict:
+    with conn.cursor() as cursor:
+        # 구독자 행을 잠가 둔다: 실행 도중 재구독/키워드 변경이 들어오면 이 트랜잭션이 끝난 뒤에 반영된다
+        cursor.execute(
+            """
+            SELECT id, email, keyword, last_notified_job_id
+            FROM user
+            WHERE
+                is_verified = 1
+                AND keyword IS NOT NULL
+                AND keyword <> ''
+            FOR UPDATE
+            """
+        )
+        users = cursor.fetchall()
+
+        # 이번 실행에서 다룰 범위의 상한: 저장된 지 grace_seconds 가 지난 공고 중 가장 큰 id.
+        # 방금 들어온 행보다 작은 id 가 아직 commit 전일 수 있어 MAX(id) 로 올리면 그 공고는 영영 빠진다.
+        # (최근 공고는 다음 실행으로 넘어가고, PK 를 뒤에서부터 읽다 처음 만나는 오래된 행에서 멈춘다)
+        cursor.execute(
+            """
+            SELECT id FROM job
+            WHERE created_at <= NOW() - INTERVAL %s SECOND
+            ORDER BY id DESC
+            LIMIT 1
+            """,
+            (grace_seconds,),
+        )
+        high = (cursor.fetchone() or {}).get("id") or 0
+
+        watermarks = [u["last_notified_job_id"] for u in users if u["last_notified_job_id"] is not None]
+        conditions = []
+        params = []
+        if watermarks:
+            conditions.append("id > %s")
+            params.append(min(watermarks))
+        if len(watermarks) < len(users):
+            conditions.append("created_at >= %s")
+            params.append(since)
+
+        jobs = []
+        if users and conditions:
+            cursor.execute(
+                f"""
+                SELECT
+                    id,
+                    company_name,
+                    title,
+                    start_time,
+                    end_time,
+                    detail,
+                    created_at
+                FROM job
+                WHERE
+                    id <= %s
+                    AND ({" OR ".join(conditions)})
+                ORDER BY id DESC
+                """,
+                (high, *params),
+            )
+            jobs = cursor.fetchall()
+
+    messages, distinct_keywords = build_digest_messages(jobs, users, since)
+
+    # 바로 보내지 않고 outbox 에 넣는다 (실패 시 워커가 backoff 로 재시도)
+    enqueued = enqueue_many(conn, messages, kind="digest")
+    if users and high:
+        with conn.cursor() as cursor:
+            user_ids = [u["id"] for u in users]
+            placeholders = ",".join(["%s"] * len(user_ids))
+            cursor.execute(
+                f"""
+                UPDATE user
+                SET last_notified_job_id = %s
+                WHERE id IN ({placeholders})
+                  AND (last_notified_job_id IS NULL OR last_notified_job_id < %s)
+                """,
+                (high, *user_ids, high),
+            )
+    conn.commit()
+
+    return {
+        "skipped": False,
+        "target_users": len(users),
+        "distinct_keywords": distinct_keywords,
+        "new_jobs": len(jobs),
+        "enqueued": enqueued,
+        "last_job_id": high,
+    }
+
+
+def send_keyword_emails(since_hours: int = 24, grace_seconds: int = DIGEST_WATERMARK_GRACE_SECONDS) -> dict:
+    """
+    구독자별 last_notified_job_id 이후에 들어온 공고만 골라 다이제스트를 outbox 에 넣는다.
+    아직 한 번도 받지 않은 구독자는 최근 since_hours 시간 공고를 기준으로 한다.
+    메일 예약과 워터마크 갱신을 한 트랜잭션으로 처리해 공고마다 한 번씩만 보내진다.
+    저장된 지 grace_seconds 가 안 된 공고는 다음 실행으로 넘긴다 (저장 중인 크롤러가 없을 때만 0).
+    다른 곳(스케줄러 / /send-daily)에서 이미 실행 중이면 기다리지 않고 skipped 로 돌아온다.
+    """
     with app.app_context():
         since = datetime.now() - timedelta(hours=since_hours)
         print(f"[스케줄러] 메일 발송 시작: {since}")
 
         with get_connection() as conn:
             with conn.cursor() as cursor:
-                cursor.execute(
-                    """
-                    SELECT email, keyword
-                    FROM user
-                    WHERE
-                        is_verified = 1
-                        AND keyword IS NOT NULL
-                        AND keyword <> ''
-                    """
-                )
-                users = cursor.fetchall()
+                cursor.execute("SELECT GET_LOCK(%s, 0) AS locked", (DIGEST_LOCK_NAME,))
+                locked = (cursor.fetchone() or {}).get("locked") == 1
+            if not locked:
+                print("[스케줄러] 다른 다이제스트 작업이 실행 중이라 건너뜀")
+                return {"skipped": True}
+
+            try:
+                stats = _enqueue_keyword_digests(conn, since, grace_seconds)
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT RELEASE_LOCK(%s)", (DIGEST_LOCK_NAME,))
+        outbox_worker.notify()
 
-            total_users = len(users)
-            sent_count = 0
+        return stats
 
-            for user in users:
-                email = user["email"]
-                keyword = user["keyword"]
-                with conn.cursor() as cursor:
-                    cursor.execute(
-                        """
-                        SELECT
-                            company_name,
-                            title,
-                            start_time,
-                            end_time,
-                            detail,
-                            created_at
-                        FROM job
-                        WHERE
-                            created_at >= %s
-                            AND (
-                                title LIKE CONCAT('%%', %s, '%%')
-                                OR detail LIKE CONCAT('%%', %s, '%%')
-                                OR company_name LIKE CONCAT('%%', %s, '%%')
-                            )
-                        ORDER BY created_at DESC
-                        """,
-                        (since, keyword, keyword, keyword),
-                    )
-                    jobs = cursor.fetchall()
-
-                if not jobs:
-                    continue
-
-                lines = [
-                    f"[{keyword}] 키워드에 대한 최근 {since_hours}시간 새 공고 목록입니다.",
-                    "",
-                ]
-                for job in jobs:
-                    lines.append(
-                        f"- {job['company_name']} / {job['title']} / 등록일: {job['created_at']}"
-                    )
-                    if job.get("detail"):
-                        lines.append(f"  상세: {job['detail']}")
-                    lines.append("")
-
-                body = "\n".join(lines)
-                subject = f"[취업 알림] '{keyword}' 관련 새 공고 {len(jobs)}건 안내"
-                send_email(email, subject, body)
-                sent_count += 1
-
-        return {
-            "target_users": total_users,
-            "sent_to": sent_count,
-        }
+
+def run_single_crawler(crawler) -> dict:
+    print(f"[스케줄러] 크롤러 실행 시작: {crawler.name}")
+    result = crawler.run()
+    if not result.ok:
+        print(f"[스케줄러] 크롤러 실패 ({crawler.name}): {result.errors}")
+    else:
+        print(f"[스케줄러] 크롤러 실행 완료 ({crawler.name})")
+    return result.as_dict()
 
 
-def run_single_crawler(script_name: str):
-    script_path = os.path.join(BASE_DIR, script_name)
-    print(f"[스케줄러] 크롤러 실행 시작: {script_path}")
-    result = subprocess.run(
-        ["python", script_path],
-        capture_output=True,
-        text=True,
-        check=False,
+def run_crawlers_concurrently(crawler_classes=CRAWLERS, cancel_wait: float = CRAWL_CANCEL_WAIT_SECONDS) -> list:
+    """
+    소스별 크롤러를 스레드 풀에서 동시에 실행한다.
+    각 크롤러는 자신의 timeout(초) 안에 끝나지 않으면 cancel() 하고, 진행 중인 페이지 저장까지
+    마치고 끝나기를 최대 cancel_wait 초 기다린다. 그래도 안 끝나면 결과에 still_running 을 남긴다.
+    """
+    crawlers = [cls() for cls in crawler_classes]
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, len(crawlers)), thread_name_prefix="crawler"
     )
-    if result.returncode != 0:
-        print(
-            f"[스케줄러] 크롤러 실패 ({script_name}): {result.stderr or result.stdout}"
-        )
-    else:
-        print(f"[스케줄러] 크롤러 실행 완료 ({script_name})")
+    started = time.monotonic()
+    futures = [(crawler, executor.submit(run_single_crawler, crawler)) for crawler in crawlers]
+
+    results = []
+    cancelled = {}
+    try:
+        for crawler, future in futures:
+            remaining = crawler.timeout - (time.monotonic() - started)
+            try:
+                results.append(future.result(timeout=max(0, remaining)))
+            except FuturesTimeoutError:
+                crawler.cancel()
+                print(f"[스케줄러] {crawler.name} 시간 초과 ({crawler.timeout}초), 취소 요청")
+                result = {"source": crawler.name, "errors": ["timeout"], "still_running": True}
+                results.append(result)
+                cancelled[future] = result
+            except Exception as exc:
+                print(f"[스케줄러] {crawler.name} 실행 중 오류: {exc}")
+                results.append({"source": crawler.name, "errors": [repr(exc)]})
+
+        # 취소한 크롤러가 저장 중인 배치를 commit 하기 전에 다이제스트를 만들면 그 공고가 빠질 수 있다
+        if cancelled:
+            done, _ = wait_futures(cancelled, timeout=cancel_wait)
+            for future in done:
+                cancelled[future]["still_running"] = False
+    finally:
+        # cancel_wait 안에 끝나지 않은 크롤러는 백그라운드에서 정리된다
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
+# 일일 작업 요약에 넣을 지표 (같은 시간에 /search 요청이나 outbox 발송이 남긴 값은 빼고 본다)
+DAILY_SUMMARY_METRICS = ("daily_", "crawler_", "dedup_", "db_insert_", "db_rows_inserted")
 
 
 def run_daily_crawl_and_notify():
     print("[스케줄러] 일일 크롤링 및 메일 발송 작업 시작")
-    for script in CRAWLER_SCRIPTS:
-        try:
-            run_single_crawler(script)
-        except Exception as exc:
-            print(f"[스케줄러] {script} 실행 중 오류: {exc}")
+    before = metrics.snapshot()
+    started = time.perf_counter()
+
+    with metrics.timer("daily_crawl"):
+        crawl_results = run_crawlers_concurrently()
+
+    print(f"[스케줄러] 크롤링 요약: {crawl_results}")
+
+    # 이 프로세스의 크롤러가 모두 끝났으면 저장 중인 공고가 없으므로 방금 들어온 공고까지 이번 메일에 넣는다
+    still_running = [result["source"] for result in crawl_results if result.get("still_running")]
+    if still_running:
+        print(f"[스케줄러] 아직 끝나지 않은 크롤러: {still_running}")
+    grace_seconds = DIGEST_WATERMARK_GRACE_SECONDS if still_running else 0
 
+    stats = None
     try:
-        stats = send_keyword_emails()
+        with metrics.timer("daily_digest"):
+            stats = send_keyword_emails(grace_seconds=grace_seconds)
         print(f"[스케줄러] 메일 발송 요약: {stats}")
     except Exception as exc:
         print(f"[스케줄러] 메일 발송 중 오류: {exc}")
 
+    # 이번 실행의 크롤링/중복 체크/저장/다이제스트 단계별 시간과 처리량 (메일 실제 발송은 outbox 워커 몫이라 제외)
+    summary = {
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+        "crawlers": crawl_results,
+        "digest": stats,
+        **metrics.summary(since=before, prefixes=DAILY_SUMMARY_METRICS),
+    }
+    print("[스케줄러] 실행 요약(JSON): " + json.dumps(summary, ensure_ascii=False, default=str))
+    return summary
+
 
 @app.route("/", methods=["GET", "POST"])
 def home():
@@ -306,10 +543,11 @@ def home():
 
     if keyword and not password:
         code = f"{random.randint(0, 10**VERIFICATION_CODE_LENGTH - 1):0{VERIFICATION_CODE_LENGTH}d}"
-        expires_at = datetime.now() + timedelta(minutes=10)
+        expires_at = datetime.now() + timedelta(seconds=VERIFICATION_CODE_TTL_SECONDS)
 
         with get_connection() as conn:
             with conn.cursor() as cursor:
+                # 재구독/키워드 변경이면 예전 워터마크를 이어 쓰지 않고 처음 받는 구독자처럼 최근 공고부터 받는다
                 cursor.execute(
                     """
                     INSERT INTO user (email, keyword, auth_code, auth_expires_at, is_verified, created_at)
@@ -318,15 +556,18 @@ def home():
                         keyword = VALUES(keyword),
                         auth_code = VALUES(auth_code),
                         auth_expires_at = VALUES(auth_expires_at),
-                        is_verified = 0
+                        is_verified = 0,
+                        last_notified_job_id = NULL
                     """,
                     (email, keyword, code, expires_at),
                 )
-            conn.commit()
 
-        subject = "[JOB-FINDER] 이메일 인증 코드 안내"
-        body = f"인증 코드: {code}\n10분 이내에 입력해주세요."
-        send_email(email, subject, body)
+            # 요청 안에서 SMTP 를 기다리지 않도록 outbox 에만 넣고 바로 응답한다
+            subject = "[JOB-FINDER] 이메일 인증 코드 안내"
+            body = f"인증 코드: {code}\n{VERIFICATION_CODE_TTL_SECONDS // 60}분 이내에 입력해주세요."
+            enqueue(conn, email, subject, body, kind="verification")
+            conn.commit()
+        outbox_worker.notify()
 
         flash(f"인증 코드가 {email} 로 발송되었습니다.", "info")
 
@@ -379,6 +620,10 @@ def home():
 
 
 
+# 검색 결과 캐시: 크롤러가 새 공고를 저장하면(job_store 수집 세대 증가) 이전 결과는 쓰지 않는다
+search_cache = QueryCache()
+
+
 @app.route("/search", methods=["POST"])
 def search():
     """검색 폼에서 넘어온 키워드로 job 테이블 조회 후 results.html 렌더링"""
@@ -387,34 +632,19 @@ def search():
         flash("검색 키워드를 입력해주세요.", "danger")
         return redirect(url_for("home"))
 
-    first_keyword = query.split(",")[0].strip()
-    like = f"%{first_keyword}%"
+    keywords = parse_keywords(query)
+    mode = "all" if request.form.get("mode") == "all" else "any"
 
-    with get_connection() as conn:
-        with conn.cursor() as cursor:
-            cursor.execute(
-                """
-                SELECT
-                    id,
-                    company_name,
-                    title,
-                    end_time,
-                    detail,
-                    created_at
-                FROM job
-                WHERE
-                    title LIKE %s
-                    OR detail LIKE %s
-                    OR company_name LIKE %s
-                ORDER BY end_time ASC
-                LIMIT 100
-                """,
-                (like, like, like),
-            )
-            rows = cursor.fetchall()
+    def load():
+        with metrics.timer("search_query", endpoint="search"):
+            with get_connection() as conn:
+                return search_jobs(conn, keywords, mode=mode)
+
+    with metrics.timer("search_request", endpoint="search"):
+        rows = search_cache.get_or_load(cache_key(keywords, mode), load)
 
     job_list = []
-    keywords_for_display = [kw.strip() for kw in query.split(",") if kw.strip()]
+    keywords_for_display = keywords
 
     for r in rows:
         detail_url = r["detail"] or "#"
@@ -435,12 +665,73 @@ def search():
 
     return render_template("result.html", query=query, job_list=job_list)
 
+def _json_value(value):
+    return value.isoformat() if hasattr(value, "isoformat") else value
+
+
+@app.route("/api/search", methods=["GET"])
+def api_search():
+    """
+    검색 결과 JSON API (키셋 페이지네이션)
+    q=키워드(쉼표 구분) mode=any|all limit=페이지 크기 fields=컬럼(쉼표 구분) cursor=이전 응답의 next_cursor
+    """
+    keywords = parse_keywords(request.args.get("q", ""))
+    mode = "all" if request.args.get("mode") == "all" else "any"
+    fields = [f.strip() for f in request.args.get("fields", "").split(",") if f.strip()]
+    try:
+        page_size = int(request.args.get("limit", SEARCH_API_PAGE_SIZE))
+    except ValueError:
+        return jsonify({"error": "limit 은 숫자여야 합니다."}), 400
+
+    cursor = request.args.get("cursor")
+
+    def load():
+        with metrics.timer("search_query", endpoint="api_search"), get_connection() as conn:
+            return search_jobs_page(
+                conn,
+                keywords,
+                mode=mode,
+                cursor=cursor,
+                page_size=page_size,
+                fields=fields,
+            )
+
+    try:
+        with metrics.timer("search_request", endpoint="api_search"):
+            page = search_cache.get_or_load(
+                cache_key(keywords, mode, cursor, page_size, tuple(fields)), load
+            )
+    except InvalidCursor:
+        return jsonify({"error": "cursor 값이 올바르지 않습니다."}), 400
+
+    items = [{k: _json_value(v) for k, v in item.items()} for item in page["items"]]
+    return jsonify({"items": items, "next_cursor": page["next_cursor"]})
+
+
+def metrics_allowed() -> bool:
+    if METRICS_TOKEN:
+        auth = request.headers.get("Authorization", "")
+        return hmac.compare_digest(auth, f"Bearer {METRICS_TOKEN}")
+    # 리버스 프록시 뒤에서는 모든 요청이 loopback 으로 보이므로 반드시 METRICS_TOKEN 을 설정한다
+    return request.remote_addr in ("127.0.0.1", "::1")
+
+
+@app.route("/metrics", methods=["GET"])
+def metrics_endpoint():
+    """Prometheus 형식 단계별 타이머/카운터 (내부 수집용, 공개하지 않는다)"""
+    if not metrics_allowed():
+        return Response("forbidden\n", status=403, mimetype="text/plain")
+    return Response(metrics.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
+
 @app.route("/send-daily", methods=["GET"])
 def send_daily():
     stats = send_keyword_emails()
+    if stats["skipped"]:
+        return jsonify({"message": "이미 다른 메일 발송 작업이 실행 중입니다.", **stats}), 409
     return jsonify(
         {
-            "message": "24시간 이내 새 공고 메일 발송 작업 완료",
+            "message": "24시간 이내 새 공고 메일 발송 예약 완료",
             **stats,
         }
     )
@@ -459,7 +750,12 @@ def setup_scheduler():
     print("[스케줄러] 스케줄러 시작")
     atexit.register(lambda: scheduler.shutdown(wait=False))
 
+    outbox_worker.start()
+    atexit.register(outbox_worker.stop)
+
 if not app.debug or os.getenv("WERKZEUG_RUN_MAIN") == "true":
+    # email_outbox / job 정규화 컬럼 등이 없으면 요청마다 실패하므로 시작 단계에서 멈춘다
+    require_migrations()
     print("[스케줄러] 스케줄러 설정 시작")
     setup_scheduler()
 
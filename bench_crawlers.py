@@ -0,0 +1,233 @@
+"""
+크롤러 오프라인 벤치마크.
+
+    python bench_crawlers.py record --pages 5     # 실제 사이트에서 페이지를 받아 fixtures/http 에 저장
+    python bench_crawlers.py                      # 저장된 응답으로 parse / dedup / persist 단계 측정
+    python bench_crawlers.py --db mysql --json bench.json
+
+persist 는 기본으로 메모리 SQLite(job 테이블 흉내)에 job_store.insert_jobs_bulk 를 그대로 돌린다.
+--db mysql 이면 .env 의 MySQL 에 실제로 넣으므로 로컬/테스트 DB 에서만 쓴다.
+"""
+import argparse
+import contextlib
+import io
+import json
+import sqlite3
+import statistics
+import time
+import tracemalloc
+
+import http_fixtures
+from crawl_linkareer import LinkareerCrawler
+from crawl_saramin import SaraminCrawler
+from insert_data import JobIndex, is_similar_job, is_similar_job_normalize_company, normalize_company
+from job_store import insert_jobs_bulk
+from project01_test import JasoseolCrawler
+
+# (크롤러, 중복 판정 함수, 회사명 정규화) — 각 크롤러의 dedup 과 같은 규칙 (MySQL 조회 부분 제외)
+BENCH_CRAWLERS = [
+    (SaraminCrawler, is_similar_job, None),
+    (JasoseolCrawler, None, None),
+    (LinkareerCrawler, is_similar_job_normalize_company, normalize_company),
+]
+
+SQLITE_JOB_SCHEMA = """
+CREATE TABLE job (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company_name TEXT,
+    title TEXT,
+    start_time TEXT,
+    end_time TEXT,
+    detail TEXT UNIQUE,
+    company_norm TEXT,
+    fingerprint BLOB,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+class _SQLiteCursor:
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def executemany(self, sql, rows):
+        sql = sql.replace("%s", "?").replace("ON DUPLICATE KEY UPDATE id = id", "ON CONFLICT (detail) DO NOTHING")
+        before = self._conn.total_changes
+        self._conn.executemany(sql, rows)
+        return self._conn.total_changes - before
+
+
+class SQLiteJobDB:
+    """insert_jobs_bulk 가 쓰는 만큼만 맞춘 pymysql 연결 대용 (벤치마크 전용)"""
+
+    def __init__(self):
+        self._conn = sqlite3.connect(":memory:")
+        self._conn.execute(SQLITE_JOB_SCHEMA)
+
+    def cursor(self):
+        return _SQLiteCursor(self._conn)
+
+    def commit(self):
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
+def open_db(kind: str):
+    if kind == "mysql":
+        from db import get_connection
+
+        return get_connection()
+    return SQLiteJobDB()
+
+
+def record(pages: int):
+    http_fixtures.set_mode("record")
+    for crawler_cls, _, _ in BENCH_CRAWLERS:
+        crawler = crawler_cls()
+        saved = 0
+        for page in range(1, pages + 1):
+            raw = crawler.fetch_page(page)
+            saved += 1
+            if not crawler.parse(raw):
+                break
+        print(f"[record] {crawler.name}: {saved} 페이지 저장 → {http_fixtures.get_store().path}")
+
+
+def load_pages(crawler, max_pages: int) -> list:
+    """녹화된 페이지를 1페이지부터 없을 때까지 읽는다."""
+    raws = []
+    for page in range(1, max_pages + 1):
+        try:
+            raws.append((page, crawler.fetch_page(page)))
+        except http_fixtures.FixtureMissing:
+            break
+    return raws
+
+
+def run_stages(crawler, raws, is_similar, normalize, db_kind):
+    """parse → dedup → persist 를 한 번 돌리고 단계별 소요 시간과 행 수를 돌려준다."""
+    timings = {}
+
+    started = time.perf_counter()
+    jobs = []
+    for fetched in raws:
+        _, page_jobs = crawler.parse_page(fetched)
+        jobs.extend(page_jobs or [])
+    timings["parse"] = time.perf_counter() - started
+
+    started = time.perf_counter()
+    if is_similar is None:
+        new_jobs = jobs
+    else:
+        index = JobIndex(normalize=normalize)
+        new_jobs = []
+        for job in jobs:
+            if not is_similar(job, index, threshold=0.85, source=crawler.name):
+                index.add(job)
+                new_jobs.append(job)
+    timings["dedup"] = time.perf_counter() - started
+
+    conn = open_db(db_kind)
+    try:
+        started = time.perf_counter()
+        inserted = insert_jobs_bulk(conn, new_jobs)
+        timings["persist"] = time.perf_counter() - started
+    finally:
+        conn.close()
+
+    return timings, len(jobs), len(new_jobs), inserted
+
+
+def bench_crawler(crawler_cls, is_similar, normalize, args) -> dict:
+    crawler = crawler_cls()
+    with contextlib.redirect_stdout(io.StringIO()):
+        raws = load_pages(crawler, args.max_pages)
+    if not raws:
+        return None
+
+    runs = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(args.repeat):
+            runs.append(run_stages(crawler, raws, is_similar, normalize, args.db))
+
+        # 시간 측정과 따로 한 번 더 돌려 최대 메모리만 잰다 (tracemalloc 은 실행을 느리게 함)
+        tracemalloc.start()
+        run_stages(crawler, raws, is_similar, normalize, args.db)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    _, rows, new_rows, inserted = runs[-1]
+    stages = {}
+    for stage in ("parse", "dedup", "persist"):
+        seconds = statistics.median(timing[stage] for timing, _, _, _ in runs)
+        stage_rows = new_rows if stage == "persist" else rows
+        stages[stage] = {
+            "seconds": seconds,
+            "pages_per_sec": len(raws) / seconds if seconds else None,
+            "rows_per_sec": stage_rows / seconds if seconds else None,
+        }
+
+    return {
+        "source": crawler.name,
+        "pages": len(raws),
+        "rows": rows,
+        "new_rows": new_rows,
+        "inserted": inserted,
+        "peak_memory_mb": peak / (1024 * 1024),
+        "stages": stages,
+    }
+
+
+def _rate(value) -> str:
+    return f"{value:,.0f}" if value is not None else "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤러 parse/dedup/persist 오프라인 벤치마크")
+    parser.add_argument("command", nargs="?", choices=("run", "record"), default="run")
+    parser.add_argument("--pages", type=int, default=5, help="record: 크롤러마다 저장할 페이지 수")
+    parser.add_argument("--max-pages", type=int, default=1000, help="run: 재생할 최대 페이지 수")
+    parser.add_argument("--repeat", type=int, default=5, help="run: 반복 횟수 (중앙값 보고)")
+    parser.add_argument("--db", choices=("sqlite", "mysql"), default="sqlite")
+    parser.add_argument("--json", help="결과를 JSON 파일로도 저장")
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record(args.pages)
+        return
+
+    http_fixtures.set_mode("replay")
+    results = []
+    for crawler_cls, is_similar, normalize in BENCH_CRAWLERS:
+        result = bench_crawler(crawler_cls, is_similar, normalize, args)
+        if result is None:
+            print(f"[bench] {crawler_cls.name}: 녹화된 응답이 없어 건너뜀 (먼저 record 실행)")
+            continue
+        results.append(result)
+
+        print(
+            f"[bench] {result['source']}: {result['pages']} 페이지 / {result['rows']}건 "
+            f"(신규 {result['new_rows']}, 저장 {result['inserted']}) / 최대 메모리 {result['peak_memory_mb']:.1f} MiB"
+        )
+        for stage, stat in result["stages"].items():
+            print(
+                f"    {stage:<8} {stat['seconds'] * 1000:8.2f} ms  "
+                f"{_rate(stat['pages_per_sec']):>10} pages/s  {_rate(stat['rows_per_sec']):>12} rows/s"
+            )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"[bench] 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
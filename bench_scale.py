@@ -0,0 +1,238 @@
+"""
+합성 데이터 규모별 벤치마크: 중복 체크(insert_data.is_similar_job*)와 키워드 다이제스트 생성(digest).
+
+    python bench_scale.py                                   # 기본: 공고 1만 / 구독자 1천
+    python bench_scale.py --jobs 10000,100000,1000000 --subscribers 1000,10000,100000 --json scale.json
+    python bench_scale.py --jobs 100000 --linear-sample 200  # 선형 스캔(인덱스 없음)과 비교
+
+DB 없이 메모리에서만 돈다. 같은 --seed 면 같은 데이터가 만들어지므로 변경 전후 결과를 비교할 수 있다.
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from digest import build_digest_messages
+from insert_data import JobIndex, is_similar_job, is_similar_job_normalize_company, normalize_company
+
+COMPANY_HEADS = [
+    "한국", "대한", "삼성", "현대", "엘지", "에스케이", "카카오", "네이버", "우리", "신한",
+    "케이티", "동원", "한빛", "미래", "새롬", "누리", "하나", "씨제이", "롯데", "포스코",
+    "코리아", "글로벌", "서울", "부산", "한화", "두산", "아이", "넥스트", "스마트", "그린",
+]
+COMPANY_TAILS = [
+    "테크", "소프트", "정보통신", "시스템즈", "시큐리티", "데이터", "네트웍스", "솔루션", "랩스", "에너지",
+    "바이오", "금융", "커머스", "모빌리티", "게임즈", "클라우드", "엔지니어링", "컨설팅", "미디어", "로보틱스",
+]
+COMPANY_FORMS = ["{}", "주식회사 {}", "(주){}", "{}㈜", "{} 주식회사"]
+
+TITLE_LEVELS = ["[신입]", "[경력]", "[신입/경력]", "[인턴]", "", "[전환형 인턴]"]
+TITLE_ROLES = [
+    "백엔드 개발자", "프론트엔드 개발자", "정보보안 담당자", "보안관제 요원", "데이터 엔지니어",
+    "데이터 분석가", "머신러닝 엔지니어", "DevOps 엔지니어", "모의해킹 컨설턴트", "인프라 운영",
+    "QA 엔지니어", "iOS 개발자", "안드로이드 개발자", "서비스 기획자", "클라우드 보안 엔지니어",
+]
+TITLE_STACKS = ["(Java/Spring)", "(Python)", "(React)", "(AWS)", "(Kotlin)", "(Go)", "(C/C++)", "", ""]
+TITLE_PLACES = ["", " - 서울", " - 판교", " - 부산", " 채용", " 모집", " 정규직 채용"]
+
+# 구독 키워드: 앞쪽일수록 구독자가 많다 (zipf 분포로 뽑음)
+KEYWORDS = [
+    "보안", "백엔드", "개발", "데이터", "Python", "Java", "프론트엔드", "클라우드", "AI", "인턴",
+    "모의해킹", "관제", "React", "DevOps", "QA", "기획", "안드로이드", "iOS", "금융", "게임",
+    "머신러닝", "인프라", "정보보호", "컨설턴트", "Spring", "AWS", "Kotlin", "Go", "서울", "판교",
+]
+
+
+def _company(rng: random.Random) -> str:
+    name = rng.choice(COMPANY_HEADS) + rng.choice(COMPANY_TAILS)
+    if rng.random() < 0.5:
+        # 실제 회사명처럼 같은 조합이 여럿이 되도록 꼬리 번호를 붙인다
+        name += str(rng.randint(1, 400))
+    return rng.choice(COMPANY_FORMS).format(name)
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(
+        part for part in (rng.choice(TITLE_LEVELS), rng.choice(TITLE_ROLES) + rng.choice(TITLE_STACKS))
+        if part
+    ) + rng.choice(TITLE_PLACES)
+
+
+def _near_duplicate(rng: random.Random, job: dict) -> dict:
+    """다른 사이트에 같은 공고가 조금 다르게 올라온 경우를 흉내 낸다."""
+    company = job["company_name"]
+    base = company
+    for form in ("주식회사 ", "(주)", "㈜", " 주식회사"):
+        base = base.replace(form, "")
+    company = rng.choice(COMPANY_FORMS).format(base)
+
+    title = job["title"]
+    roll = rng.random()
+    if roll < 0.3:
+        title = title.replace("[", "(").replace("]", ")")
+    elif roll < 0.6:
+        title = title + " (~채용시)"
+    elif roll < 0.8:
+        title = title.replace(" ", "", 1)
+    return {"company_name": company, "title": title}
+
+
+def make_jobs(rng: random.Random, count: int, start_id: int = 1) -> list:
+    now = datetime.now()
+    return [
+        {
+            "id": start_id + i,
+            "company_name": _company(rng),
+            "title": _title(rng),
+            "detail": f"https://example.com/jobs/{start_id + i}",
+            "created_at": now - timedelta(minutes=rng.randint(0, 60 * 48)),
+        }
+        for i in range(count)
+    ]
+
+
+def make_incoming(rng: random.Random, existing: list, count: int, dup_ratio: float) -> list:
+    incoming = []
+    for i in range(count):
+        if existing and rng.random() < dup_ratio:
+            incoming.append(_near_duplicate(rng, rng.choice(existing)))
+        else:
+            incoming.append({"company_name": _company(rng), "title": _title(rng)})
+    return incoming
+
+
+def make_users(rng: random.Random, count: int, max_job_id: int) -> list:
+    weights = [1 / (rank + 1) for rank in range(len(KEYWORDS))]
+    keywords = rng.choices(KEYWORDS, weights=weights, k=count)
+    users = []
+    for i, keyword in enumerate(keywords):
+        # 대부분은 이전 실행의 워터마크가 있고, 일부는 처음 받는 구독자
+        last_id = None if rng.random() < 0.1 else max_job_id - rng.choice((0, 50, 200, 1000))
+        users.append({"id": i + 1, "email": f"user{i + 1}@example.com", "keyword": keyword, "last_notified_job_id": last_id})
+    return users
+
+
+def _timed(func, repeat: int) -> tuple:
+    """func 를 repeat 번 돌려 (중앙값 초, 마지막 결과) 를 돌려준다. 중복 로그 출력은 버린다."""
+    seconds = []
+    value = None
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            started = time.perf_counter()
+            value = func()
+            seconds.append(time.perf_counter() - started)
+    return statistics.median(seconds), value
+
+
+def bench_dedup(rng, jobs_count: int, args) -> dict:
+    existing = make_jobs(rng, jobs_count)
+    incoming = make_incoming(rng, existing, args.incoming, args.dup_ratio)
+    result = {"existing_jobs": jobs_count, "incoming_jobs": len(incoming)}
+
+    for name, check, normalize in (
+        ("is_similar_job", is_similar_job, None),
+        ("is_similar_job_normalize_company", is_similar_job_normalize_company, normalize_company),
+    ):
+        build_seconds, index = _timed(lambda: JobIndex(existing, normalize=normalize), 1)
+        check_seconds, duplicates = _timed(
+            lambda: sum(1 for job in incoming if check(job, index, threshold=args.threshold)), args.repeat
+        )
+        stat = {
+            "index_build_seconds": build_seconds,
+            "check_seconds": check_seconds,
+            "checks_per_sec": len(incoming) / check_seconds if check_seconds else None,
+            "duplicates": duplicates,
+        }
+
+        if args.linear_sample:
+            # 인덱스 없이 리스트를 통째로 훑던 방식: 표본만 재고 초당 처리량으로 환산
+            sample = incoming[:args.linear_sample]
+            linear_seconds, _ = _timed(
+                lambda: [check(job, existing, threshold=args.threshold) for job in sample], 1
+            )
+            stat["linear_checks_per_sec"] = len(sample) / linear_seconds if linear_seconds else None
+        result[name] = stat
+
+    return result
+
+
+def bench_digest(rng, jobs_count: int, subscribers: int, args) -> dict:
+    new_jobs = make_jobs(rng, max(1, int(jobs_count * args.new_job_ratio)), start_id=jobs_count + 1)
+    users = make_users(rng, subscribers, max_job_id=jobs_count + len(new_jobs))
+    since = datetime.now() - timedelta(hours=24)
+
+    seconds, (messages, distinct_keywords) = _timed(
+        lambda: build_digest_messages(new_jobs, users, since), args.repeat
+    )
+    return {
+        "jobs": jobs_count,
+        "new_jobs": len(new_jobs),
+        "subscribers": subscribers,
+        "distinct_keywords": distinct_keywords,
+        "messages": len(messages),
+        "build_seconds": seconds,
+        "messages_per_sec": len(messages) / seconds if seconds else None,
+    }
+
+
+def _sizes(text: str) -> list:
+    return [int(part.replace("_", "")) for part in text.split(",") if part.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="중복 체크 / 다이제스트 생성 규모별 벤치마크")
+    parser.add_argument("--jobs", default="10000", help="기존 공고 수 (쉼표 구분, 예: 10000,100000,1000000)")
+    parser.add_argument("--subscribers", default="1000", help="구독자 수 (쉼표 구분, 예: 1000,10000,100000)")
+    parser.add_argument("--incoming", type=int, default=1000, help="중복 체크할 새 공고 수")
+    parser.add_argument("--dup-ratio", type=float, default=0.3, help="새 공고 중 기존 공고 변형 비율")
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument("--new-job-ratio", type=float, default=0.02, help="다이제스트 대상(최근 공고) 비율")
+    parser.add_argument("--linear-sample", type=int, default=0, help="선형 스캔 비교에 쓸 표본 수 (0 이면 생략)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (중앙값 보고)")
+    parser.add_argument("--seed", type=int, default=29)
+    parser.add_argument("--json", help="결과를 JSON 파일로도 저장")
+    args = parser.parse_args()
+
+    report = {
+        "python": platform.python_version(),
+        "seed": args.seed,
+        "threshold": args.threshold,
+        "dedup": [],
+        "digest": [],
+    }
+
+    for jobs_count in _sizes(args.jobs):
+        dedup = bench_dedup(random.Random(args.seed), jobs_count, args)
+        report["dedup"].append(dedup)
+        for name in ("is_similar_job", "is_similar_job_normalize_company"):
+            stat = dedup[name]
+            line = (
+                f"[dedup] 기존 {jobs_count:,}건 {name}: 인덱스 {stat['index_build_seconds']:.2f}s, "
+                f"새 공고 {dedup['incoming_jobs']:,}건 {stat['check_seconds']:.3f}s "
+                f"({stat['checks_per_sec']:,.0f}/s, 중복 {stat['duplicates']}건)"
+            )
+            if "linear_checks_per_sec" in stat:
+                line += f" / 선형 스캔 {stat['linear_checks_per_sec']:,.1f}/s"
+            print(line)
+
+        for subscribers in _sizes(args.subscribers):
+            digest = bench_digest(random.Random(args.seed), jobs_count, subscribers, args)
+            report["digest"].append(digest)
+            print(
+                f"[digest] 공고 {jobs_count:,}건(최근 {digest['new_jobs']:,}) / 구독자 {subscribers:,}명: "
+                f"{digest['build_seconds']:.3f}s, 메일 {digest['messages']:,}통"
+            )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"[bench] 결과 저장: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
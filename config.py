@@ -3,6 +3,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 DB_CONFIG = {
     "host": os.getenv("DB_HOST"),
     "port": int(os.getenv("DB_PORT")),
@@ -10,4 +12,92 @@ DB_CONFIG = {
     "password": os.getenv("DB_PASSWORD"),
     "database": os.getenv("DB_NAME"),
     "charset": "utf8mb4",
-}
\ No newline at end of file
+}
+
+# 크롤러들이 함께 쓰는 로컬 중복 체크 인덱스 (SQLite 파일)
+DEDUP_INDEX_PATH = os.getenv(
+    "DEDUP_INDEX_PATH", os.path.join(BASE_DIR, "dedup_index.sqlite3")
+)
+# 동기화할 때 마지막 job.id 보다 이만큼 아래부터 다시 읽는다 (늦게 commit 된 작은 id 보완) /
+# add() 로만 넣은 임시 행을 다른 실행이 지울 수 있게 되기까지의 시간(초)
+DEDUP_SYNC_ID_MARGIN = int(os.getenv("DEDUP_SYNC_ID_MARGIN", 200))
+DEDUP_PROVISIONAL_TTL_SECONDS = int(os.getenv("DEDUP_PROVISIONAL_TTL_SECONDS", 6 * 3600))
+
+# 크롤러 페이지 요청: 호스트별 동시 요청 수 / 초당 요청 수(토큰 버킷) / 버스트 크기
+FETCH_MAX_IN_FLIGHT_PER_HOST = int(os.getenv("FETCH_MAX_IN_FLIGHT_PER_HOST", 4))
+FETCH_RATE_PER_HOST = float(os.getenv("FETCH_RATE_PER_HOST", 2.0))
+FETCH_BURST_PER_HOST = int(os.getenv("FETCH_BURST_PER_HOST", 4))
+
+# 크롤러 공용 HTTP 세션: 커넥션 풀 크기 / 재시도 횟수 / 재시도 backoff(초) / 요청 타임아웃(초)
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", 10))
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", 3))
+HTTP_BACKOFF_FACTOR = float(os.getenv("HTTP_BACKOFF_FACTOR", 0.5))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 15))
+
+# 목록 페이지 조건부 요청 캐시 (ETag / Last-Modified / 본문 해시)
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+HTTP_CACHE_PATH = os.getenv(
+    "HTTP_CACHE_PATH", os.path.join(BASE_DIR, "http_cache.sqlite3")
+)
+
+# 비증분 크롤러가 변경 없는(NOT_MODIFIED) 페이지를 연속으로 이만큼 만나면 나머지 페이지는 보지 않는다
+CRAWL_MAX_UNCHANGED_PAGES = int(os.getenv("CRAWL_MAX_UNCHANGED_PAGES", 3))
+
+# 소스별 증분 크롤링 워터마크 (마지막으로 본 최신 공고 detail URL 들)
+CRAWL_STATE_PATH = os.getenv(
+    "CRAWL_STATE_PATH", os.path.join(BASE_DIR, "crawl_state.sqlite3")
+)
+WATERMARK_SIZE = int(os.getenv("WATERMARK_SIZE", 5))
+
+# job 테이블 bulk INSERT 한 번에 보낼 행 수 (배치마다 commit 1회)
+BULK_INSERT_BATCH_SIZE = int(os.getenv("BULK_INSERT_BATCH_SIZE", 500))
+
+# MySQL 커넥션 풀: 최대 연결 수 / 빌릴 때 대기 시간(초) / 연결 재생성 주기(초) / ping 확인 간격(초)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = float(os.getenv("DB_POOL_RECYCLE", 3600))
+DB_POOL_PING_INTERVAL = float(os.getenv("DB_POOL_PING_INTERVAL", 30))
+
+# 메일 outbox: 한 번에 가져올 메일 수 / 최대 재시도 횟수 / 재시도 기본 간격(초, 지수 증가) /
+# 초당 발송 상한 / 대기 메일이 없을 때 확인 주기(초) / 발송 중 표시 유지 시간(초)
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", 100))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 6))
+OUTBOX_RETRY_BASE_SECONDS = int(os.getenv("OUTBOX_RETRY_BASE_SECONDS", 60))
+OUTBOX_RATE_PER_SECOND = float(os.getenv("OUTBOX_RATE_PER_SECOND", 5))
+OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS", 15))
+OUTBOX_LEASE_SECONDS = int(os.getenv("OUTBOX_LEASE_SECONDS", 600))
+# 인증 메일: 인증 코드 유효 시간(초) / 최대 시도 횟수 / 재시도 기본 간격(초).
+# 코드가 만료된 뒤에는 보내지 않으므로 재시도도 유효 시간 안에서만 예약한다
+VERIFICATION_CODE_TTL_SECONDS = int(os.getenv("VERIFICATION_CODE_TTL_SECONDS", 600))
+OUTBOX_VERIFICATION_MAX_ATTEMPTS = int(os.getenv("OUTBOX_VERIFICATION_MAX_ATTEMPTS", 3))
+OUTBOX_VERIFICATION_RETRY_BASE_SECONDS = int(os.getenv("OUTBOX_VERIFICATION_RETRY_BASE_SECONDS", 15))
+
+# 키워드 다이제스트 워터마크: 저장된 지 이 시간(초)이 지난 공고까지만 이번 실행에서 다룬다.
+# 더 작은 id 가 늦게 commit 되는 경우(시간 초과 후에도 저장 중인 크롤러 등)를 다음 실행에서 놓치지 않기 위한 여유
+DIGEST_WATERMARK_GRACE_SECONDS = int(os.getenv("DIGEST_WATERMARK_GRACE_SECONDS", 120))
+# 스케줄러가 크롤러 하나를 기다리는 최대 시간(초). 지나면 cancel() 한다
+CRAWL_TIMEOUT_SECONDS = int(os.getenv("CRAWL_TIMEOUT_SECONDS", 600))
+# 일일 작업에서 시간 초과로 cancel() 한 크롤러가 진행 중인 페이지를 마치고 끝나기를 기다리는 최대 시간(초)
+CRAWL_CANCEL_WAIT_SECONDS = float(os.getenv("CRAWL_CANCEL_WAIT_SECONDS", 60))
+
+# MySQL ngram_token_size 와 맞춘다. 이보다 짧은 검색어는 FULLTEXT 로 찾을 수 없어 LIKE 로 처리
+FULLTEXT_NGRAM_TOKEN_SIZE = int(os.getenv("FULLTEXT_NGRAM_TOKEN_SIZE", 2))
+
+# JSON 검색 API(/api/search) 기본/최대 페이지 크기
+SEARCH_API_PAGE_SIZE = int(os.getenv("SEARCH_API_PAGE_SIZE", 20))
+SEARCH_API_MAX_PAGE_SIZE = int(os.getenv("SEARCH_API_MAX_PAGE_SIZE", 100))
+
+# 검색 결과 캐시: 최대 항목 수 / 유지 시간(초). 크롤러가 다른 프로세스에서 돌 때는 TTL 이 최대 지연이 된다
+SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", 256))
+SEARCH_CACHE_TTL_SECONDS = float(os.getenv("SEARCH_CACHE_TTL_SECONDS", 300))
+
+# 목록 페이지 HTML 파서: auto(selectolax → lxml → bs4 순으로 설치된 것) / selectolax / lxml / bs4
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "auto")
+
+# 크롤링 파이프라인: 단계 사이 큐 크기(페이지/배치 수) / 저장 스레드로 넘길 최소 공고 수
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", 4))
+PIPELINE_PERSIST_BATCH_SIZE = int(os.getenv("PIPELINE_PERSIST_BATCH_SIZE", 100))
+
+# HTTP 응답 녹화/재생: off / record(실제 요청 후 저장) / replay(저장된 응답만 사용, 네트워크 없음)
+HTTP_FIXTURE_MODE = os.getenv("HTTP_FIXTURE_MODE", "off")
+HTTP_FIXTURE_DIR = os.getenv("HTTP_FIXTURE_DIR", os.path.join(BASE_DIR, "fixtures", "http"))
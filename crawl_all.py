@@ -1,7 +1,9 @@
-import requests
-from bs4 import BeautifulSoup
+import html_parser
+import http_client
 from urllib.parse import urlencode
 
+from crawler_base import Crawler
+
 ExcludeClosed = "true"
 baseurl = "https://jasoseol.com"
 
@@ -10,50 +12,76 @@ duty_ids = ",".join([
     "173","174","175","176","177","178","179","180","181","182"
 ])
 
-headers = {'User-Agent':'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36'}
-
 MAX_PAGE = 20
 
-index = 0
-
-for page in range(1, MAX_PAGE + 1):
-
-    params = {
-        "page": page,
-        "dutyGroupIds": duty_ids,
-        "excludeClosed": "true"
-    }
-
-    url = f"{baseurl}/search?{urlencode(params)}"
-
-    print(f"============={page} 페이지=============")
-    print(url)
-
-    r = requests.get(url, headers=headers)
-    soup = BeautifulSoup(r.text, 'html.parser')
-
-    lists = soup.select("#__next > div > div.responsive-layout > main > div.px-4 > div > main > div > a")
-
-    if not lists or len(lists) < 3:
-        print("크롤링 종료.")
-        break
-
-    for post in lists:
-        company = post.find("h5")
-        title = post.find("h4")
-        link = baseurl + post.get("href")
-        times = post.select("div > div.flex-1.min-w-0.smUp\:mx-4 > div.mt-4.laptop\:mt-2.hidden.smUp\:block > div > div > span")
-
-        start_time = times[0].string if len(times) > 0 else None
-        end_time = times[2].string if len(times) > 2 else None
-
-        index += 1
-
-        print(company.string)
-        print(title.string)
-        print(link)
-        print(start_time)
-        print(end_time)
-        print("===================================")
-
-print(f"{index}개 채용 공고 크롤링 완료.")
\ No newline at end of file
+# main 에는 id 가 없어 SoupStrainer 로 하나만 골라낼 수 없으므로 bs4 에서도 전체를 파싱한다
+LIST_CONTAINER = "#__next > div > div.responsive-layout > main"
+ITEM_SELECTOR = "div.px-4 > div > main > div > a"
+TIMES_SELECTOR = "div > div.flex-1.min-w-0.smUp\\:mx-4 > div.mt-4.laptop\\:mt-2.hidden.smUp\\:block > div > div > span"
+
+
+class JasoseolAllCrawler(Crawler):
+    """자소설닷컴 전체 직무 목록을 화면에 출력만 하는 크롤러 (DB 저장 없음)"""
+
+    name = "jasoseol_all"
+    host = "jasoseol.com"
+    max_pages = MAX_PAGE
+    # 화면 출력용이라 매번 전체 목록을 받는다
+    use_http_cache = False
+
+    def fetch_page(self, page: int):
+        params = {
+            "page": page,
+            "dutyGroupIds": duty_ids,
+            "excludeClosed": ExcludeClosed
+        }
+
+        url = f"{baseurl}/search?{urlencode(params)}"
+        print(url)
+
+        r = http_client.get(url)
+        return r.text
+
+    def parse(self, html: str) -> list:
+        listing = html_parser.parse_listing(html, LIST_CONTAINER)
+        if listing is None:
+            return []
+
+        lists = html_parser.select(listing, ITEM_SELECTOR)
+
+        if not lists or len(lists) < 3:
+            return []
+        return lists
+
+    def normalize(self, post):
+        company = html_parser.select_one(post, "h5")
+        title = html_parser.select_one(post, "h4")
+        times = html_parser.select(post, TIMES_SELECTOR)
+
+        return {
+            "company_name": html_parser.text(company),
+            "title": html_parser.text(title),
+            "start_time": html_parser.text(times[0]) if len(times) > 0 else None,
+            "end_time": html_parser.text(times[2]) if len(times) > 2 else None,
+            "detail": baseurl + html_parser.attr(post, "href"),
+        }
+
+    def persist(self, jobs: list) -> int:
+        for job in jobs:
+            print(job["company_name"])
+            print(job["title"])
+            print(job["detail"])
+            print(job["start_time"])
+            print(job["end_time"])
+            print("===================================")
+        return 0
+
+
+def main():
+    result = JasoseolAllCrawler().run()
+    print(f"{result.fetched}개 채용 공고 크롤링 완료.")
+    return result
+
+
+if __name__ == "__main__":
+    main()
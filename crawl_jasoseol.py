@@ -1,27 +1,26 @@
-import requests
-from bs4 import BeautifulSoup
+import html_parser
+import http_client
+from crawl_all import ITEM_SELECTOR, LIST_CONTAINER, TIMES_SELECTOR
 
 url = "https://jasoseol.com/search?dutyGroupIds=166"
 baseurl = "https://jasoseol.com"
 
-headers = {'User-Agent':'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/142.0.0.0 Safari/537.36'}
+r = http_client.get(url)
+listing = html_parser.parse_listing(r.text, LIST_CONTAINER)
 
-r = requests.get(url, headers=headers)
-soup = BeautifulSoup(r.text, 'html.parser')
-
-lists = soup.select("#__next > div > div.responsive-layout > main > div.px-4 > div > main > div > a")
+lists = html_parser.select(listing, ITEM_SELECTOR) if listing is not None else []
 
 for post in lists:
-    company = post.find("h5")
-    title = post.find("h4")
-    link = baseurl + post.get("href")
-    times = post.select("div > div.flex-1.min-w-0.smUp\:mx-4 > div.mt-4.laptop\:mt-2.hidden.smUp\:block > div > div > span")
+    company = html_parser.select_one(post, "h5")
+    title = html_parser.select_one(post, "h4")
+    link = baseurl + html_parser.attr(post, "href")
+    times = html_parser.select(post, TIMES_SELECTOR)
 
-    start_time = times[0].string if len(times) > 0 else None
-    end_time = times[2].string if len(times) > 2 else None
+    start_time = html_parser.text(times[0]) if len(times) > 0 else None
+    end_time = html_parser.text(times[2]) if len(times) > 2 else None
     
-    print(company.string)
-    print(title.string)
+    print(html_parser.text(company))
+    print(html_parser.text(title))
     print(link)
     print(start_time)
     print(end_time)
@@ -1,18 +1,21 @@
-import requests
 from datetime import datetime, timezone
-import os
-import pymysql
 import json
 import insert_data
+from crawler_base import Crawler
+from db import get_connection
+from dedup_store import DedupStore
+from http_cache import NOT_MODIFIED
+from job_store import find_existing_fingerprints, insert_jobs_bulk
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
-def GetJobs(page: int = 1, page_size: int = 20):
-    baseurl = "https://linkareer.com/activity/"
-    url = "https://api.linkareer.com/graphql"
+BASE_URL = "https://linkareer.com/activity/"
+GRAPHQL_URL = "https://api.linkareer.com/graphql"
 
+
+def build_params(page: int = 1, page_size: int = 20) -> dict:
     variables = {
         "filterBy": {
             "status": "OPEN",
@@ -34,21 +37,14 @@ def GetJobs(page: int = 1, page_size: int = 20):
         }
     }
 
-    params = {
+    return {
         "operationName": "RecruitList",
         "variables": json.dumps(variables, ensure_ascii=False),
         "extensions": json.dumps(extensions, ensure_ascii=False),
     }
 
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json",
-    }
-
-    res = requests.get(url, params=params, headers=headers)
-    res.raise_for_status()
-    data = res.json()
 
+def parse_jobs(data: dict) -> list:
     activities = data["data"]["activities"]["nodes"]
 
     jobs = []
@@ -57,7 +53,7 @@ def GetJobs(page: int = 1, page_size: int = 20):
         if a.get("recruitCloseAt"):
             close_at = datetime.fromtimestamp(a["recruitCloseAt"] / 1000.0)
 
-        detail_url = baseurl + str(a["id"])
+        detail_url = BASE_URL + str(a["id"])
 
         job = {
             "title": a.get("title"),
@@ -71,15 +67,7 @@ def GetJobs(page: int = 1, page_size: int = 20):
 
 
 def get_db_connection():
-    return pymysql.connect(
-        host=os.getenv("DB_HOST"),
-        port=int(os.getenv("DB_PORT")),
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        db=os.getenv("DB_NAME"),
-        charset="utf8mb4",
-        cursorclass=pymysql.cursors.DictCursor,
-    )
+    return get_connection()
 
 
 def get_existing_details(details: list[str]) -> set[str]:
@@ -97,77 +85,107 @@ def get_existing_details(details: list[str]) -> set[str]:
     finally:
         conn.close()
 
-def insert_jobs(job):
-    if not job:
-        return
+def get_existing_fingerprints(jobs: list) -> set:
+    if not jobs:
+        return set()
 
-    db = get_db_connection()
+    conn = get_db_connection()
     try:
-        cursor = db.cursor()
+        return find_existing_fingerprints(conn, jobs)
+    finally:
+        conn.close()
 
-        sql = """
-        INSERT INTO job (
-            company_name, title, start_time, end_time, detail
-        ) VALUES (
-            %s, %s, %s, %s, %s
-        )
-        """
-
-        cursor.execute(
-            sql,
-            (
-                job["company_name"],
-                job["title"],
-                None,
-                job["end_time"],
-                job["detail"],
-            ),
-        )
 
-        db.commit()
+def insert_jobs(jobs):
+    if not jobs:
+        return 0
+
+    db = get_db_connection()
+    try:
+        # 링커리어는 시작일이 없어서 start_time 은 NULL
+        return insert_jobs_bulk(db, [{**job, "start_time": None} for job in jobs])
     finally:
-        cursor.close()
         db.close()
 
 
-def main():
-    exitsting_jobs = insert_data.get_existing_jobs()
-    PAGE_SIZE = 20
-    page = 1
-    total_new = 0
-
-    while True:
-        print(f"{page}페이지 크롤링")
-        jobs = GetJobs(page=page, page_size=PAGE_SIZE)
-
-        if not jobs:
-            print("크롤링 종료")
-            break
+class LinkareerCrawler(Crawler):
+    name = "linkareer"
+    host = "api.linkareer.com"
+    max_pages = 1000
+    # activityOrder RECENT DESC
+    incremental = True
+    requires_schema = True
+    page_size = 20
+
+    def open(self):
+        self.existing_jobs = DedupStore(normalize=insert_data.normalize_company)
+        # 이번 실행에서 통과시켰지만 아직 저장 전인 공고 (저장이 끝나야 existing_jobs 에 넣는다)
+        self.run_jobs = insert_data.JobIndex(normalize=insert_data.normalize_company)
+        self.new_by_detail = 0
+
+    def close(self):
+        if getattr(self, "existing_jobs", None) is not None:
+            self.existing_jobs.close()
+
+    def fetch_page(self, page: int):
+        res = self.fetch(
+            page,
+            GRAPHQL_URL,
+            params=build_params(page, self.page_size),
+            headers={"Accept": "application/json"},
+        )
+        if res is NOT_MODIFIED:
+            return res
+        return res.json()
 
-        page_details = [job["detail"] for job in jobs]
+    def parse(self, data: dict) -> list:
+        return parse_jobs(data)
 
-        existing = get_existing_details(page_details)
+    def dedup(self, jobs: list) -> list:
+        existing = get_existing_details([job["detail"] for job in jobs])
+        by_detail = [job for job in jobs if job["detail"] not in existing]
+        self.new_by_detail = len(by_detail)
 
-        new_jobs = [job for job in jobs if job["detail"] not in existing]
+        # detail 은 달라도 정규화한 회사명+제목이 같은 공고는 유사도 비교 전에 거른다
+        known = get_existing_fingerprints(by_detail)
 
-        if not new_jobs:
+        new_jobs = []
+        for job in by_detail:
+            if insert_data.job_fingerprint(job["company_name"], job["title"]) in known:
+                print(f"{job} 중복 제거")
+                continue
+            if insert_data.is_similar_job_normalize_company(
+                job, self.existing_jobs, source=self.name
+            ) or insert_data.is_similar_job_normalize_company(job, self.run_jobs, source=self.name):
+                print(f"{job} 중복 제거")
+                continue
+            self.run_jobs.add(job)
+            new_jobs.append(job)
+        return new_jobs
+
+    def persist(self, jobs: list) -> int:
+        inserted = insert_jobs(jobs)
+        # commit 된 공고만 공용 인덱스에 넣는다. 저장이 실패하면 다음 실행에서 다시 새 공고로 보여야 한다
+        for job in jobs:
+            self.existing_jobs.add(job)
+        return inserted
+
+    def should_stop(self, page: int, jobs: list, new_jobs: list) -> bool:
+        if not self.new_by_detail:
             print(f"{page} 페이지에 새로운 공고가 없습니다")
-            break
+            return True
 
-        for job in new_jobs:
-            if not insert_data.is_similar_job_normalize_company(job, exitsting_jobs):
-                insert_jobs(job)
-                total_new += len(job)
-            else:
-                print(f"{job} 중복 제거")
+        if len(jobs) < self.page_size:
+            print(f"{page}: 길이 {len(jobs)} < {self.page_size}, 마지막 페이지이므로 종료.")
+            return True
 
-        if len(jobs) < PAGE_SIZE:
-            print(f"{page}: 길이 {len(jobs)} < {PAGE_SIZE}, 마지막 페이지이므로 종료.")
-            break
+        return False
 
-        page += 1
 
-    print(f"새로 저장한 공고 수: {total_new}건")
+def main():
+    result = LinkareerCrawler().run()
+    print(f"새로 저장한 공고 수: {result.inserted}건")
+    return result
 
 if __name__ == "__main__":
     main()
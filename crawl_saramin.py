@@ -1,43 +1,17 @@
-import os
 import re
 from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
 from dotenv import load_dotenv
-import pymysql
 
-from insert_data import is_similar_job
+import html_parser
+from crawler_base import Crawler
+from db import get_connection
+from dedup_store import DedupStore
+from http_cache import NOT_MODIFIED
+from insert_data import JobIndex, is_similar_job, job_fingerprint
+from job_store import find_existing_fingerprints, insert_jobs_bulk
 
 load_dotenv()
 
-# DB 연결
-conn = pymysql.connect(
-    host=os.getenv("DB_HOST"),
-    port=int(os.getenv("DB_PORT")),
-    user=os.getenv("DB_USER"),
-    password=os.getenv("DB_PASSWORD"),
-    database=os.getenv("DB_NAME"),
-    charset="utf8mb4"
-)
-cursor = conn.cursor()
-
-# 기존 공고 불러오기 
-# (company_name, title)만 가져와서 list[dict] 형태로 변환
-cursor.execute("SELECT company_name, title FROM job")
-rows = cursor.fetchall()
-existing_jobs = [
-    {"company_name": r[0], "title": r[1]}
-    for r in rows
-]
-print("기존 공고 개수:", len(existing_jobs))
-
-HEADERS = {
-    'User-Agent': (
-        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-        'AppleWebKit/537.36 (KHTML, like Gecko) '
-        'Chrome/142.0.0.0 Safari/537.36'
-    )
-}
 
 KEYWORDS = "정보보호"
 
@@ -45,10 +19,19 @@ BASE_URL = (
     "https://www.saramin.co.kr/zf_user/search"
     f"?search_area=main&search_done=y&search_optional_item=n"
     f"&searchType=search&searchword={KEYWORDS}"
+    # 등록일순 정렬: 워터마크(이미 수집한 공고)에 닿으면 뒤 페이지는 볼 필요가 없다
+    "&recruitSort=reg_dt"
 )
 
 PAGE_LIMIT = 10
 
+# 검색 결과 목록 영역과 그 안의 공고별 태그 (목록 영역 기준 상대 선택자)
+LIST_CONTAINER = "#recruit_info_list"
+LIST_STRAINER = {"id": "recruit_info_list"}
+TITLE_SELECTOR = "div.content > div > div.area_job > h2 > a"
+COMPANY_SELECTOR = "div.content > div > div.area_corp > strong > a"
+END_DATE_SELECTOR = "div.content > div > div.area_job > div.job_date > span"
+
 
 # 날짜 
 import re
@@ -93,72 +76,105 @@ def parse_date(text: str):
     return None
 
 
-# 크롤링 and 중복체
-for page in range(1, PAGE_LIMIT + 1):
+class SaraminCrawler(Crawler):
+    name = "saramin"
+    host = "www.saramin.co.kr"
+    max_pages = PAGE_LIMIT
+    incremental = True
+    requires_schema = True
+
+    def open(self):
+        self.conn = get_connection()
+        # 기존 공고 인덱스 (로컬 파일, 첫 비교 시점에 새로 추가된 job 행만 동기화)
+        self.existing_jobs = DedupStore()
+        # 이번 실행에서 통과시켰지만 아직 저장 전인 공고 (저장이 끝나야 existing_jobs 에 넣는다)
+        self.run_jobs = JobIndex()
+
+    def close(self):
+        if getattr(self, "existing_jobs", None) is not None:
+            self.existing_jobs.close()
+        if getattr(self, "conn", None) is not None:
+            self.conn.close()
 
-    url = f"{BASE_URL}&recruitPage={page}"
-    print(f"\n======= {page} 페이지 처리 중 =======")
+    def fetch_page(self, page: int):
+        url = f"{BASE_URL}&recruitPage={page}"
+        res = self.fetch(page, url)
+        if res is NOT_MODIFIED:
+            return res
+        return res.text
 
-    res = requests.get(url, headers=HEADERS)
-    res.raise_for_status()
-    soup = BeautifulSoup(res.text, "html.parser")
+    def parse(self, html: str) -> list:
+        listing = html_parser.parse_listing(html, LIST_CONTAINER, strainer=LIST_STRAINER)
+        if listing is None:
+            return []
 
-    title_tags = soup.select("#recruit_info_list > div.content > div > div.area_job > h2 > a")
-    company_tags = soup.select("#recruit_info_list > div.content > div > div.area_corp > strong > a")
-    end_date_tags = soup.select("#recruit_info_list > div.content > div > div.area_job > div.job_date > span")
+        title_tags = html_parser.select(listing, TITLE_SELECTOR)
+        company_tags = html_parser.select(listing, COMPANY_SELECTOR)
+        end_date_tags = html_parser.select(listing, END_DATE_SELECTOR)
 
-    for title_tag, company_tag, end_tag in zip(title_tags, company_tags, end_date_tags):
+        return list(zip(title_tags, company_tags, end_date_tags))
 
-        title = title_tag.get_text(strip=True)
-        company_name = company_tag.get_text(strip=True)
-        end_date_text = end_tag.get_text(strip=True)
-        end_time = parse_date(end_date_text)
+    def normalize(self, item):
+        title_tag, company_tag, end_tag = item
 
         # 상세공고 URL
-        detail_url = title_tag.get("href", "")
+        detail_url = html_parser.attr(title_tag, "href", "")
         if detail_url and not detail_url.startswith("http"):
             detail_url = "https://www.saramin.co.kr" + detail_url
 
-        start_time = None   # 사람인은 시작일 없음 → NULL
-
-        # 새 공고 정보를 dict 로 만들기 (유사도 체크용)
-        new_job = {
-            "company_name": company_name,
-            "title": title,
-            "start_time": start_time,
-            "end_time": end_time,
+        return {
+            "company_name": html_parser.text(company_tag),
+            "title": html_parser.text(title_tag),
+            "start_time": None,   # 사람인은 시작일 없음 → NULL
+            "end_time": parse_date(html_parser.text(end_tag)),
             "detail": detail_url,
         }
 
-        # 유사도 기준 중복 여부 확인 
-        if is_similar_job(new_job, existing_jobs, threshold=0.85):
-            print(f"[유사중복 스킵] {company_name} - {title}")
-            continue
-
-
-        # INSERT
-        insert_sql = """
-            INSERT INTO job
-                (company_name, title, start_time, end_time, detail)
-            VALUES
-                (%s, %s, %s, %s, %s)
-        """
-        cursor.execute(insert_sql, (
-            company_name,
-            title,
-            start_time,
-            end_time,
-            detail_url
-        ))
-        conn.commit()
-
-        # 방금 넣은 공고도 existing_jobs에 추가해서 같은 실행 안에서 뒤에 나오는 공고와도 비교되게 함
-        existing_jobs.append({"company_name": company_name, "title": title})
-
-        print(f"[저장 완료] {company_name} - {title}")
-
-
-cursor.close()
-conn.close()
-
-print("\n===== 전체 작업 완료 =====")
+    def dedup(self, jobs: list) -> list:
+        # 정규화한 회사명+제목이 DB 에 그대로 있는 공고는 유사도 비교 없이 fingerprint 로 먼저 거른다
+        # (self.conn 은 저장 스레드가 쓰므로 조회는 풀에서 따로 빌린 연결로 한다)
+        conn = get_connection()
+        try:
+            known = find_existing_fingerprints(conn, jobs)
+        finally:
+            conn.close()
+
+        new_jobs = []
+        for job in jobs:
+            if job_fingerprint(job["company_name"], job["title"]) in known:
+                print(f"[완전중복 스킵] {job['company_name']} - {job['title']}")
+                continue
+            if not self.is_duplicate(job):
+                new_jobs.append(job)
+        return new_jobs
+
+    def is_duplicate(self, job) -> bool:
+        # 유사도 기준 중복 여부 확인
+        if is_similar_job(job, self.existing_jobs, threshold=0.85, source=self.name) or is_similar_job(
+            job, self.run_jobs, threshold=0.85, source=self.name
+        ):
+            print(f"[유사중복 스킵] {job['company_name']} - {job['title']}")
+            return True
+
+        # 같은 실행 안에서 뒤에 나오는 공고와도 비교되도록 실행 내 인덱스에 추가
+        self.run_jobs.add(job)
+        return False
+
+    def persist(self, jobs: list) -> int:
+        # 페이지 단위 multi-row INSERT, detail 중복은 DB 유니크 키가 걸러낸다
+        inserted = insert_jobs_bulk(self.conn, jobs)
+        # commit 된 공고만 공용 인덱스에 넣는다. 저장이 실패하면 다음 실행에서 다시 새 공고로 보여야 한다
+        for job in jobs:
+            self.existing_jobs.add(job)
+        print(f"[저장 완료] {inserted}건 / {len(jobs)}건")
+        return inserted
+
+
+def main():
+    result = SaraminCrawler().run()
+    print("\n===== 전체 작업 완료 =====")
+    return result
+
+
+if __name__ == "__main__":
+    main()
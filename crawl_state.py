@@ -0,0 +1,61 @@
+import sqlite3
+import threading
+import time
+
+from config import CRAWL_STATE_PATH
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS watermarks (
+    source TEXT NOT NULL,
+    detail TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (source, detail)
+);
+"""
+
+
+class WatermarkStore:
+    """
+    소스별 high-water mark 저장소.
+    최신순 목록의 맨 앞 공고 몇 개(detail URL)를 기억해 두고,
+    다음 실행에서 그 중 하나를 만나면 그 뒤는 이미 수집한 공고로 보고 페이지 넘김을 멈춘다.
+    (맨 앞 공고가 삭제돼도 나머지로 멈출 수 있도록 여러 개를 저장)
+    """
+
+    def __init__(self, path: str = CRAWL_STATE_PATH):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def load(self, source: str) -> set:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT detail FROM watermarks WHERE source = ?", (source,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def save(self, source: str, details: list):
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM watermarks WHERE source = ?", (source,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO watermarks (source, detail, position, seen_at) VALUES (?, ?, ?, ?)",
+                    [(source, detail, i, now) for i, detail in enumerate(details)],
+                )
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
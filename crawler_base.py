@@ -0,0 +1,255 @@
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+
+import http_client
+import metrics
+from config import CRAWL_MAX_UNCHANGED_PAGES, CRAWL_TIMEOUT_SECONDS, HTTP_CACHE_ENABLED, WATERMARK_SIZE
+from crawl_state import WatermarkStore
+from db_migrations import require_migrations
+from fetcher import fetch_pages
+from http_cache import NOT_MODIFIED, ResponseCache, conditional_get
+from pipeline import BatchWriter, Stage
+
+
+@dataclass
+class CrawlResult:
+    """크롤러 한 번 실행 결과 (스케줄러가 로그/요약에 사용)"""
+    source: str
+    pages: int = 0
+    fetched: int = 0
+    inserted: int = 0
+    duplicates: int = 0
+    unchanged_pages: int = 0
+    reached_watermark: bool = False
+    errors: list = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class Crawler:
+    """
+    공통 크롤러 흐름: fetch_page → parse → normalize → dedup → persist
+
+    각 단계는 pipeline 의 크기 제한 큐로 이어져 동시에 돈다: 페이지 요청(fetch_pages 스레드) /
+    parse·normalize(파싱 스레드) / dedup(run 을 호출한 스레드, 순서 유지) / persist(저장 스레드, 배치 단위).
+    persist 는 저장 스레드에서만 불리므로 persist 에서만 쓰는 DB 연결은 따로 잠글 필요가 없다.
+
+    하위 클래스는 name / fetch_page / parse 를 구현하고,
+    필요하면 normalize / is_duplicate / persist / should_stop 을 오버라이드한다.
+    fetch_page 에서 self.fetch() 를 쓰면 조건부 요청 캐시가 적용되고,
+    지난 실행과 같은 페이지는 NOT_MODIFIED 로 돌아와 파싱/DB 작업을 건너뛴다.
+    incremental = True 인 크롤러(최신순 목록)는 지난 실행의 워터마크에 닿으면 페이지 넘김을 멈춘다.
+    공고(job) dict 는 company_name, title, start_time, end_time, detail 키를 사용한다.
+    """
+
+    name = ""
+    # 페이지 요청 동시성/속도 제한을 함께 적용할 호스트 (fetcher.get_host_limiter)
+    host = ""
+    max_pages = 20
+    # 스케줄러가 이 시간(초)이 지나도록 끝나지 않으면 기다리지 않고 cancel() 한다
+    timeout = CRAWL_TIMEOUT_SECONDS
+
+    use_http_cache = HTTP_CACHE_ENABLED
+    # 목록이 최신순일 때만 True: 이미 수집한 공고에 닿으면 그 뒤 페이지는 보지 않는다
+    incremental = False
+    # MySQL 에 저장하는 크롤러는 시작 전에 마이그레이션이 모두 적용됐는지 확인한다
+    requires_schema = False
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._http_cache = None
+        self._cache_entries = {}
+
+    def cancel(self):
+        """진행 중인 페이지까지만 처리하고 멈추도록 요청"""
+        self._cancelled.set()
+
+    def open(self):
+        """DB 연결, 중복 체크 인덱스 준비 등 실행 전 작업"""
+
+    def close(self):
+        """open() 에서 잡은 자원 정리"""
+
+    def fetch(self, page: int, url: str, params=None, headers=None):
+        """공용 HTTP 세션으로 요청. 캐시를 쓰면 바뀌지 않은 페이지는 NOT_MODIFIED 를 돌려준다."""
+        if self._http_cache is None:
+            res = http_client.get(url, params=params, headers=headers)
+            res.raise_for_status()
+            return res
+
+        res, entry = conditional_get(self._http_cache, url, params=params, headers=headers)
+        if entry is not None:
+            self._cache_entries[page] = entry
+        return res
+
+    def _commit_http_cache(self, page: int):
+        # 페이지 처리가 끝난 뒤에만 검증자/해시를 저장해야 실패한 페이지를 다음 실행에서 다시 받는다
+        entry = self._cache_entries.pop(page, None)
+        if entry is not None and self._http_cache is not None:
+            self._http_cache.store(entry)
+
+    def fetch_page(self, page: int):
+        raise NotImplementedError
+
+    def parse(self, raw) -> list:
+        raise NotImplementedError
+
+    def normalize(self, item):
+        """파싱 결과 하나를 job dict 로 변환. None 이면 버린다."""
+        return item
+
+    def is_duplicate(self, job) -> bool:
+        return False
+
+    def dedup(self, jobs: list) -> list:
+        return [job for job in jobs if not self.is_duplicate(job)]
+
+    def persist(self, jobs: list) -> int:
+        """저장한 공고 수를 돌려준다."""
+        return 0
+
+    def should_stop(self, page: int, jobs: list, new_jobs: list) -> bool:
+        return False
+
+    def _fetch_page_timed(self, page: int):
+        # 호스트 제한(대기열) 안쪽에서 재므로 순수 요청 지연만 기록된다
+        with metrics.timer("crawler_fetch", source=self.name):
+            return self.fetch_page(page)
+
+    def parse_page(self, fetched):
+        """파싱 스레드에서 실행: (page, NOT_MODIFIED / 빈 페이지면 None / job 목록)"""
+        page, raw = fetched
+        if raw is NOT_MODIFIED:
+            return page, NOT_MODIFIED
+        with metrics.timer("crawler_parse", source=self.name):
+            items = self.parse(raw)
+            if not items:
+                return page, None
+            return page, [job for job in (self.normalize(item) for item in items) if job]
+
+    def _record_metrics(self, result: CrawlResult):
+        metrics.observe("crawler_run", result.elapsed, source=self.name)
+        metrics.inc("crawler_pages", result.pages, source=self.name)
+        metrics.inc("crawler_unchanged_pages", result.unchanged_pages, source=self.name)
+        metrics.inc("crawler_jobs_fetched", result.fetched, source=self.name)
+        metrics.inc("crawler_jobs_duplicate", result.duplicates, source=self.name)
+        metrics.inc("crawler_jobs_inserted", result.inserted, source=self.name)
+        if result.errors:
+            metrics.inc("crawler_errors", len(result.errors), source=self.name)
+
+    def _pages_saved(self, pages: list):
+        for page in pages:
+            self._commit_http_cache(page)
+
+    def run(self) -> CrawlResult:
+        if self.requires_schema:
+            require_migrations()
+
+        result = CrawlResult(source=self.name)
+        started = time.perf_counter()
+
+        watermarks = WatermarkStore() if self.incremental else None
+        seen = watermarks.load(self.name) if watermarks else set()
+        new_marks = []
+
+        pages = fetch_pages(
+            self._fetch_page_timed,
+            range(1, self.max_pages + 1),
+            host=self.host or self.name,
+            ramp_up=bool(seen),
+        )
+        parsed = None
+        writer = None
+        unchanged_streak = 0
+        try:
+            if self.use_http_cache:
+                self._http_cache = ResponseCache()
+            self.open()
+            parsed = Stage(self.parse_page, pages, name=f"parse-{self.name}")
+            writer = BatchWriter(self.persist, on_saved=self._pages_saved, name=f"persist-{self.name}")
+
+            for page, jobs in parsed:
+                if self._cancelled.is_set():
+                    print(f"[{self.name}] 취소 요청으로 중단")
+                    result.errors.append("cancelled")
+                    break
+
+                if jobs is NOT_MODIFIED:
+                    print(f"[{self.name}] {page} 페이지 변경 없음, 건너뜀")
+                    result.unchanged_pages += 1
+                    self._commit_http_cache(page)
+                    if self.incremental:
+                        # 최신순 목록의 페이지가 그대로면 그 뒤도 새 공고가 없다
+                        break
+                    unchanged_streak += 1
+                    if unchanged_streak >= CRAWL_MAX_UNCHANGED_PAGES:
+                        print(f"[{self.name}] 변경 없는 페이지가 {unchanged_streak}개 연속, 종료")
+                        break
+                    continue
+
+                unchanged_streak = 0
+
+                print(f"[{self.name}] {page} 페이지 처리 중")
+                if jobs is None:
+                    print(f"[{self.name}] {page} 페이지에 공고가 없어 종료")
+                    break
+
+                result.pages += 1
+
+                if self.incremental:
+                    if page == 1:
+                        new_marks = [job["detail"] for job in jobs[:WATERMARK_SIZE] if job.get("detail")]
+                    cut = next((i for i, job in enumerate(jobs) if job.get("detail") in seen), None)
+                    if cut is not None:
+                        jobs = jobs[:cut]
+                        result.reached_watermark = True
+
+                result.fetched += len(jobs)
+
+                with metrics.timer("crawler_dedup", source=self.name):
+                    new_jobs = self.dedup(jobs)
+                result.duplicates += len(jobs) - len(new_jobs)
+                # 저장은 저장 스레드가 배치로 모아서 하고, 끝난 페이지의 캐시 검증자도 그때 저장한다
+                writer.add(page, new_jobs)
+                if writer.error is not None:
+                    break
+
+                if result.reached_watermark:
+                    print(f"[{self.name}] {page} 페이지에서 이미 수집한 공고에 도달, 종료")
+                    break
+
+                if self.should_stop(page, jobs, new_jobs):
+                    break
+        except Exception as exc:
+            print(f"[{self.name}] 크롤링 중 오류: {exc}")
+            result.errors.append(repr(exc))
+        finally:
+            if parsed is not None:
+                parsed.close()
+            else:
+                pages.close()
+            if writer is not None:
+                result.inserted += writer.close()
+                if writer.error is not None:
+                    print(f"[{self.name}] 저장 중 오류: {writer.error}")
+                    result.errors.append(repr(writer.error))
+            if watermarks is not None:
+                # 끝까지 정상 처리했을 때만 워터마크를 앞으로 옮긴다 (실패 시 다음 실행에서 다시 수집)
+                if new_marks and not result.errors:
+                    watermarks.save(self.name, new_marks)
+                watermarks.close()
+            self.close()
+            if self._http_cache is not None:
+                self._http_cache.close()
+            result.elapsed = time.perf_counter() - started
+            self._record_metrics(result)
+
+        print(f"[{self.name}] 완료: {result.as_dict()}")
+        return result
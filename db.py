@@ -1,7 +1,18 @@
+import queue
+import threading
+import time
+
 import pymysql
-from config import DB_CONFIG
+from config import (
+    DB_CONFIG,
+    DB_POOL_PING_INTERVAL,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+)
 
-def get_connection():
+
+def _connect():
     return pymysql.connect(
         host=DB_CONFIG["host"],
         port=DB_CONFIG["port"],
@@ -11,3 +22,131 @@ def get_connection():
         charset=DB_CONFIG["charset"],
         cursorclass=pymysql.cursors.DictCursor,
     )
+
+
+class _PoolEntry:
+    __slots__ = ("raw", "created_at", "last_used")
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+
+class PooledConnection:
+    """
+    pymysql Connection 을 감싼 객체. 나머지 메서드는 그대로 위임하고,
+    close() / with 블록 종료 시 실제로 끊지 않고 풀에 돌려준다.
+    """
+
+    def __init__(self, pool, entry):
+        self._pool = pool
+        self._entry = entry
+
+    def __getattr__(self, name):
+        if self._entry is None:
+            raise pymysql.err.InterfaceError("이미 풀에 반환된 연결입니다.")
+        return getattr(self._entry.raw, name)
+
+    def close(self):
+        if self._entry is not None:
+            entry, self._entry = self._entry, None
+            self._pool._release(entry)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class ConnectionPool:
+    """
+    프로세스 전체에서 공유하는 MySQL 커넥션 풀.
+    - 최대 max_size 개까지만 연결을 만들고, 모두 사용 중이면 timeout 초 동안 기다린다.
+    - 오래 쉬었던 연결은 빌려주기 전에 ping 으로 확인하고, recycle 초가 지난 연결은 새로 만든다.
+    """
+
+    def __init__(self, connect=_connect, max_size=DB_POOL_SIZE, timeout=DB_POOL_TIMEOUT,
+                 recycle=DB_POOL_RECYCLE, ping_interval=DB_POOL_PING_INTERVAL):
+        self._connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_interval = ping_interval
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    def _healthy(self, entry) -> bool:
+        now = time.monotonic()
+        if self.recycle and now - entry.created_at > self.recycle:
+            return False
+        if now - entry.last_used > self.ping_interval:
+            try:
+                entry.raw.ping(reconnect=False)
+            except Exception:
+                return False
+        return True
+
+    def acquire(self) -> PooledConnection:
+        if not self._slots.acquire(timeout=self.timeout):
+            raise TimeoutError(f"DB 커넥션 풀이 가득 찼습니다 (max_size={self.max_size})")
+
+        try:
+            while True:
+                try:
+                    entry = self._idle.get_nowait()
+                except queue.Empty:
+                    entry = _PoolEntry(self._connect())
+                    break
+                if self._healthy(entry):
+                    break
+                self._discard(entry)
+        except Exception:
+            self._slots.release()
+            raise
+
+        return PooledConnection(self, entry)
+
+    def _discard(self, entry):
+        try:
+            entry.raw.close()
+        except Exception:
+            pass
+
+    def _release(self, entry):
+        try:
+            # commit 하지 않은 작업은 다음 사용자에게 넘기지 않는다
+            entry.raw.rollback()
+            entry.last_used = time.monotonic()
+            self._idle.put(entry)
+        except Exception:
+            self._discard(entry)
+        finally:
+            self._slots.release()
+
+    def close_all(self):
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                return
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
+
+
+def get_connection():
+    """풀에서 연결을 빌린다. close() 하거나 with 블록을 벗어나면 풀로 돌아간다."""
+    return get_pool().acquire()
@@ -0,0 +1,198 @@
+"""
+job / user 테이블 스키마 변경 모음.
+    python db_migrations.py
+로 실행하면 아직 적용하지 않은 항목만 순서대로 적용하고 schema_migrations 에 기록한다.
+    python db_migrations.py backfill
+은 007 에서 추가한 정규화 컬럼을 기존 행에 채운다.
+app 과 크롤러는 시작할 때 require_migrations() 로 모두 적용됐는지 확인한다.
+"""
+import sys
+import threading
+
+import pymysql
+
+from db import get_connection
+
+# InnoDB 기본 stopword 목록("a", "i", "on", "to", "de" 등)이 켜져 있으면 ngram 파서는 이 글자를 포함한
+# bigram 을 모두 버려서 "Java", "AI", "AWS", "React", "Node.js" 같은 검색어를 FULLTEXT 로 찾을 수 없다.
+# stopword 설정은 인덱스를 만들 때 정해지므로 FULLTEXT 인덱스를 만드는 마이그레이션은 먼저 이걸 실행한다.
+DISABLE_FULLTEXT_STOPWORDS = "SET SESSION innodb_ft_enable_stopword = 0"
+
+MIGRATIONS = [
+    (
+        "001_job_detail_unique",
+        [
+            # detail 컬럼 길이/타입과 상관없이 키를 걸 수 있도록 해시 컬럼을 쓴다.
+            # 중복이 남아 있어 바로 UNIQUE 를 걸 수 없으니 먼저 일반 인덱스로 만든다.
+            """
+            ALTER TABLE job
+                ADD COLUMN detail_hash BINARY(32)
+                    GENERATED ALWAYS AS (UNHEX(SHA2(detail, 256))) STORED,
+                ADD KEY ix_job_detail_hash (detail_hash)
+            """,
+            # 같은 detail 이 여러 번 들어간 경우 가장 먼저 들어간 행만 남긴다.
+            # TEXT 인 detail 끼리 self-join 하면 인덱스를 못 타서 O(n^2) 이므로 해시 인덱스로 짝을 찾는다.
+            """
+            DELETE j1 FROM job j1
+            JOIN job j2 ON j1.detail_hash = j2.detail_hash AND j1.id > j2.id
+            WHERE j1.detail = j2.detail
+            """,
+            """
+            ALTER TABLE job
+                DROP KEY ix_job_detail_hash,
+                ADD UNIQUE KEY uq_job_detail_hash (detail_hash)
+            """,
+        ],
+    ),
+    (
+        "002_email_outbox",
+        [
+            """
+            CREATE TABLE IF NOT EXISTS email_outbox (
+                id BIGINT AUTO_INCREMENT PRIMARY KEY,
+                kind VARCHAR(20) NOT NULL,
+                to_email VARCHAR(255) NOT NULL,
+                subject VARCHAR(255) NOT NULL,
+                body MEDIUMTEXT NOT NULL,
+                status VARCHAR(10) NOT NULL DEFAULT 'pending',
+                attempts INT NOT NULL DEFAULT 0,
+                next_attempt_at DATETIME NOT NULL,
+                last_error TEXT NULL,
+                created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                sent_at DATETIME NULL,
+                KEY ix_email_outbox_due (status, next_attempt_at)
+            ) DEFAULT CHARSET = utf8mb4
+            """,
+        ],
+    ),
+    (
+        "003_user_notify_watermark",
+        [
+            "ALTER TABLE user ADD COLUMN last_notified_job_id BIGINT NULL",
+            # 처음 받는 구독자의 since_hours 구간 조회용 (id 이후 조회는 PK 사용)
+            "ALTER TABLE job ADD INDEX ix_job_created_at (created_at)",
+        ],
+    ),
+    (
+        "004_job_fulltext_ngram",
+        [
+            DISABLE_FULLTEXT_STOPWORDS,
+            # 한국어는 띄어쓰기 단위 토큰화가 맞지 않아 ngram 파서 사용 (ngram_token_size 기본값 2)
+            """
+            ALTER TABLE job
+                ADD FULLTEXT INDEX ft_job_title_company (title, company_name) WITH PARSER ngram
+            """,
+        ],
+    ),
+    (
+        "005_job_fulltext_ranking",
+        [
+            DISABLE_FULLTEXT_STOPWORDS,
+            # 검색 점수에서 제목/회사명 일치를 따로 계산하기 위한 컬럼별 인덱스
+            """
+            ALTER TABLE job
+                ADD FULLTEXT INDEX ft_job_title (title) WITH PARSER ngram,
+                ADD FULLTEXT INDEX ft_job_company (company_name) WITH PARSER ngram
+            """,
+        ],
+    ),
+    (
+        "006_job_end_time_keyset",
+        [
+            # /api/search 의 (end_time, id) 키셋 페이지네이션용
+            "ALTER TABLE job ADD INDEX ix_job_end_time_id (end_time, id)",
+        ],
+    ),
+    (
+        "007_job_normalized_columns",
+        [
+            # 중복 체크 때마다 다시 계산하던 정규화 값을 저장 시점에 채운다 (job_store.insert_jobs_bulk).
+            # company_norm 은 id 순 스트리밍으로만 읽으므로 인덱스를 두지 않는다
+            """
+            ALTER TABLE job
+                ADD COLUMN company_norm VARCHAR(255) NULL,
+                ADD COLUMN fingerprint BINARY(32) NULL,
+                ADD INDEX ix_job_fingerprint (fingerprint)
+            """,
+        ],
+    ),
+]
+
+
+class SchemaOutOfDate(RuntimeError):
+    pass
+
+
+def pending_migrations(conn) -> list:
+    """아직 적용하지 않은 마이그레이션 이름 (schema_migrations 테이블이 없으면 전부)"""
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT name FROM schema_migrations")
+            applied = {row["name"] for row in cursor.fetchall()}
+    except pymysql.err.ProgrammingError:
+        applied = set()
+    return [name for name, _ in MIGRATIONS if name not in applied]
+
+
+_verified = threading.Event()
+
+
+def require_migrations():
+    """
+    적용하지 않은 마이그레이션이 있으면 SchemaOutOfDate 를 낸다.
+    (새 컬럼/테이블이 없으면 INSERT 마다 unknown column 오류가 나므로 시작할 때 미리 막는다)
+    한 번 확인하면 프로세스 안에서는 다시 조회하지 않는다.
+    """
+    if _verified.is_set():
+        return
+    with get_connection() as conn:
+        missing = pending_migrations(conn)
+    if missing:
+        raise SchemaOutOfDate(
+            f"DB 스키마가 최신이 아닙니다. 적용되지 않은 마이그레이션: {', '.join(missing)} "
+            "→ `python db_migrations.py` 를 먼저 실행하세요."
+        )
+    _verified.set()
+
+
+def migrate() -> list:
+    applied_now = []
+    with get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    name VARCHAR(100) PRIMARY KEY,
+                    applied_at DATETIME NOT NULL
+                )
+                """
+            )
+            cursor.execute("SELECT name FROM schema_migrations")
+            applied = {row["name"] for row in cursor.fetchall()}
+
+            for name, statements in MIGRATIONS:
+                if name in applied:
+                    continue
+                print(f"[migrate] {name} 적용 중")
+                for sql in statements:
+                    cursor.execute(sql)
+                cursor.execute(
+                    "INSERT INTO schema_migrations (name, applied_at) VALUES (%s, NOW())",
+                    (name,),
+                )
+                conn.commit()
+                applied_now.append(name)
+
+    return applied_now
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["backfill"]:
+        from job_store import backfill_normalized_columns
+
+        with get_connection() as conn:
+            count = backfill_normalized_columns(conn)
+        print(f"[backfill] 완료: {count}건")
+    else:
+        done = migrate()
+        print(f"[migrate] 적용 완료: {done or '없음'}")
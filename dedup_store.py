@@ -0,0 +1,251 @@
+import sqlite3
+import threading
+import time
+import uuid
+from collections import defaultdict
+
+import insert_data
+from config import DEDUP_INDEX_PATH, DEDUP_PROVISIONAL_TTL_SECONDS, DEDUP_SYNC_ID_MARGIN
+from insert_data import (
+    INDEX_MIN_THRESHOLD,
+    _bigrams,
+    _min_shared_bigrams,
+    _shares_enough_bigrams,
+    _within_length_bound,
+    normalize_company,
+)
+
+# grams.kind: 회사명을 그대로 쓴 키 / normalize_company 를 거친 키
+KIND_RAW = 0
+KIND_NORMALIZED = 1
+
+# 1글자 이하 회사명은 bigram 이 없으므로 이 접두어를 붙여 통째로 저장
+SHORT_KEY_PREFIX = "\x00"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    row_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id INTEGER UNIQUE,
+    company_name TEXT NOT NULL,
+    company_norm TEXT NOT NULL,
+    title TEXT NOT NULL,
+    owner TEXT,
+    added_at REAL
+);
+CREATE TABLE IF NOT EXISTS grams (
+    kind INTEGER NOT NULL,
+    gram TEXT NOT NULL,
+    row_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_grams_kind_gram ON grams (kind, gram);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _index_grams(key: str) -> list[str]:
+    if len(key) < 2:
+        return [SHORT_KEY_PREFIX + key]
+    return list(_bigrams(key))
+
+
+class DedupStore:
+    """
+    모든 크롤러가 함께 쓰는 디스크 기반 중복 체크 인덱스.
+    - 첫 조회 시점에만 파일을 열고, MySQL 에서는 마지막으로 동기화한 job.id 이후 행만 가져온다.
+    - add() 로 넣은 공고는 바로 파일에 기록되어 다른 크롤러/다음 실행에서도 보인다.
+      그래서 MySQL 에 commit 된 공고만 add() 한다 (저장 전 공고로 막으면 재시도 때 중복으로 걸러진다).
+      이 임시 행에는 인스턴스(실행)별 owner 가 붙고, sync() 는 자기 임시 행과
+      DEDUP_PROVISIONAL_TTL_SECONDS 가 지난 임시 행만 지운다 (동시에 도는 다른 크롤러 것은 남긴다).
+    - id 가 commit 순서대로 보이지 않을 수 있어, 마지막 job.id 아래 DEDUP_SYNC_ID_MARGIN 개 구간도 다시 읽는다.
+    insert_data.is_similar_job* 에 JobIndex 대신 그대로 넘길 수 있다.
+    """
+
+    def __init__(self, path: str = DEDUP_INDEX_PATH, normalize=None):
+        if normalize not in (None, normalize_company):
+            raise ValueError("normalize 는 None 또는 insert_data.normalize_company 만 지원합니다.")
+        self.path = path
+        self.normalize = normalize
+        self._kind = KIND_NORMALIZED if normalize else KIND_RAW
+        self.owner = uuid.uuid4().hex
+        self._conn = None
+        self._synced = False
+        self._lock = threading.RLock()
+
+    def _connection(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+            with conn:
+                # owner / added_at 이 없던 예전 인덱스 파일
+                if "owner" not in columns:
+                    conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+                if "added_at" not in columns:
+                    conn.execute("ALTER TABLE jobs ADD COLUMN added_at REAL")
+            self._conn = conn
+        return self._conn
+
+    def _ensure_synced(self):
+        if not self._synced:
+            self.sync()
+
+    def _last_job_id(self, conn) -> int:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'last_job_id'").fetchone()
+        return int(row[0]) if row else 0
+
+    def _insert(self, conn, company_name, title, job_id=None, company_norm=None, owner=None) -> bool:
+        company_name = company_name or ""
+        if company_norm is None:
+            company_norm = normalize_company(company_name)
+        cur = conn.execute(
+            "INSERT OR IGNORE INTO jobs (job_id, company_name, company_norm, title, owner, added_at)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (job_id, company_name, company_norm, title or "", owner, time.time() if owner else None),
+        )
+        if not cur.rowcount:
+            return False
+        row_id = cur.lastrowid
+        conn.executemany(
+            "INSERT INTO grams (kind, gram, row_id) VALUES (?, ?, ?)",
+            [(KIND_RAW, g, row_id) for g in _index_grams(company_name)]
+            + [(KIND_NORMALIZED, g, row_id) for g in _index_grams(company_norm)],
+        )
+        return True
+
+    def sync(self) -> int:
+        """MySQL job 테이블에서 아직 반영하지 않은 행만 가져온다. 추가된 행 수를 돌려준다."""
+        with self._lock:
+            conn = self._connection()
+            last_id = self._last_job_id(conn)
+
+            with conn:
+                # 이 인스턴스가 add() 로 넣은 행과 오래된(끝난 실행의) 임시 행은 이제 MySQL 쪽 행으로 대체된다.
+                # 지금 돌고 있는 다른 크롤러의 임시 행은 아직 저장 전일 수 있으므로 남긴다.
+                stale = """
+                    SELECT row_id FROM jobs
+                    WHERE job_id IS NULL AND (owner = ? OR added_at IS NULL OR added_at < ?)
+                """
+                params = (self.owner, time.time() - DEDUP_PROVISIONAL_TTL_SECONDS)
+                conn.execute(f"DELETE FROM grams WHERE row_id IN ({stale})", params)
+                conn.execute(f"DELETE FROM jobs WHERE row_id IN ({stale})", params)
+
+            # 서버 사이드 커서로 배치 단위로 받아 바로 기록 (중간에 끊겨도 다음 sync 가 이어서 진행).
+            # 이미 반영한 job_id 는 UNIQUE 키로 INSERT OR IGNORE 되므로 여유 구간을 다시 읽어도 중복되지 않는다.
+            added = 0
+            since_id = max(0, last_id - DEDUP_SYNC_ID_MARGIN)
+            for batch in insert_data.iter_existing_job_batches(since_id=since_id):
+                with conn:
+                    for job in batch:
+                        added += self._insert(
+                            conn, job.company_name, job.title, job_id=job.id, company_norm=job.company_norm
+                        )
+                    conn.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_job_id', ?)",
+                        (str(max(last_id, batch[-1].id)),),
+                    )
+
+            self._synced = True
+            return added
+
+    def rebuild(self) -> int:
+        """인덱스를 비우고 job 테이블 전체에서 다시 만든다."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM grams")
+                conn.execute("DELETE FROM jobs")
+                conn.execute("DELETE FROM meta")
+            return self.sync()
+
+    def add(self, job):
+        """방금 저장한 공고를 인덱스에 반영한다 (다음 sync 때 MySQL 행으로 교체됨)."""
+        with self._lock:
+            self._ensure_synced()
+            conn = self._connection()
+            with conn:
+                self._insert(conn, job.get("company_name", ""), job.get("title", ""), owner=self.owner)
+
+    def __len__(self):
+        with self._lock:
+            self._ensure_synced()
+            return self._connection().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def __iter__(self):
+        with self._lock:
+            self._ensure_synced()
+            rows = self._connection().execute(
+                "SELECT company_name, title FROM jobs ORDER BY row_id"
+            ).fetchall()
+        for company_name, title in rows:
+            yield {"company_name": company_name, "title": title}
+
+    def candidates(self, title: str, company_key: str, threshold: float):
+        """insert_data.JobIndex.candidates 와 같은 규칙으로 (title, company_key) 후보를 돌려준다."""
+        key_column = "company_norm" if self.normalize else "company_name"
+
+        with self._lock:
+            self._ensure_synced()
+            conn = self._connection()
+
+            if threshold <= INDEX_MIN_THRESHOLD:
+                rows = conn.execute(
+                    f"SELECT title, {key_column} FROM jobs ORDER BY row_id"
+                ).fetchall()
+            else:
+                query_grams = (
+                    {SHORT_KEY_PREFIX + company_key: 1}
+                    if len(company_key) < 2
+                    else _bigrams(company_key)
+                )
+                placeholders = ",".join(["?"] * len(query_grams))
+                scores = defaultdict(int)
+                for gram, row_id in conn.execute(
+                    f"SELECT gram, row_id FROM grams WHERE kind = ? AND gram IN ({placeholders})",
+                    (self._kind, *query_grams),
+                ):
+                    scores[row_id] += query_grams[gram]
+                if not scores:
+                    return
+
+                rows = []
+                ids = list(scores)
+                for start in range(0, len(ids), 500):
+                    chunk = ids[start:start + 500]
+                    rows.extend(
+                        conn.execute(
+                            f"SELECT row_id, title, {key_column} FROM jobs "
+                            f"WHERE row_id IN ({','.join(['?'] * len(chunk))})",
+                            chunk,
+                        ).fetchall()
+                    )
+                rows.sort()
+                rows = [
+                    (old_title, old_key)
+                    for row_id, old_title, old_key in rows
+                    if len(company_key) < 2
+                    or scores[row_id] >= _min_shared_bigrams(len(company_key) + len(old_key), threshold)
+                ]
+
+        title_grams = _bigrams(title)
+        for old_title, old_key in rows:
+            if not (
+                _within_length_bound(title, old_title, threshold)
+                and _within_length_bound(company_key, old_key, threshold)
+            ):
+                continue
+            if threshold > INDEX_MIN_THRESHOLD and not _shares_enough_bigrams(
+                title, title_grams, old_title, threshold
+            ):
+                continue
+            yield old_title, old_key
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,60 @@
+from collections import defaultdict
+
+from keyword_matcher import KeywordMatcher
+
+
+def build_keyword_digests(jobs: list, keywords) -> dict:
+    """
+    새 공고 목록을 한 번만 훑어서 키워드별 매칭 공고 목록을 만든다.
+    (구독자마다 job 테이블을 LIKE 로 스캔하던 방식 대체)
+    """
+    matcher = KeywordMatcher(keywords)
+    jobs_by_keyword = defaultdict(list)
+    for job in jobs:
+        matched = (
+            matcher.find(job["title"])
+            | matcher.find(job["detail"])
+            | matcher.find(job["company_name"])
+        )
+        for keyword in matched:
+            jobs_by_keyword[keyword].append(job)
+    return jobs_by_keyword
+
+
+def build_digest_messages(jobs: list, users: list, since) -> tuple:
+    """
+    구독자(id, email, keyword, last_notified_job_id)별 다이제스트 메일 (수신자, 제목, 본문) 목록을 만든다.
+    같은 키워드/워터마크를 가진 구독자는 본문을 한 번만 만든다. (메일 목록, 키워드 수) 를 돌려준다.
+    """
+    subscribers = defaultdict(list)
+    for user in users:
+        subscribers[(user["keyword"], user["last_notified_job_id"])].append(user["email"])
+
+    jobs_by_keyword = build_keyword_digests(jobs, {keyword for keyword, _ in subscribers})
+    messages = []
+
+    for (keyword, last_id), emails in subscribers.items():
+        if last_id is None:
+            keyword_jobs = [j for j in jobs_by_keyword.get(keyword, ()) if j["created_at"] >= since]
+        else:
+            keyword_jobs = [j for j in jobs_by_keyword.get(keyword, ()) if j["id"] > last_id]
+        if not keyword_jobs:
+            continue
+
+        lines = [
+            f"[{keyword}] 키워드에 대한 새 공고 목록입니다.",
+            "",
+        ]
+        for job in keyword_jobs:
+            lines.append(
+                f"- {job['company_name']} / {job['title']} / 등록일: {job['created_at']}"
+            )
+            if job.get("detail"):
+                lines.append(f"  상세: {job['detail']}")
+            lines.append("")
+
+        body = "\n".join(lines)
+        subject = f"[취업 알림] '{keyword}' 관련 새 공고 {len(keyword_jobs)}건 안내"
+        messages.extend((email, subject, body) for email in emails)
+
+    return messages, len({keyword for keyword, _ in subscribers})
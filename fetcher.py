@@ -0,0 +1,115 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from config import (
+    FETCH_BURST_PER_HOST,
+    FETCH_MAX_IN_FLIGHT_PER_HOST,
+    FETCH_RATE_PER_HOST,
+)
+
+
+class TokenBucket:
+    """초당 rate 개씩 채워지고 최대 capacity 개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+
+        # 토큰을 미리 예약(음수 허용)하고 차례가 올 때까지 잔다.
+        # 먼저 요청한 쪽이 먼저 받으므로 파이프라인이 기다리는 앞 페이지가 뒤 페이지에 밀리지 않는다.
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+
+class HostLimiter:
+    """호스트 하나에 대한 동시 요청 수 제한 + 토큰 버킷 속도 제한"""
+
+    def __init__(self, max_in_flight: int, rate: float, burst: int):
+        self.max_in_flight = max(1, max_in_flight)
+        self._slots = threading.BoundedSemaphore(self.max_in_flight)
+        self._bucket = TokenBucket(rate, burst)
+
+    def __enter__(self):
+        self._slots.acquire()
+        self._bucket.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self._slots.release()
+        return False
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str) -> HostLimiter:
+    """같은 호스트를 치는 크롤러끼리는 제한을 함께 쓴다 (예: 자소설닷컴 크롤러 두 개)"""
+    with _limiters_lock:
+        limiter = _limiters.get(host)
+        if limiter is None:
+            limiter = HostLimiter(
+                FETCH_MAX_IN_FLIGHT_PER_HOST, FETCH_RATE_PER_HOST, FETCH_BURST_PER_HOST
+            )
+            _limiters[host] = limiter
+        return limiter
+
+
+def fetch_pages(fetch, pages, host: str, ramp_up: bool = False):
+    """
+    fetch(page) 를 호스트 제한 안에서 여러 개 동시에 실행하고 (page, 결과) 를 페이지 순서대로 돌려준다.
+    앞쪽 페이지를 처리하는 동안 뒤 페이지 몇 개를 미리 받아 두며,
+    호출한 쪽이 빈 페이지 등에서 반복을 멈추면 아직 시작하지 않은 요청은 취소한다.
+    ramp_up=True 면 한 페이지부터 시작해 페이지를 넘길 때마다 미리 받는 수를 늘린다
+    (증분 크롤링처럼 첫 페이지에서 끝날 가능성이 큰 경우 불필요한 요청을 줄임).
+    """
+    limiter = get_host_limiter(host)
+    max_window = limiter.max_in_flight
+    window = 1 if ramp_up else max_window
+    pages = iter(pages)
+
+    def limited_fetch(page):
+        with limiter:
+            return fetch(page)
+
+    executor = ThreadPoolExecutor(max_workers=max_window, thread_name_prefix=f"fetch-{host}")
+    pending = []
+
+    def top_up():
+        while len(pending) < window:
+            page = next(pages, None)
+            if page is None:
+                return
+            pending.append((page, executor.submit(limited_fetch, page)))
+
+    try:
+        top_up()
+        while pending:
+            page, future = pending.pop(0)
+            result = future.result()
+            # 이 페이지를 처리하는 동안 다음 페이지들을 받도록 먼저 채워 둔다
+            top_up()
+
+            yield page, result
+
+            if ramp_up and window < max_window:
+                window += 1
+                top_up()
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
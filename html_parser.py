@@ -0,0 +1,164 @@
+"""
+목록 페이지 파싱용 HTML 파서 백엔드.
+selectolax(lexbor) → lxml → BeautifulSoup 순으로 설치된 것을 쓰고, HTML_PARSER_BACKEND 로 고정할 수 있다.
+크롤러는 backend 종류와 상관없이 아래 함수만 쓴다.
+
+    root = parse_listing(html, "#recruit_info_list", strainer={"id": "recruit_info_list"})
+    for a in select(root, "div.area_job > h2 > a"):
+        text(a), attr(a, "href")
+"""
+from functools import lru_cache
+
+from config import HTML_PARSER_BACKEND
+
+
+class _SelectolaxBackend:
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser = LexborHTMLParser
+
+    def parse(self, html, strainer=None):
+        return self._parser(html)
+
+    def select(self, node, css):
+        # lexbor 는 선택자를 내부에서 컴파일해 두고 재사용한다
+        return node.css(css)
+
+    def select_one(self, node, css):
+        return node.css_first(css)
+
+    def text(self, node):
+        return node.text(deep=True, strip=True)
+
+    def attr(self, node, name, default=None):
+        value = node.attributes.get(name)
+        return default if value is None else value
+
+
+class _LxmlBackend:
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+        from lxml import etree
+        from lxml.cssselect import CSSSelector
+
+        self._fromstring = lxml.html.fromstring
+        # itertext() 와 달리 주석 내용은 빼고 텍스트 노드만 모은다
+        self._texts = etree.XPath(".//text()")
+        # CSS → XPath 변환은 비싸므로 선택자마다 한 번만 컴파일
+        self._compile = lru_cache(maxsize=None)(CSSSelector)
+
+    def parse(self, html, strainer=None):
+        return self._fromstring(html)
+
+    def select(self, node, css):
+        return self._compile(css)(node)
+
+    def select_one(self, node, css):
+        found = self.select(node, css)
+        return found[0] if found else None
+
+    def text(self, node):
+        return "".join(part.strip() for part in self._texts(node))
+
+    def attr(self, node, name, default=None):
+        return node.get(name, default)
+
+
+class _SoupBackend:
+    name = "bs4"
+
+    def __init__(self):
+        import soupsieve
+        from bs4 import BeautifulSoup, SoupStrainer
+
+        self._soup = BeautifulSoup
+        self._strainer = SoupStrainer
+        self._compile = lru_cache(maxsize=None)(soupsieve.compile)
+        try:
+            import lxml  # noqa: F401
+            self._features = "lxml"
+        except ImportError:
+            self._features = "html.parser"
+
+    def parse(self, html, strainer=None):
+        # 순수 파이썬 파서는 트리 생성 비용이 크므로 목록 영역만 만든다
+        parse_only = self._strainer(**strainer) if strainer else None
+        return self._soup(html, self._features, parse_only=parse_only)
+
+    def select(self, node, css):
+        return self._compile(css).select(node)
+
+    def select_one(self, node, css):
+        return self._compile(css).select_one(node)
+
+    def text(self, node):
+        return node.get_text(strip=True)
+
+    def attr(self, node, name, default=None):
+        return node.get(name, default)
+
+
+_BACKENDS = {
+    "selectolax": _SelectolaxBackend,
+    "lxml": _LxmlBackend,
+    "bs4": _SoupBackend,
+}
+
+
+def _load_backend():
+    if HTML_PARSER_BACKEND != "auto" and HTML_PARSER_BACKEND not in _BACKENDS:
+        raise ValueError(
+            f"HTML_PARSER_BACKEND={HTML_PARSER_BACKEND!r} 는 지원하지 않습니다. "
+            f"사용 가능한 값: auto, {', '.join(_BACKENDS)}"
+        )
+    names = list(_BACKENDS) if HTML_PARSER_BACKEND == "auto" else [HTML_PARSER_BACKEND]
+    for name in names:
+        try:
+            return _BACKENDS[name]()
+        except ImportError:
+            continue
+    raise ImportError(f"사용할 수 있는 HTML 파서가 없습니다: {names}")
+
+
+backend = _load_backend()
+
+
+def parse(html: str):
+    return backend.parse(html)
+
+
+def parse_listing(html: str, container: str, strainer: dict = None):
+    """
+    목록 영역(container 선택자)만 돌려준다. 없으면 None.
+    bs4 백엔드는 strainer(SoupStrainer 인자)에 맞는 부분만 파싱하므로, strainer 는 id 처럼
+    container 하나만 가리키는 조건이어야 한다. 맞는 요소가 여러 개면 전체를 파싱해 container 로 고른다.
+    """
+    root = backend.parse(html, strainer)
+    if strainer and backend.name == "bs4":
+        matched = [node for node in root.contents if getattr(node, "name", None)]
+        if len(matched) <= 1:
+            return matched[0] if matched else None
+        root = backend.parse(html)
+    return backend.select_one(root, container)
+
+
+def select(node, css: str) -> list:
+    return backend.select(node, css)
+
+
+def select_one(node, css: str):
+    return backend.select_one(node, css)
+
+
+def text(node) -> str:
+    """BeautifulSoup get_text(strip=True) 와 같은 규칙: 텍스트 조각마다 양끝 공백을 지우고 붙인다."""
+    return backend.text(node)
+
+
+def attr(node, name: str, default=None):
+    return backend.attr(node, name, default)
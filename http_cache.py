@@ -0,0 +1,105 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+import requests
+
+import http_client
+from config import HTTP_CACHE_PATH
+
+# 서버가 304 를 주거나 본문 해시가 지난번과 같을 때 fetch 결과 대신 돌려주는 값
+NOT_MODIFIED = object()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    content_hash TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    etag: str = None
+    last_modified: str = None
+    content_hash: str = ""
+
+
+class ResponseCache:
+    """URL 별 ETag / Last-Modified / 본문 해시를 저장하는 로컬 SQLite 캐시"""
+
+    def __init__(self, path: str = HTTP_CACHE_PATH):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def lookup(self, url: str):
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT etag, last_modified, content_hash FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if not row:
+            return None
+        return CacheEntry(url, *row)
+
+    def store(self, entry: CacheEntry):
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (url, etag, last_modified, content_hash, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (entry.url, entry.etag, entry.last_modified, entry.content_hash, time.time()),
+                )
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def conditional_get(cache: ResponseCache, url: str, params=None, headers=None, **kwargs):
+    """
+    저장된 검증자(ETag/Last-Modified)로 조건부 요청을 보낸다.
+    (NOT_MODIFIED 또는 response, 새 CacheEntry) 를 돌려주며,
+    CacheEntry 는 호출한 쪽이 페이지 처리를 끝낸 뒤 cache.store() 로 반영한다.
+    """
+    key = requests.Request("GET", url, params=params).prepare().url
+    cached = cache.lookup(key)
+
+    request_headers = dict(headers or {})
+    if cached and cached.etag:
+        request_headers["If-None-Match"] = cached.etag
+    if cached and cached.last_modified:
+        request_headers["If-Modified-Since"] = cached.last_modified
+
+    res = http_client.get(url, params=params, headers=request_headers, **kwargs)
+    if res.status_code == 304 and cached:
+        return NOT_MODIFIED, None
+    res.raise_for_status()
+
+    entry = CacheEntry(
+        url=key,
+        etag=res.headers.get("ETag"),
+        last_modified=res.headers.get("Last-Modified"),
+        content_hash=hashlib.sha256(res.content).hexdigest(),
+    )
+    if cached and cached.content_hash == entry.content_hash:
+        return NOT_MODIFIED, entry
+    return res, entry
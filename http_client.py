@@ -0,0 +1,93 @@
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import http_fixtures
+
+from config import (
+    HTTP_BACKOFF_FACTOR,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRIES,
+    HTTP_TIMEOUT,
+)
+
+
+def _accept_encoding() -> str:
+    # urllib3 는 brotli 패키지가 있을 때만 br 응답을 풀 수 있다
+    try:
+        import brotli  # noqa: F401
+    except ImportError:
+        try:
+            import brotlicffi  # noqa: F401
+        except ImportError:
+            return "gzip, deflate"
+    return "gzip, deflate, br"
+
+
+# 크롤러들이 각자 들고 있던 headers dict 를 대신하는 공통 헤더
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/142.0.0.0 Safari/537.36"
+    ),
+    "Accept-Encoding": _accept_encoding(),
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+    "Connection": "keep-alive",
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_MAXSIZE,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """프로세스 전체에서 하나만 쓰는 keep-alive 세션 (호스트별 커넥션 재사용)"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """requests.get 대신 사용. headers 를 넘기면 공통 헤더 위에 덮어쓴다."""
+    kwargs.setdefault("timeout", HTTP_TIMEOUT)
+    if http_fixtures.mode == "replay":
+        return http_fixtures.get_store().load(url, kwargs.get("params"))
+
+    res = get_session().get(url, **kwargs)
+    if http_fixtures.mode == "record" and res.status_code == 200:
+        http_fixtures.get_store().save(url, kwargs.get("params"), res)
+    return res
+
+
+def close_session():
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
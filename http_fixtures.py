@@ -0,0 +1,90 @@
+"""
+HTTP 응답 녹화/재생.
+record 모드에서는 http_client.get 으로 받은 응답을 HTTP_FIXTURE_DIR 에 저장하고,
+replay 모드에서는 네트워크 대신 저장된 응답을 돌려준다 (bench_crawlers.py 에서 사용).
+파일 이름은 URL + 쿼리 파라미터의 해시이고, 같은 이름의 .json(메타)/.body(본문) 두 개로 저장한다.
+"""
+import hashlib
+import json
+import os
+import threading
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import HTTP_FIXTURE_DIR, HTTP_FIXTURE_MODE
+
+# 재생 시 돌려줄 응답 헤더 (캐시 검증자/본문 형식만 있으면 된다)
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+mode = HTTP_FIXTURE_MODE
+
+
+class FixtureMissing(LookupError):
+    pass
+
+
+def set_mode(new_mode: str):
+    global mode
+    if new_mode not in ("off", "record", "replay"):
+        raise ValueError(f"알 수 없는 HTTP_FIXTURE_MODE: {new_mode}")
+    mode = new_mode
+
+
+def fixture_key(url: str, params=None) -> str:
+    raw = json.dumps([url, params or {}], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]
+
+
+class FixtureStore:
+    def __init__(self, path: str = HTTP_FIXTURE_DIR):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _paths(self, url, params):
+        base = os.path.join(self.path, fixture_key(url, params))
+        return base + ".json", base + ".body"
+
+    def save(self, url: str, params, res: requests.Response):
+        meta_path, body_path = self._paths(url, params)
+        meta = {
+            "url": url,
+            "params": params,
+            "status": res.status_code,
+            "encoding": res.encoding,
+            "headers": {k: res.headers[k] for k in _KEPT_HEADERS if k in res.headers},
+        }
+        with self._lock:
+            os.makedirs(self.path, exist_ok=True)
+            with open(body_path, "wb") as f:
+                f.write(res.content)
+            with open(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2, default=str)
+
+    def load(self, url: str, params=None) -> requests.Response:
+        meta_path, body_path = self._paths(url, params)
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except FileNotFoundError:
+            raise FixtureMissing(f"녹화된 응답 없음: {url} {params or ''}")
+
+        res = requests.Response()
+        res.status_code = meta["status"]
+        res.url = url
+        res.encoding = meta["encoding"]
+        res.headers = CaseInsensitiveDict(meta["headers"])
+        res._content = body
+        return res
+
+
+_store = None
+
+
+def get_store() -> FixtureStore:
+    global _store
+    if _store is None:
+        _store = FixtureStore()
+    return _store
@@ -1,8 +1,15 @@
 # similarity_utils.py
 
 
+from collections import defaultdict
+import hashlib
+import math
 from difflib import SequenceMatcher
-import os, pymysql
+from typing import NamedTuple
+import pymysql
+
+import metrics
+from db import get_connection
 
 # 크롤링 페이지 함수 중 get_existing_jobs 변경
 # def get_existing_jobs():
@@ -20,25 +27,52 @@ from dotenv import load_dotenv
 load_dotenv()
 
 def get_db_connection():
-    return pymysql.connect(
-        host=os.getenv("DB_HOST"),
-        port=int(os.getenv("DB_PORT")),
-        user=os.getenv("DB_USER"),
-        password=os.getenv("DB_PASSWORD"),
-        db=os.getenv("DB_NAME"),
-        charset="utf8mb4",
-        cursorclass=pymysql.cursors.DictCursor,
-    )
+    # db.py 의 프로세스 공용 커넥션 풀에서 빌린다 (close() 하면 풀로 반환)
+    return get_connection()
+
+class ExistingJob(NamedTuple):
+    """중복 체크에 필요한 컬럼만 담는 tuple 기반 레코드 (행마다 dict 를 만들지 않음)."""
+    id: int
+    company_name: str
+    title: str
+    # 저장 시점에 계산해 둔 normalize_company 값 (백필 전 행은 None)
+    company_norm: str = None
+
+
+EXISTING_JOBS_BATCH_SIZE = 2000
+
+
+def iter_existing_job_batches(since_id: int = 0, batch_size: int = EXISTING_JOBS_BATCH_SIZE):
+    """
+    서버 사이드 커서(SSCursor)로 job 테이블을 id 순으로 읽어 batch_size 개씩 돌려준다.
+    전체 결과를 클라이언트에 올리지 않으므로 테이블이 커져도 메모리 사용량이 일정하다.
+    """
+    conn = get_db_connection()
+    try:
+        with conn.cursor(pymysql.cursors.SSCursor) as cursor:
+            cursor.execute(
+                "SELECT id, company_name, title, company_norm FROM job WHERE id > %s ORDER BY id",
+                (since_id,),
+            )
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [ExistingJob(*row) for row in rows]
+    finally:
+        conn.close()
+
 
 def get_existing_jobs():
-     conn = get_db_connection()
-     try:
-         with conn.cursor() as cursor:
-             cursor.execute("SELECT company_name, title FROM job")
-             rows = cursor.fetchall()
-             return rows
-     finally:
-         conn.close()
+    """
+    기존 호출부 호환용: 모든 공고의 company_name, title 을 dict 리스트로 돌려준다.
+    새 코드는 전체를 메모리에 올리지 않도록 iter_existing_job_batches 를 쓴다.
+    """
+    return [
+        {"company_name": job.company_name, "title": job.title}
+        for batch in iter_existing_job_batches()
+        for job in batch
+    ]
 
 def normalize_company(name : str) -> str:
     if not name:
@@ -49,49 +83,223 @@ def normalize_company(name : str) -> str:
     n = n.replace("㈜", "")
     return n
 
+def normalize_title(title: str) -> str:
+    if not title:
+        return ""
+    return " ".join(title.lower().split())
+
+def job_fingerprint(company_name: str, title: str) -> bytes:
+    """정규화한 (회사명, 제목) 의 sha256. 표기만 다른 같은 공고는 같은 값이 된다."""
+    key = normalize_company(company_name) + "\x1f" + normalize_title(title)
+    return hashlib.sha256(key.encode("utf-8")).digest()
+
 def similarity(a, b):
     return SequenceMatcher(None, a or "", b or "").ratio()
 
-def is_similar_job_normalize_company(new_job, existing_jobs, threshold=0.85):
-    new_title = new_job.get("title", "") or ""
-    new_company = normalize_company(new_job.get("company_name", ""))
+
+# 후보 인덱스가 손실 없이 동작하는 최소 임계값.
+# ratio >= 0.8 을 넘으려면 두 문자열이 적어도 한 개의 2글자(bigram)를 공유해야 한다.
+INDEX_MIN_THRESHOLD = 0.8
+
+
+def _bigrams(text: str) -> dict:
+    grams = defaultdict(int)
+    for i in range(len(text) - 1):
+        grams[text[i:i + 2]] += 1
+    return grams
+
+
+def _min_shared_bigrams(total_len: int, threshold: float) -> int:
+    """
+    SequenceMatcher ratio 가 threshold 이상일 때 새 문자열 쪽에서 반드시 공유되는 bigram 위치 수 하한.
+      matched M, 블록 수 k, 비매칭 U = L - 2M  →  공유 위치 >= M - k >= L * (1.5t - 1) - 1
+    """
+    return max(1, math.ceil(total_len * (1.5 * threshold - 1) - 1 - 1e-9))
+
+
+def _within_length_bound(a: str, b: str, threshold: float) -> bool:
+    # real_quick_ratio 와 같은 길이 상한
+    return 2 * min(len(a), len(b)) >= threshold * (len(a) + len(b))
+
+
+def _shares_enough_bigrams(query: str, query_grams: dict, other: str, threshold: float) -> bool:
+    """
+    query 와 other 의 ratio 가 threshold(> 0.8) 이상이 될 수 있을 만큼 bigram 을 공유하는지.
+    회사명 후보를 고를 때와 같은 _min_shared_bigrams 하한이라 걸러지는 쌍은 어차피 ratio 미달이다.
+    """
+    if len(query) < 2 or len(other) < 2:
+        # 한쪽이라도 bigram 이 없으면 완전히 같아야만 ratio 가 0.8 을 넘는다
+        return query == other
+    other_grams = _bigrams(other)
+    shared = sum(count for gram, count in query_grams.items() if gram in other_grams)
+    return shared >= _min_shared_bigrams(len(query) + len(other), threshold)
+
+
+def _ratio_at_least(a: str, b: str, threshold: float):
+    """similarity(a, b) 가 threshold 이상이면 그 값, 아니면 None. 싼 상한부터 확인하고 ratio() 는 마지막에 계산한다."""
+    matcher = SequenceMatcher(None, a or "", b or "")
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return None
+    ratio = matcher.ratio()
+    return ratio if ratio >= threshold else None
+
+
+class JobIndex:
+    """
+    기존 공고 (company_name, title) 에 대한 후보 인덱스.
+    회사명 bigram 으로 블로킹하고, 길이와 회사명·제목 각각의 공유 bigram 수로 거른 뒤에만 SequenceMatcher 를 돌린다.
+    threshold > 0.8 에서는 선형 스캔과 결과가 같다.
+    """
+
+    def __init__(self, jobs=(), normalize=None):
+        self.normalize = normalize
+        self._titles = []
+        self._companies = []
+        self._keys = []
+        self._grams = defaultdict(list)
+        self._short = defaultdict(list)
+        for job in jobs:
+            self.add(job)
+
+    def _key(self, company, company_norm=None):
+        if self.normalize:
+            # DB 에 저장된 정규화 값이 있으면 다시 계산하지 않는다
+            if company_norm is not None and self.normalize is normalize_company:
+                return company_norm
+            return self.normalize(company)
+        return company or ""
+
+    def add(self, job):
+        if isinstance(job, ExistingJob):
+            company, title = job.company_name or "", job.title or ""
+            company_norm = job.company_norm
+        else:
+            company, title = job.get("company_name", "") or "", job.get("title", "") or ""
+            company_norm = job.get("company_norm")
+        key = self._key(company, company_norm)
+        row = len(self._keys)
+
+        self._titles.append(title)
+        self._companies.append(company)
+        self._keys.append(key)
+
+        if len(key) < 2:
+            self._short[key].append(row)
+        else:
+            for gram in _bigrams(key):
+                self._grams[gram].append(row)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        for title, company in zip(self._titles, self._companies):
+            yield {"company_name": company, "title": title}
+
+    def candidates(self, title: str, company_key: str, threshold: float):
+        """(title, company_key) 후보를 기존 입력 순서대로 돌려준다."""
+        if threshold <= INDEX_MIN_THRESHOLD:
+            yield from zip(self._titles, self._keys)
+            return
+
+        if len(company_key) < 2:
+            # 1글자 이하끼리는 완전히 같아야만 ratio 가 0.8 을 넘는다
+            rows = self._short.get(company_key, [])
+        else:
+            scores = defaultdict(int)
+            for gram, count in _bigrams(company_key).items():
+                for row in self._grams.get(gram, ()):
+                    scores[row] += count
+            # 하한은 두 길이에만 달려 있으므로 후보 회사명 길이별로 한 번만 계산한다
+            bounds = {}
+            rows = []
+            for row, shared in scores.items():
+                length = len(self._keys[row])
+                bound = bounds.get(length)
+                if bound is None:
+                    bound = bounds[length] = _min_shared_bigrams(len(company_key) + length, threshold)
+                if shared >= bound:
+                    rows.append(row)
+            rows.sort()
+
+        # 두 ratio 가 모두 threshold 이상이어야 하므로 제목에도 같은 공유 bigram 하한을 적용한다
+        title_grams = _bigrams(title)
+        for row in rows:
+            old_title = self._titles[row]
+            old_key = self._keys[row]
+            if (
+                _within_length_bound(title, old_title, threshold)
+                and _within_length_bound(company_key, old_key, threshold)
+                and _shares_enough_bigrams(title, title_grams, old_title, threshold)
+            ):
+                yield old_title, old_key
+
+
+def _iter_candidates(existing_jobs, new_title, new_company, normalize, threshold):
+    # JobIndex / dedup_store.DedupStore 처럼 candidates() 를 가진 인덱스면 후보만 본다
+    if hasattr(existing_jobs, "candidates") and existing_jobs.normalize is normalize:
+        yield from existing_jobs.candidates(new_title, new_company, threshold)
+        return
 
     for old in existing_jobs:
         old_title = old.get("title", "") or ""
-        old_company = normalize_company(old.get("company_name", ""))
+        if normalize:
+            old_company = normalize(old.get("company_name", ""))
+        else:
+            old_company = old.get("company_name", "") or ""
+        yield old_title, old_company
 
-        title_ratio = similarity(new_title, old_title)
-        company_ratio = similarity(new_company, old_company)
+
+def is_similar_job_normalize_company(new_job, existing_jobs, threshold=0.85, source="unknown"):
+    new_title = new_job.get("title", "") or ""
+    new_company = normalize_company(new_job.get("company_name", ""))
+
+    compared = 0
+    for old_title, old_company in _iter_candidates(
+        existing_jobs, new_title, new_company, normalize_company, threshold
+    ):
+        compared += 1
+        title_ratio = _ratio_at_least(new_title, old_title, threshold)
+        if title_ratio is None:
+            continue
+        company_ratio = _ratio_at_least(new_company, old_company, threshold)
 
         # 둘 다 기준 이상이면 같은 공고로 판단
-        if title_ratio >= threshold and company_ratio >= threshold:
+        if company_ratio is not None:
             print(f"[중복] {new_company}/{new_title} == {old_company}/{old_title}")
             print(
                 f" (title={title_ratio:.3f}, company={company_ratio:.3f})"
             )
+            metrics.inc("dedup_comparisons", compared, source=source)
             return True
 
+    metrics.inc("dedup_comparisons", compared, source=source)
     return False
 
-def is_similar_job(new_job, existing_jobs, threshold=0.85):
+def is_similar_job(new_job, existing_jobs, threshold=0.85, source="unknown"):
     new_title = new_job["title"] or ""
     new_company = new_job["company_name"] or ""
 
-    for old in existing_jobs:
-        old_title = old["title"] or ""
-        old_company = old["company_name"] or ""
-
-        title_ratio = similarity(new_title, old_title)
-        company_ratio = similarity(new_company, old_company)
+    compared = 0
+    for old_title, old_company in _iter_candidates(
+        existing_jobs, new_title, new_company, None, threshold
+    ):
+        compared += 1
+        title_ratio = _ratio_at_least(new_title, old_title, threshold)
+        if title_ratio is None:
+            continue
+        company_ratio = _ratio_at_least(new_company, old_company, threshold)
 
-        if title_ratio >= threshold and company_ratio >= threshold:
+        if company_ratio is not None:
             print(
                 f"[매칭됨] '{new_company} / {new_title}'  <--->  "
                 f"'{old_company} / {old_title}' "
                 f"(title={title_ratio:.3f}, company={company_ratio:.3f})"
             )
+            metrics.inc("dedup_comparisons", compared, source=source)
             return True
 
+    metrics.inc("dedup_comparisons", compared, source=source)
     return False
 
 # 쓰는 방법 3) 유사도 기준으로 중복 여부 확인
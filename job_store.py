@@ -0,0 +1,115 @@
+import threading
+
+import metrics
+from config import BULK_INSERT_BATCH_SIZE
+from insert_data import job_fingerprint, normalize_company
+
+# detail 유니크 키(db_migrations 001)에 걸리면 아무것도 바꾸지 않는다.
+# INSERT IGNORE 와 달리 날짜 형식 오류 같은 다른 에러는 그대로 올라온다.
+INSERT_JOB_SQL = """
+    INSERT INTO job (company_name, title, start_time, end_time, detail, company_norm, fingerprint)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE id = id
+"""
+
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def ingest_generation() -> int:
+    """새 공고가 저장될 때마다 1씩 늘어나는 값 (검색 캐시 무효화용)"""
+    return _generation
+
+
+def bump_ingest_generation() -> int:
+    global _generation
+    with _generation_lock:
+        _generation += 1
+        return _generation
+
+
+def insert_jobs_bulk(conn, jobs: list, batch_size: int = BULK_INSERT_BATCH_SIZE) -> int:
+    """
+    공고 목록을 여러 행 INSERT 로 나눠 넣고 배치마다 한 번만 commit 한다.
+    이미 있는 detail 은 DB 가 걸러내며, 실제로 새로 들어간 행 수를 돌려준다.
+    """
+    inserted = 0
+    with conn.cursor() as cursor:
+        for start in range(0, len(jobs), batch_size):
+            batch = jobs[start:start + batch_size]
+            # pymysql executemany 는 INSERT ... VALUES 를 multi-row INSERT 하나로 합쳐 보낸다
+            with metrics.timer("db_insert_batch"):
+                batch_inserted = cursor.executemany(
+                    INSERT_JOB_SQL,
+                    [
+                        (
+                            job["company_name"],
+                            job["title"],
+                            job.get("start_time"),
+                            job.get("end_time"),
+                            job["detail"],
+                            normalize_company(job["company_name"]),
+                            job_fingerprint(job["company_name"], job["title"]),
+                        )
+                        for job in batch
+                    ],
+                )
+                conn.commit()
+            inserted += batch_inserted
+            metrics.inc("db_rows_inserted", batch_inserted)
+    if inserted:
+        bump_ingest_generation()
+    return inserted
+
+
+def find_existing_fingerprints(conn, jobs: list) -> set:
+    """
+    jobs 중 정규화한 (회사명, 제목) 이 이미 DB 에 있는 공고의 fingerprint 집합.
+    ix_job_fingerprint 로 찾으므로 유사도 비교(SequenceMatcher) 전에 완전 일치 중복을 싸게 거를 수 있다.
+    """
+    fingerprints = list({job_fingerprint(job["company_name"], job["title"]) for job in jobs})
+    if not fingerprints:
+        return set()
+    with conn.cursor() as cursor:
+        placeholders = ",".join(["%s"] * len(fingerprints))
+        cursor.execute(f"SELECT fingerprint FROM job WHERE fingerprint IN ({placeholders})", fingerprints)
+        return {bytes(row["fingerprint"]) for row in cursor.fetchall()}
+
+
+def backfill_normalized_columns(conn, batch_size: int = BULK_INSERT_BATCH_SIZE) -> int:
+    """
+    company_norm / fingerprint 가 비어 있는 기존 행을 채운다 (db_migrations 007 이후 한 번 실행).
+    id 순으로 batch_size 개씩 처리하고 배치마다 commit 하므로 중간에 멈춰도 이어서 실행할 수 있다.
+    """
+    updated = 0
+    last_id = 0
+    with conn.cursor() as cursor:
+        while True:
+            cursor.execute(
+                """
+                SELECT id, company_name, title FROM job
+                WHERE id > %s AND fingerprint IS NULL
+                ORDER BY id
+                LIMIT %s
+                """,
+                (last_id, batch_size),
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            cursor.executemany(
+                "UPDATE job SET company_norm = %s, fingerprint = %s WHERE id = %s",
+                [
+                    (
+                        normalize_company(row["company_name"]),
+                        job_fingerprint(row["company_name"], row["title"]),
+                        row["id"],
+                    )
+                    for row in rows
+                ],
+            )
+            conn.commit()
+            updated += len(rows)
+            last_id = rows[-1]["id"]
+            print(f"[backfill] {updated}건 처리 (id <= {last_id})")
+    return updated
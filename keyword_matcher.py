@@ -0,0 +1,60 @@
+from collections import deque
+
+
+class KeywordMatcher:
+    """
+    여러 키워드를 한 번에 찾는 Aho-Corasick 매처.
+    텍스트 길이에 비례하는 한 번의 스캔으로 포함된 키워드를 모두 찾는다.
+    MySQL LIKE '%kw%' (ci collation) 처럼 대소문자는 구분하지 않는다.
+    """
+
+    def __init__(self, keywords):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [set()]
+
+        for keyword in keywords:
+            if keyword:
+                self._add(keyword)
+        self._build()
+
+    def _add(self, keyword: str):
+        node = 0
+        for ch in keyword.casefold():
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            node = nxt
+        self._output[node].add(keyword)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._output[nxt] |= self._output[self._fail[nxt]]
+
+    def find(self, text: str) -> set:
+        """text 안에 들어 있는 키워드(원래 표기) 집합"""
+        found = set()
+        if not text:
+            return found
+
+        node = 0
+        goto, fail, output = self._goto, self._fail, self._output
+        for ch in text.casefold():
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if output[node]:
+                found |= output[node]
+        return found
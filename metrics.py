@@ -0,0 +1,136 @@
+"""
+프로세스 안에서 모으는 단계별 타이머/카운터.
+
+    with metrics.timer("crawler_fetch", source="saramin"):
+        ...
+    metrics.inc("emails_sent", 10)
+
+app 의 /metrics 가 render_prometheus() 를 Prometheus 텍스트 형식으로 내보내고,
+일일 작업은 snapshot() 을 떠 두었다가 summary(since=...) 로 그 실행분만 JSON 으로 남긴다.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+_lock = threading.Lock()
+# (이름, ((라벨, 값), ...)) → 누적 값
+_counters = {}
+# (이름, ((라벨, 값), ...)) → [횟수, 합계(초), 최대(초)]
+_timers = {}
+
+
+def _key(name: str, labels: dict) -> tuple:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def inc(name: str, value: float = 1, **labels):
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name: str, seconds: float, **labels):
+    key = _key(name, labels)
+    with _lock:
+        stat = _timers.get(key)
+        if stat is None:
+            _timers[key] = [1, seconds, seconds]
+        else:
+            stat[0] += 1
+            stat[1] += seconds
+            stat[2] = max(stat[2], seconds)
+
+
+@contextmanager
+def timer(name: str, **labels):
+    """블록 실행 시간을 name 타이머에 기록한다 (예외가 나도 기록)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - started, **labels)
+
+
+def snapshot() -> dict:
+    with _lock:
+        return {
+            "counters": dict(_counters),
+            "timers": {key: list(stat) for key, stat in _timers.items()},
+        }
+
+
+def _label_text(labels: tuple) -> str:
+    if not labels:
+        return ""
+    return ",".join(f"{k}={v}" for k, v in labels)
+
+
+def summary(since: dict = None, prefixes: tuple = None) -> dict:
+    """
+    JSON 으로 남길 요약. since(snapshot() 결과)를 주면 그 뒤에 늘어난 만큼만 센다.
+    값은 프로세스 전체에서 모이므로, 한 작업의 몫만 보려면 prefixes 로 그 작업의 지표 이름만 고른다.
+    {"counters": {"이름{라벨}": 값}, "timers": {"이름{라벨}": {"count", "total_seconds", "avg_seconds"}}}
+    """
+    now = snapshot()
+    before = since or {"counters": {}, "timers": {}}
+    counters = {}
+    for key, value in now["counters"].items():
+        if prefixes and not key[0].startswith(prefixes):
+            continue
+        delta = value - before["counters"].get(key, 0)
+        if delta:
+            name, labels = key
+            counters[f"{name}{{{_label_text(labels)}}}" if labels else name] = delta
+
+    timers = {}
+    for key, (count, total, _) in now["timers"].items():
+        if prefixes and not key[0].startswith(prefixes):
+            continue
+        prev = before["timers"].get(key, [0, 0.0, 0.0])
+        count, total = count - prev[0], total - prev[1]
+        if count:
+            name, labels = key
+            timers[f"{name}{{{_label_text(labels)}}}" if labels else name] = {
+                "count": count,
+                "total_seconds": round(total, 6),
+                "avg_seconds": round(total / count, 6),
+            }
+    return {"counters": counters, "timers": timers}
+
+
+def _prom_labels(labels: tuple) -> str:
+    if not labels:
+        return ""
+    pairs = []
+    for k, v in labels:
+        v = v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{k}="{v}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def render_prometheus() -> str:
+    """Prometheus 텍스트 형식 (카운터는 *_total, 타이머는 *_seconds summary + *_seconds_max)"""
+    now = snapshot()
+    lines = []
+
+    by_name = {}
+    for (name, labels), value in sorted(now["counters"].items()):
+        by_name.setdefault(name, []).append((labels, value))
+    for name, rows in by_name.items():
+        lines.append(f"# TYPE {name}_total counter")
+        lines.extend(f"{name}_total{_prom_labels(labels)} {value}" for labels, value in rows)
+
+    by_name = {}
+    for (name, labels), stat in sorted(now["timers"].items()):
+        by_name.setdefault(name, []).append((labels, stat))
+    for name, rows in by_name.items():
+        lines.append(f"# TYPE {name}_seconds summary")
+        for labels, (count, total, _) in rows:
+            lines.append(f"{name}_seconds_count{_prom_labels(labels)} {count}")
+            lines.append(f"{name}_seconds_sum{_prom_labels(labels)} {total:.6f}")
+        lines.append(f"# TYPE {name}_seconds_max gauge")
+        lines.extend(
+            f"{name}_seconds_max{_prom_labels(labels)} {longest:.6f}" for labels, (_, _, longest) in rows
+        )
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,240 @@
+import threading
+from typing import NamedTuple
+
+from config import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_LEASE_SECONDS,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_POLL_SECONDS,
+    OUTBOX_RATE_PER_SECOND,
+    OUTBOX_RETRY_BASE_SECONDS,
+    OUTBOX_VERIFICATION_MAX_ATTEMPTS,
+    OUTBOX_VERIFICATION_RETRY_BASE_SECONDS,
+    VERIFICATION_CODE_TTL_SECONDS,
+)
+import metrics
+from db import get_connection
+from fetcher import TokenBucket
+
+# email_outbox.status
+PENDING = "pending"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+# 유효 시간이 지나 보내지 않고 실패로 남긴 메일의 last_error
+EXPIRED_ERROR = "expired before delivery"
+
+
+class RetryPolicy(NamedTuple):
+    max_attempts: int
+    base_delay: int
+    # outbox 에 들어온 뒤 이 시간(초)이 지나면 보내지 않는다 (None 이면 제한 없음)
+    ttl: int = None
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy(OUTBOX_MAX_ATTEMPTS, OUTBOX_RETRY_BASE_SECONDS)
+RETRY_POLICIES = {
+    # 인증 코드는 만료되면 쓸모가 없으므로 짧게 몇 번만 다시 보낸다
+    "verification": RetryPolicy(
+        OUTBOX_VERIFICATION_MAX_ATTEMPTS, OUTBOX_VERIFICATION_RETRY_BASE_SECONDS, VERIFICATION_CODE_TTL_SECONDS
+    ),
+}
+
+
+def is_expired(kind: str, age_seconds: float) -> bool:
+    ttl = RETRY_POLICIES.get(kind, DEFAULT_RETRY_POLICY).ttl
+    return ttl is not None and age_seconds >= ttl
+
+
+def next_retry(kind: str, attempts: int, age_seconds: float) -> tuple:
+    """
+    발송에 실패한 메일의 (다음 status, 다음 시도까지 초).
+    attempts 는 방금 실패한 시도까지 센 횟수, age_seconds 는 outbox 에 들어온 뒤 지난 시간이다.
+    최대 횟수에 닿았거나 다음 시도 시점이 유효 시간을 넘으면 FAILED 로 끝낸다.
+    """
+    policy = RETRY_POLICIES.get(kind, DEFAULT_RETRY_POLICY)
+    if attempts >= policy.max_attempts:
+        return FAILED, 0
+    delay = policy.base_delay * (2 ** (attempts - 1))
+    if policy.ttl is not None and age_seconds + delay >= policy.ttl:
+        return FAILED, 0
+    return PENDING, delay
+
+
+def enqueue_many(conn, messages: list, kind: str) -> int:
+    """
+    (수신자, 제목, 본문) 목록을 outbox 에 넣는다. commit 은 호출한 쪽에서 한다
+    (회원 정보 저장 등 같은 트랜잭션 안에서 함께 반영되도록).
+    """
+    if not messages:
+        return 0
+    with conn.cursor() as cursor:
+        cursor.executemany(
+            """
+            INSERT INTO email_outbox (kind, to_email, subject, body, status, next_attempt_at)
+            VALUES (%s, %s, %s, %s, 'pending', NOW())
+            """,
+            [(kind, to_email, subject, body) for to_email, subject, body in messages],
+        )
+    return len(messages)
+
+
+def enqueue(conn, to_email: str, subject: str, body: str, kind: str) -> int:
+    return enqueue_many(conn, [(to_email, subject, body)], kind)
+
+
+def claim_batch(limit: int = OUTBOX_BATCH_SIZE) -> list:
+    """
+    보낼 차례가 된 메일을 가져와 'sending' 으로 표시한다.
+    표시는 OUTBOX_LEASE_SECONDS 뒤에 만료되므로 발송 도중 프로세스가 죽어도 다시 보내진다.
+    """
+    with get_connection() as conn:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT
+                    id, kind, to_email, subject, body, attempts,
+                    TIMESTAMPDIFF(SECOND, created_at, NOW()) AS age_seconds
+                FROM email_outbox
+                WHERE status IN ('pending', 'sending') AND next_attempt_at <= NOW()
+                ORDER BY id
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+                """,
+                (limit,),
+            )
+            rows = cursor.fetchall()
+            if rows:
+                placeholders = ",".join(["%s"] * len(rows))
+                cursor.execute(
+                    f"""
+                    UPDATE email_outbox
+                    SET status = 'sending',
+                        next_attempt_at = NOW() + INTERVAL %s SECOND
+                    WHERE id IN ({placeholders})
+                    """,
+                    (OUTBOX_LEASE_SECONDS, *[row["id"] for row in rows]),
+                )
+        conn.commit()
+    return rows
+
+
+def _record_results(rows: list, results: list):
+    sent_ids = []
+    retries = []
+    for row, (_, error) in zip(rows, results):
+        if error is None:
+            sent_ids.append(row["id"])
+            continue
+
+        if error == EXPIRED_ERROR:
+            # 보내지 않았으므로 시도 횟수는 그대로 둔다
+            retries.append((FAILED, row["attempts"], 0, error, row["id"]))
+            continue
+
+        attempts = row["attempts"] + 1
+        status, delay = next_retry(row["kind"], attempts, row["age_seconds"])
+        retries.append((status, attempts, delay, error[:1000], row["id"]))
+
+    with get_connection() as conn:
+        with conn.cursor() as cursor:
+            if sent_ids:
+                placeholders = ",".join(["%s"] * len(sent_ids))
+                cursor.execute(
+                    f"""
+                    UPDATE email_outbox
+                    SET status = 'sent', attempts = attempts + 1, sent_at = NOW(), last_error = NULL
+                    WHERE id IN ({placeholders})
+                    """,
+                    sent_ids,
+                )
+            if retries:
+                cursor.executemany(
+                    """
+                    UPDATE email_outbox
+                    SET status = %s,
+                        attempts = %s,
+                        next_attempt_at = NOW() + INTERVAL %s SECOND,
+                        last_error = %s
+                    WHERE id = %s
+                    """,
+                    retries,
+                )
+        conn.commit()
+
+    return len(sent_ids), len(retries)
+
+
+def drain_outbox(send_batch, rate_limiter: TokenBucket = None) -> dict:
+    """
+    보낼 차례가 된 메일을 모두 보낸다.
+    send_batch([(수신자, 제목, 본문), ...]) 는 입력 순서대로 [(수신자, 실패 사유 또는 None)] 을 돌려줘야 한다.
+    실패한 메일은 종류별 RetryPolicy 에 따라 지수 backoff 로 다시 예약되고, 최대 횟수만큼 실패하면 'failed' 로 남는다.
+    유효 시간이 지난 메일(만료된 인증 코드)은 보내지 않고 'failed' 로 남긴다.
+    """
+    stats = {"sent": 0, "retried": 0}
+    while True:
+        rows = claim_batch()
+        if not rows:
+            return stats
+
+        if rate_limiter is not None:
+            # 초당 발송 상한: 배치 크기만큼 토큰을 받은 뒤에 보낸다
+            for _ in rows:
+                rate_limiter.acquire()
+
+        live = [row for row in rows if not is_expired(row["kind"], row["age_seconds"])]
+        messages = [(row["to_email"], row["subject"], row["body"]) for row in live]
+        try:
+            with metrics.timer("email_send_batch"):
+                sent_results = send_batch(messages) if messages else []
+        except Exception as exc:
+            sent_results = [(to_email, repr(exc)) for to_email, _, _ in messages]
+
+        by_id = {row["id"]: result for row, result in zip(live, sent_results)}
+        results = [by_id.get(row["id"], (row["to_email"], EXPIRED_ERROR)) for row in rows]
+
+        sent, retried = _record_results(rows, results)
+        metrics.inc("emails_sent", sent)
+        metrics.inc("emails_failed", retried)
+        stats["sent"] += sent
+        stats["retried"] += retried
+
+
+class OutboxWorker:
+    """
+    outbox 를 비우는 백그라운드 스레드.
+    notify() 로 바로 깨울 수 있고, 아니면 OUTBOX_POLL_SECONDS 마다 재시도 대상이 있는지 확인한다.
+    """
+
+    def __init__(self, send_batch, poll_seconds: float = OUTBOX_POLL_SECONDS):
+        self.send_batch = send_batch
+        self.poll_seconds = poll_seconds
+        self.rate_limiter = TokenBucket(OUTBOX_RATE_PER_SECOND, max(1, int(OUTBOX_RATE_PER_SECOND)))
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="outbox-worker", daemon=True)
+            self._thread.start()
+
+    def notify(self):
+        self._wakeup.set()
+
+    def stop(self):
+        self._stopped.set()
+        self._wakeup.set()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.clear()
+            try:
+                stats = drain_outbox(self.send_batch, self.rate_limiter)
+                if stats["sent"] or stats["retried"]:
+                    print(f"[outbox] 발송 {stats['sent']}건 / 재시도 예약 {stats['retried']}건")
+            except Exception as exc:
+                print(f"[outbox] 발송 중 오류: {exc}")
+            self._wakeup.wait(self.poll_seconds)
@@ -0,0 +1,127 @@
+"""
+크롤링 파이프라인 단계: fetch → parse/normalize → dedup → batch persist
+단계 사이는 크기 제한이 있는 큐로 연결되어 있어, 앞 단계가 너무 앞서 나가면 기다린다.
+(페이지 N 을 파싱하는 동안 N+1 을 받고, 몇 페이지를 돌든 메모리에는 큐 크기만큼만 남는다)
+"""
+import queue
+import threading
+
+from config import PIPELINE_PERSIST_BATCH_SIZE, PIPELINE_QUEUE_SIZE
+
+_DONE = object()
+
+
+class Stage:
+    """
+    source 에서 항목을 꺼내 func 를 적용한 결과를 별도 스레드에서 미리 만들어 두는 단계.
+    순서는 유지되고, func 나 source 에서 난 예외는 꺼내는 쪽에서 그대로 다시 발생한다.
+    """
+
+    def __init__(self, func, source, maxsize: int = PIPELINE_QUEUE_SIZE, name: str = "stage"):
+        self.func = func
+        self.source = source
+        self._queue = queue.Queue(maxsize=max(1, maxsize))
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _put(self, item) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        try:
+            for item in self.source:
+                if self._stopped.is_set() or not self._put((self.func(item), None)):
+                    break
+        except Exception as exc:
+            self._put((None, exc))
+        finally:
+            # source(fetch_pages 등 generator)는 돌리던 스레드에서 닫아야 남은 요청이 취소된다
+            close = getattr(self.source, "close", None)
+            if close is not None:
+                close()
+            self._put((_DONE, None))
+
+    def __iter__(self):
+        while True:
+            value, error = self._queue.get()
+            if error is not None:
+                raise error
+            if value is _DONE:
+                return
+            yield value
+
+    def close(self):
+        """
+        소비를 멈춘다. 앞 단계 스레드는 기다리던 항목(진행 중인 요청)까지만 받고
+        더 처리하지 않은 채 source 를 닫으므로, 끝날 때까지 기다리지 않는다.
+        """
+        self._stopped.set()
+
+
+class BatchWriter:
+    """
+    dedup 을 통과한 공고를 batch_size 개 이상 모일 때마다 저장 스레드로 넘긴다.
+    persist(jobs) 는 저장한 행 수를 돌려줘야 하고, 배치 저장이 끝나면 on_saved(pages) 가 호출된다
+    (해당 페이지들의 HTTP 캐시 검증자를 이때 저장). 저장이 실패하면 error 에 예외가 남는다.
+    """
+
+    def __init__(
+        self,
+        persist,
+        on_saved=None,
+        batch_size: int = PIPELINE_PERSIST_BATCH_SIZE,
+        maxsize: int = PIPELINE_QUEUE_SIZE,
+        name: str = "persist",
+    ):
+        self.persist = persist
+        self.on_saved = on_saved
+        self.batch_size = max(1, batch_size)
+        self.inserted = 0
+        self.error = None
+        self._pages = []
+        self._jobs = []
+        self._queue = queue.Queue(maxsize=max(1, maxsize))
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            if batch is _DONE:
+                return
+            if self.error is not None:
+                # 앞 배치가 실패하면 뒤 배치는 저장하지 않는다 (다음 실행에서 다시 수집)
+                continue
+            pages, jobs = batch
+            try:
+                if jobs:
+                    self.inserted += self.persist(jobs)
+                if self.on_saved is not None:
+                    self.on_saved(pages)
+            except Exception as exc:
+                self.error = exc
+
+    def add(self, page: int, jobs: list):
+        self._pages.append(page)
+        self._jobs.extend(jobs)
+        if len(self._jobs) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._pages:
+            self._queue.put((self._pages, self._jobs))
+            self._pages, self._jobs = [], []
+
+    def close(self) -> int:
+        """남은 공고를 저장하고 저장 스레드가 끝날 때까지 기다린다. 실패 여부는 error 로 확인한다."""
+        self.flush()
+        self._queue.put(_DONE)
+        self._thread.join()
+        return self.inserted
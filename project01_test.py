@@ -1,68 +1,88 @@
-import requests
-from bs4 import BeautifulSoup
-import mysql.connector
-from mysql.connector import Error
 from dotenv import load_dotenv
-import os
+
+import html_parser
+from crawler_base import Crawler
+from db import get_connection
+from http_cache import NOT_MODIFIED
+from job_store import insert_jobs_bulk
 
 # 🔹 .env 파일 로드 (DB 접속 정보 불러오기)
 load_dotenv()
 
+# 크롤링 대상 URL
+URL = "https://jasoseol.com/search?dutyGroupIds=166%2C175%2C176%2C177%2C178&excludeClosed=true"
+
+# 검색 결과 목록 영역과 공고 카드(<a>) 선택자 (crawl_all.py 와 같은 구조)
+LIST_CONTAINER = "#__next > div > div.responsive-layout > main"
+ITEM_SELECTOR = "div.px-4 > div > main > div > a"
+PERIOD_SELECTOR = "div:nth-of-type(2) > div:nth-of-type(4) > div > div"
+
 
 # ============================================
-# 🔹 채용공고 크롤링 함수
+# 🔹 자소설닷컴 크롤러 (fetch → parse → normalize → persist)
 # ============================================
-def crawl_jobs(max_pages=20):
-    # 크롤링 대상 URL
-    url = "https://jasoseol.com/search?dutyGroupIds=166%2C175%2C176%2C177%2C178&excludeClosed=true"
-    jobs = []  # 크롤링한 데이터 저장 리스트
-
-    # 1~20페이지까지 반복 크롤링
-    for page in range(1, max_pages + 1):
+class JasoseolCrawler(Crawler):
+    name = "jasoseol"
+    host = "jasoseol.com"
+    max_pages = 20
+    # 검색 URL 에 최신순 정렬을 고정하는 파라미터가 없어 목록 순서를 보장할 수 없으므로
+    # 워터마크로 페이지 넘김을 멈추지 않는다 (중복은 detail 유니크 키가 거른다)
+    incremental = False
+    requires_schema = True
+
+    def fetch_page(self, page: int):
         params = {"page": page}  # GET 파라미터 설정
-        res = requests.get(url, params=params)
-        res.raise_for_status()   # 요청 실패 시 오류 발생
-
-        soup = BeautifulSoup(res.text, "html.parser")
-
-        # 채용공고 목록에서 <a> 태그만 선택
-        items = soup.select("main a")
-
-        for item in items:
-            href = item.get("href")  # 상세 페이지 URL
-
-            # 회사명 추출
-            company_tag = item.select_one("h5")
-            company = company_tag.get_text(strip=True) if company_tag else "정보없음"
-
-            # 채용 제목 추출
-            title_tag = item.select_one("h4")
-            title = title_tag.get_text(strip=True) if title_tag else "정보없음"
-
-            # 채용 기간 텍스트 추출
-            period_tag = item.select_one("div:nth-of-type(2) > div:nth-of-type(4) > div > div")
-            period_text = period_tag.get_text(strip=True) if period_tag else "정보없음"
-
-            # "시작일~종료일" 형태일 때 분리
-            if "~" in period_text:
-                start_date, end_date = [x.strip() for x in period_text.split("~", 1)]
-            else:
-                start_date = period_text
-                end_date = "정보없음"
-
-            # 상세 페이지 링크 생성
-            detail_url = "https://jasoseol.com" + href if href else "정보없음"
-
-            # 리스트에 저장
-            jobs.append({
-                "company": company,
-                "title": title,
-                "start_date": start_date,
-                "end_date": end_date,
-                "detail": detail_url
-            })
-
-    return jobs
+        res = self.fetch(page, URL, params=params)   # 요청 실패 시 오류 발생
+        if res is NOT_MODIFIED:
+            return res
+        return res.text
+
+    def parse(self, html: str) -> list:
+        listing = html_parser.parse_listing(html, LIST_CONTAINER)
+        if listing is None:
+            return []
+
+        # 채용공고 카드 <a> 태그만 선택 (메뉴 등 main 안의 다른 링크는 제외)
+        return html_parser.select(listing, ITEM_SELECTOR)
+
+    def normalize(self, item):
+        href = html_parser.attr(item, "href")  # 상세 페이지 URL
+
+        # 회사명 추출
+        company_tag = html_parser.select_one(item, "h5")
+        company = html_parser.text(company_tag) if company_tag is not None else "정보없음"
+
+        # 채용 제목 추출
+        title_tag = html_parser.select_one(item, "h4")
+        title = html_parser.text(title_tag) if title_tag is not None else "정보없음"
+
+        # 채용 기간 텍스트 추출
+        period_tag = html_parser.select_one(item, PERIOD_SELECTOR)
+        period_text = html_parser.text(period_tag) if period_tag is not None else "정보없음"
+
+        # "시작일~종료일" 형태일 때 분리
+        if "~" in period_text:
+            start_date, end_date = [x.strip() for x in period_text.split("~", 1)]
+        else:
+            start_date = period_text
+            end_date = "정보없음"
+
+        # 상세 페이지 링크 생성
+        detail_url = "https://jasoseol.com" + href if href else "정보없음"
+
+        return {
+            "company_name": company,
+            "title": title,
+            "start_time": start_date,
+            "end_time": end_date,
+            "detail": detail_url,
+        }
+
+    def persist(self, jobs: list) -> int:
+        # 저장 실패(pymysql.MySQLError)는 그대로 올려 보내야 워터마크/HTTP 캐시가 저장되지 않는다
+        inserted_count = insert_to_mysql(jobs)
+        print(f"DB 저장 완료: {inserted_count}건 저장 / {len(jobs) - inserted_count}건 중복 제외됨")
+        return inserted_count
 
 
 # ============================================
@@ -73,10 +93,10 @@ def save_and_print(jobs, filename="pj01_test.txt"):
         for job in jobs:
             # 한 채용공고 출력 포맷
             line = (
-                f"회사명: {job['company']}\n"
+                f"회사명: {job['company_name']}\n"
                 f"제목: {job['title']}\n"
-                f"채용시작일: {job['start_date']}\n"
-                f"채용마감일: {job['end_date']}\n"
+                f"채용시작일: {job['start_time']}\n"
+                f"채용마감일: {job['end_time']}\n"
                 f"링크: {job['detail']}\n"
                 "--------------------------\n"
             )
@@ -87,72 +107,29 @@ def save_and_print(jobs, filename="pj01_test.txt"):
 # ============================================
 # 🔹 MySQL DB 저장 함수
 # ============================================
-def save_to_mysql(jobs):
+def insert_to_mysql(jobs) -> int:
+    """detail 유니크 키 기준으로 DB 가 중복을 걸러내는 bulk INSERT. DB 오류는 호출한 쪽으로 올린다."""
+    conn = get_connection()
     try:
-        conn = mysql.connector.connect(
-            host=os.getenv("DB_HOST"),
-            port=os.getenv("DB_PORT"),
-            user=os.getenv("DB_USER"),
-            password=os.getenv("DB_PASSWORD"),
-            database=os.getenv("DB_NAME")
-        )
-        cursor = conn.cursor()
-
-        # 🔹 DB 중복 체크용 SQL
-        check_sql = "SELECT COUNT(*) FROM job WHERE detail = %s"
-
-        # 🔹 신규 데이터 저장 SQL
-        insert_sql = """
-        INSERT INTO job (company_name, title, start_time, end_time, detail)
-        VALUES (%s, %s, %s, %s, %s)
-        """
-
-        inserted_count = 0  # 실제 저장된 개수 계산
-
-        for job in jobs:
-            # 🔸 detail 기준 중복 체크
-            cursor.execute(check_sql, (job["detail"],))
-            result = cursor.fetchone()
-
-            if result[0] > 0:
-                print(f"중복 데이터 스킵됨: {job['detail']}")
-                continue  # 중복 → 저장 안함
-
-            # 🔸 중복 아니면 INSERT
-            cursor.execute(insert_sql, (
-                job["company"],
-                job["title"],
-                job["start_date"],
-                job["end_date"],
-                job["detail"]
-            ))
-
-            inserted_count += 1
+        return insert_jobs_bulk(conn, jobs)
+    finally:
+        conn.close()
 
-        conn.commit()
-        print(f"DB 저장 완료: {inserted_count}건 저장 / {len(jobs)}건 중복 제외됨")
 
-    except Error as e:
-        print("MySQL 오류:", e)
+def main():
+    # 1~20페이지 크롤링 + 페이지 단위 DB 저장
+    result = JasoseolCrawler().run()
 
-    finally:
-        if conn.is_connected():
-            cursor.close()
-            conn.close()
+    if result.fetched:
+        print(f"채용공고 {result.fetched}건 크롤링 완료 / {result.inserted}건 저장")
+    else:
+        print("크롤링된 채용공고가 없음")
 
+    return result
 
 
 # ============================================
 # 🔹 메인 실행
 # ============================================
 if __name__ == "__main__":
-    # 1~20페이지 크롤링
-    job_list = crawl_jobs(max_pages=20)
-
-    if job_list:
-        # save_and_print(job_list)   # txt 저장 + 출력
-        save_to_mysql(job_list)    # DB 저장
-
-        print(f"채용공고 {len(job_list)}건 크롤링 완료 / pj01_test.txt 저장 완료")
-    else:
-        print("크롤링된 채용공고가 없음")
+    main()
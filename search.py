@@ -0,0 +1,229 @@
+import base64
+import json
+
+from config import FULLTEXT_NGRAM_TOKEN_SIZE, SEARCH_API_MAX_PAGE_SIZE, SEARCH_API_PAGE_SIZE
+
+SEARCH_LIMIT = 100
+
+# 키워드 하나가 제목/회사명에 들어 있을 때 받는 점수 (관련도 크기와 상관없이 제목 일치가 항상 앞선다)
+SEARCH_TITLE_WEIGHT = 3
+SEARCH_COMPANY_WEIGHT = 1
+
+# /api/search 에서 fields 로 고를 수 있는 컬럼 (id / end_time 은 커서 때문에 항상 조회)
+SEARCH_API_FIELDS = ("id", "company_name", "title", "start_time", "end_time", "detail", "created_at")
+
+# BOOLEAN MODE 에서 연산자로 해석되는 문자
+_BOOLEAN_OPERATORS = '+-<>()~*"@'
+
+
+def _phrase_tokens(keyword: str) -> list:
+    # 연산자 문자는 공백으로 바꾼 뒤 공백 단위로 나눈다
+    cleaned = "".join(" " if ch in _BOOLEAN_OPERATORS else ch for ch in keyword)
+    return cleaned.split()
+
+
+def to_phrase(keyword: str) -> str:
+    """검색어를 BOOLEAN MODE 구문("...")으로 바꾼다. ngram 인덱스에서는 연속된 글자 일치로 동작한다."""
+    return '"' + " ".join(_phrase_tokens(keyword)) + '"'
+
+
+def uses_fulltext(keyword: str) -> bool:
+    """
+    연산자 문자를 지운 구문의 모든 토큰이 ngram 크기 이상일 때만 FULLTEXT 로 찾는다.
+    ("C++" 처럼 지우고 나면 "C" 만 남는 검색어는 인덱스로 찾을 수 없으므로 LIKE 로 처리)
+    """
+    tokens = _phrase_tokens(keyword)
+    return bool(tokens) and all(len(token) >= FULLTEXT_NGRAM_TOKEN_SIZE for token in tokens)
+
+
+def parse_keywords(query: str) -> list:
+    """쉼표로 구분된 검색어 목록 (빈 값/중복 제거, 입력 순서 유지)"""
+    keywords = []
+    for kw in query.split(","):
+        kw = kw.strip()
+        if kw and kw not in keywords:
+            keywords.append(kw)
+    return keywords
+
+
+def cache_key(keywords: list, mode: str, *extra) -> tuple:
+    """대소문자/순서만 다른 검색은 결과가 같으므로 같은 키를 쓴다."""
+    normalized = sorted({kw.strip().casefold() for kw in keywords if kw and kw.strip()})
+    return (tuple(normalized), mode, *extra)
+
+
+def build_search_clause(keywords: list, mode: str = "any"):
+    """
+    (WHERE 절, WHERE 파라미터, 점수 식, 점수 파라미터) 를 만든다.
+    mode="all" 이면 모든 키워드, "any" 면 하나 이상 포함된 공고를 찾는다.
+    점수는 키워드마다 제목에 있으면 SEARCH_TITLE_WEIGHT, 회사명에 있으면 SEARCH_COMPANY_WEIGHT 를 더한다.
+    (MATCH 관련도 값은 컬럼/인덱스마다 크기가 달라 그대로 더하면 회사명 일치가 제목 일치를 앞설 수 있다)
+    """
+    fulltext = [kw for kw in keywords if uses_fulltext(kw)]
+    short = [kw for kw in keywords if not uses_fulltext(kw)]
+
+    predicates, where_params = [], []
+    scores, score_params = [], []
+
+    if fulltext:
+        prefix = "+" if mode == "all" else ""
+        predicates.append("MATCH(title, company_name) AGAINST (%s IN BOOLEAN MODE)")
+        where_params.append(" ".join(prefix + to_phrase(kw) for kw in fulltext))
+
+        for kw in fulltext:
+            scores.append(
+                f"{SEARCH_TITLE_WEIGHT} * (MATCH(title) AGAINST (%s IN BOOLEAN MODE) > 0)"
+                f" + {SEARCH_COMPANY_WEIGHT} * (MATCH(company_name) AGAINST (%s IN BOOLEAN MODE) > 0)"
+            )
+            score_params.extend([to_phrase(kw), to_phrase(kw)])
+
+    for kw in short:
+        like = f"%{kw}%"
+        predicates.append("(title LIKE %s OR company_name LIKE %s)")
+        where_params.extend([like, like])
+        scores.append(
+            f"{SEARCH_TITLE_WEIGHT} * (title LIKE %s) + {SEARCH_COMPANY_WEIGHT} * (company_name LIKE %s)"
+        )
+        score_params.extend([like, like])
+
+    joiner = " AND " if mode == "all" else " OR "
+    return joiner.join(predicates), where_params, " + ".join(scores), score_params
+
+
+def search_jobs(conn, keywords: list, mode: str = "any", limit: int = SEARCH_LIMIT) -> list:
+    """
+    제목/회사명에서 여러 키워드를 AND(all) / OR(any) 로 찾는다 (상세 URL 은 검색 대상이 아님).
+    ft_job_title_company 로 후보를 찾고 ft_job_title / ft_job_company 로 점수를 매긴 뒤
+    마감 안 지난 공고 → 점수 높은 순 → 마감일까지(지난 공고는 마감일부터) 남은 시간이 짧은 순
+    (마감일 미정은 같은 점수 안에서 뒤)으로 DB 에서 정렬해 limit 건만 가져온다.
+    ngram 크기보다 짧은 검색어만 LIKE 로 처리한다.
+    """
+    keywords = [kw.strip() for kw in keywords if kw and kw.strip()]
+    if not keywords:
+        return []
+
+    where, where_params, score, score_params = build_search_clause(keywords, mode)
+
+    with conn.cursor() as cursor:
+        cursor.execute(
+            f"""
+            SELECT
+                id,
+                company_name,
+                title,
+                end_time,
+                detail,
+                created_at,
+                {score} AS score
+            FROM job
+            WHERE {where}
+            ORDER BY
+                end_time IS NOT NULL AND end_time < NOW(),
+                score DESC,
+                end_time IS NULL,
+                ABS(TIMESTAMPDIFF(SECOND, NOW(), end_time))
+            LIMIT %s
+            """,
+            (*score_params, *where_params, limit),
+        )
+        return cursor.fetchall()
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(row: dict) -> str:
+    """마지막 행의 (end_time, id) 를 다음 페이지 커서 문자열로 만든다."""
+    end_time = row["end_time"]
+    if end_time is not None and hasattr(end_time, "isoformat"):
+        end_time = end_time.isoformat()
+    raw = json.dumps([end_time, row["id"]]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        end_time, job_id = json.loads(raw)
+        if not isinstance(job_id, int) or not (end_time is None or isinstance(end_time, str)):
+            raise ValueError
+    except (ValueError, TypeError):
+        raise InvalidCursor(cursor)
+    return end_time, job_id
+
+
+def _select_page(conn, columns: list, predicates: list, params: list, order_by: str, limit: int) -> list:
+    with conn.cursor() as db_cursor:
+        db_cursor.execute(
+            f"""
+            SELECT {", ".join(columns)}
+            FROM job
+            WHERE {" AND ".join(predicates)}
+            ORDER BY {order_by}
+            LIMIT %s
+            """,
+            (*params, limit),
+        )
+        return list(db_cursor.fetchall())
+
+
+def search_jobs_page(
+    conn,
+    keywords: list,
+    mode: str = "any",
+    cursor: str = None,
+    page_size: int = SEARCH_API_PAGE_SIZE,
+    fields=None,
+) -> dict:
+    """
+    마감일 가까운 순(미정은 뒤) → id 순으로 page_size 건씩 가져온다.
+    OFFSET 대신 직전 페이지 마지막 행의 (end_time, id) 다음부터 읽으므로 뒤 페이지도 앞 페이지만큼 싸다.
+    ix_job_end_time_id 를 범위 스캔으로 타도록 마감일이 있는 구간((end_time, id) > 커서)을 먼저 읽고,
+    그 구간이 끝나면 마감일 미정 구간(end_time IS NULL AND id > 커서)을 id 순으로 이어 읽는다.
+    커서의 end_time 이 None 이면 미정 구간에 들어와 있다는 뜻이다.
+    키워드가 없으면 전체 공고를 같은 순서로 돌려준다.
+    {"items": [...], "next_cursor": 다음 페이지 커서 또는 None} 을 돌려준다.
+    """
+    page_size = max(1, min(page_size, SEARCH_API_MAX_PAGE_SIZE))
+    fields = [f for f in (fields or SEARCH_API_FIELDS) if f in SEARCH_API_FIELDS] or list(SEARCH_API_FIELDS)
+    columns = list(dict.fromkeys(["id", "end_time", *fields]))
+
+    predicates, params = [], []
+    keywords = [kw.strip() for kw in keywords if kw and kw.strip()]
+    if keywords:
+        where, where_params, _, _ = build_search_clause(keywords, mode)
+        predicates.append(f"({where})")
+        params.extend(where_params)
+
+    end_time, last_id = decode_cursor(cursor) if cursor else (None, None)
+    in_null_segment = cursor is not None and end_time is None
+
+    rows = []
+    if not in_null_segment:
+        if cursor:
+            segment = ["(end_time, id) > (%s, %s)"]
+            segment_params = [end_time, last_id]
+        else:
+            segment = ["end_time IS NOT NULL"]
+            segment_params = []
+        rows = _select_page(
+            conn, columns, predicates + segment, params + segment_params, "end_time, id", page_size + 1
+        )
+        last_id = 0
+
+    if len(rows) <= page_size:
+        rows += _select_page(
+            conn,
+            columns,
+            predicates + ["end_time IS NULL AND id > %s"],
+            params + [last_id],
+            "id",
+            page_size + 1 - len(rows),
+        )
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    next_cursor = encode_cursor(rows[-1]) if has_more else None
+    items = [{f: row[f] for f in fields} for row in rows]
+    return {"items": items, "next_cursor": next_cursor}
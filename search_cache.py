@@ -0,0 +1,52 @@
+import threading
+import time
+from collections import OrderedDict
+
+import metrics
+from config import SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL_SECONDS
+from job_store import ingest_generation
+
+
+class QueryCache:
+    """
+    검색 결과를 (수집 세대, 정규화한 질의) 키로 보관하는 LRU + TTL 캐시.
+    크롤러가 새 공고를 저장하면 세대가 바뀌어 이전 결과는 더 이상 맞지 않고, 오래된 것부터 밀려난다.
+    """
+
+    def __init__(self, maxsize: int = SEARCH_CACHE_SIZE, ttl: float = SEARCH_CACHE_TTL_SECONDS):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key, load):
+        """캐시에 있으면 바로 돌려주고, 없으면 load() 결과를 저장해 돌려준다."""
+        if self.maxsize <= 0:
+            return load()
+
+        key = (ingest_generation(), key)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._items.get(key)
+            if entry is not None and entry[0] > now:
+                self._items.move_to_end(key)
+                self.hits += 1
+                metrics.inc("search_cache_hits")
+                return entry[1]
+            self.misses += 1
+        metrics.inc("search_cache_misses")
+
+        # DB 조회는 잠금 밖에서 한다 (같은 질의가 동시에 들어오면 둘 다 조회할 수 있음)
+        value = load()
+        with self._lock:
+            self._items[key] = (now + self.ttl, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
@@ -0,0 +1,8 @@
+import os
+import sys
+
+# config.py 는 DB_PORT 를 int 로 읽으므로 DB 없이 도는 단위 테스트에서도 값만 채워 둔다
+os.environ.setdefault("DB_PORT", "3306")
+
+# 모듈이 저장소 최상위에 평평하게 있으므로 import 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
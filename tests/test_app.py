@@ -0,0 +1,129 @@
+import os
+import threading
+
+# debug 모드로 import 하면 app 모듈이 마이그레이션 확인 / 스케줄러 / outbox 워커를 시작하지 않는다
+os.environ.setdefault("FLASK_DEBUG", "1")
+
+import app  # noqa: E402
+
+
+class _SlowCrawler:
+    """timeout 이 지나 cancel() 될 때까지 돌다가, 저장을 마치는 데 finish_seconds 가 걸리는 크롤러"""
+
+    name = "slow"
+    timeout = 0.05
+    finish_seconds = 0.0
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self.finished = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def run(self):
+        self._cancelled.wait()
+        self.finished.wait(self.finish_seconds)
+        return self
+
+
+def _run_single(crawler):
+    crawler.run()
+    return {"source": crawler.name, "errors": []}
+
+
+def test_cancelled_crawler_is_waited_for(monkeypatch):
+    monkeypatch.setattr(app, "run_single_crawler", _run_single)
+
+    results = app.run_crawlers_concurrently([_SlowCrawler], cancel_wait=5)
+
+    assert results == [{"source": "slow", "errors": ["timeout"], "still_running": False}]
+
+
+def test_crawler_still_saving_after_cancel_wait_is_reported(monkeypatch):
+    class _StuckCrawler(_SlowCrawler):
+        finish_seconds = 0.5
+
+    monkeypatch.setattr(app, "run_single_crawler", _run_single)
+
+    results = app.run_crawlers_concurrently([_StuckCrawler], cancel_wait=0.05)
+
+    assert results[0]["still_running"] is True
+
+
+class _FakeSMTP:
+    """mail.connect() 대신 쓰는 연결. disconnect_on 에 든 번호의 send 호출에서 연결이 끊긴다."""
+
+    def __init__(self, log, disconnect_on, fail_enter=False):
+        self.log = log
+        self.disconnect_on = disconnect_on
+        self.fail_enter = fail_enter
+
+    def __enter__(self):
+        if self.fail_enter:
+            raise ConnectionRefusedError("smtp down")
+        self.log["connections"] += 1
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def send(self, msg):
+        self.log["sends"] += 1
+        if self.log["sends"] in self.disconnect_on or "all" in self.disconnect_on:
+            raise app.smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        self.log["delivered"].append(msg.recipients[0])
+
+
+def _smtp(monkeypatch, disconnect_on=(), fail_enter=False):
+    log = {"connections": 0, "sends": 0, "delivered": []}
+    monkeypatch.setattr(app.mail, "connect", lambda: _FakeSMTP(log, set(disconnect_on), fail_enter))
+    return log
+
+
+def _chunk(count):
+    return [(f"user{n}@example.com", "제목", "본문") for n in range(1, count + 1)]
+
+
+def test_send_chunk_reconnects_after_one_drop(monkeypatch):
+    log = _smtp(monkeypatch, disconnect_on={2})
+
+    results = app._send_chunk(_chunk(3))
+
+    assert results == [(f"user{n}@example.com", None) for n in range(1, 4)]
+    assert log["delivered"] == ["user1@example.com", "user2@example.com", "user3@example.com"]
+    assert log["connections"] == 2
+
+
+def test_send_chunk_gives_up_on_a_message_after_max_reconnects(monkeypatch):
+    monkeypatch.setattr(app, "MAIL_MAX_RECONNECTS", 2)
+    log = _smtp(monkeypatch, disconnect_on={"all"})
+
+    results = app._send_chunk(_chunk(2))
+
+    assert [to_email for to_email, _ in results] == ["user1@example.com", "user2@example.com"]
+    assert all("SMTPServerDisconnected" in error for _, error in results)
+    # 메일마다 처음 시도 1번 + 다시 연결해서 2번
+    assert log["sends"] == 2 * 3
+    assert log["connections"] == 2 * 3
+    assert log["delivered"] == []
+
+
+def test_send_chunk_reconnect_budget_is_per_message(monkeypatch):
+    monkeypatch.setattr(app, "MAIL_MAX_RECONNECTS", 1)
+    # 첫 메일에서 한 번, 둘째 메일에서 한 번 끊겨도 각각 한도 안이다
+    log = _smtp(monkeypatch, disconnect_on={1, 3})
+
+    results = app._send_chunk(_chunk(2))
+
+    assert results == [("user1@example.com", None), ("user2@example.com", None)]
+    assert log["connections"] == 3
+
+
+def test_send_chunk_fails_remaining_messages_when_connect_fails(monkeypatch):
+    _smtp(monkeypatch, fail_enter=True)
+
+    results = app._send_chunk(_chunk(2))
+
+    assert [to_email for to_email, _ in results] == ["user1@example.com", "user2@example.com"]
+    assert all("smtp down" in error for _, error in results)
@@ -0,0 +1,69 @@
+import functools
+
+import pytest
+
+import crawl_linkareer
+import crawler_base
+import fetcher
+import insert_data
+from crawl_linkareer import LinkareerCrawler
+from crawl_state import WatermarkStore
+from dedup_store import DedupStore
+
+JOBS = [
+    {"company_name": "(주)에이", "title": "보안 관제 요원", "detail": "https://linkareer.com/activity/1"},
+    {"company_name": "비", "title": "백엔드 개발자", "detail": "https://linkareer.com/activity/2"},
+]
+
+
+@pytest.fixture
+def linkareer(monkeypatch, tmp_path):
+    """MySQL 없이 돌도록 DB 조회/저장과 로컬 상태 파일 경로를 바꾼 LinkareerCrawler 생성기"""
+    monkeypatch.setattr(crawler_base, "require_migrations", lambda: None)
+    monkeypatch.setattr(
+        crawler_base, "WatermarkStore", functools.partial(WatermarkStore, str(tmp_path / "state.sqlite3"))
+    )
+    monkeypatch.setattr(
+        crawl_linkareer, "DedupStore", functools.partial(DedupStore, str(tmp_path / "dedup.sqlite3"))
+    )
+    monkeypatch.setattr(insert_data, "iter_existing_job_batches", lambda since_id=0, batch_size=0: iter(()))
+    monkeypatch.setattr(crawl_linkareer, "get_existing_details", lambda details: set())
+    monkeypatch.setattr(crawl_linkareer, "get_existing_fingerprints", lambda jobs: set())
+    monkeypatch.setitem(fetcher._limiters, LinkareerCrawler.host, fetcher.HostLimiter(4, 0, 1))
+
+    def make(insert_jobs):
+        monkeypatch.setattr(crawl_linkareer, "insert_jobs", insert_jobs)
+        crawler = LinkareerCrawler()
+        crawler.use_http_cache = False
+        crawler.fetch_page = lambda page: {"jobs": [dict(job) for job in JOBS]}
+        crawler.parse = lambda data: data["jobs"]
+        return crawler
+
+    return make
+
+
+def test_failed_persist_is_retried_by_next_run(linkareer):
+    def failing(jobs):
+        raise RuntimeError("db down")
+
+    first = linkareer(failing).run()
+    assert not first.ok
+
+    # 저장에 실패한 공고가 공용 인덱스에 남아 있으면 다음 실행이 중복으로 걸러 버린다
+    saved = []
+    second = linkareer(lambda jobs: saved.extend(jobs) or len(jobs)).run()
+
+    assert second.ok
+    assert second.inserted == len(JOBS)
+    assert [job["detail"] for job in saved] == [job["detail"] for job in JOBS]
+
+
+def test_saved_jobs_are_duplicates_for_next_run(linkareer):
+    linkareer(lambda jobs: len(jobs)).run()
+
+    crawler = linkareer(lambda jobs: len(jobs))
+    crawler.incremental = False
+    result = crawler.run()
+
+    assert result.inserted == 0
+    assert result.duplicates == len(JOBS)
@@ -0,0 +1,79 @@
+import pytest
+
+import fetcher
+from config import CRAWL_MAX_UNCHANGED_PAGES
+from crawler_base import Crawler
+from http_cache import NOT_MODIFIED
+
+
+@pytest.fixture(autouse=True)
+def unlimited_host(monkeypatch):
+    # 가짜 호스트에는 속도 제한을 걸지 않는다
+    monkeypatch.setitem(fetcher._limiters, "fake.example", fetcher.HostLimiter(4, 0, 1))
+
+
+class _FakeCrawler(Crawler):
+    name = "fake"
+    host = "fake.example"
+    max_pages = 1000
+    use_http_cache = False
+
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = pages
+        self.saved = []
+
+    def fetch_page(self, page: int):
+        return self.pages(page)
+
+    def parse(self, raw):
+        return raw
+
+    def normalize(self, item):
+        return item
+
+    def persist(self, jobs: list) -> int:
+        self.saved.extend(jobs)
+        return len(jobs)
+
+
+def _job(n):
+    return {"company_name": "회사", "title": f"공고 {n}", "detail": f"https://example.com/{n}"}
+
+
+def test_stops_after_consecutive_unchanged_pages():
+    crawler = _FakeCrawler(lambda page: NOT_MODIFIED)
+
+    result = crawler.run()
+
+    assert result.ok
+    assert result.unchanged_pages == CRAWL_MAX_UNCHANGED_PAGES
+
+
+def test_changed_page_resets_unchanged_count():
+    def pages(page):
+        if page % CRAWL_MAX_UNCHANGED_PAGES == 0 and page <= 3 * CRAWL_MAX_UNCHANGED_PAGES:
+            return [_job(page)]
+        return NOT_MODIFIED
+
+    crawler = _FakeCrawler(pages)
+
+    result = crawler.run()
+
+    assert result.ok
+    assert [job["title"] for job in crawler.saved] == [
+        f"공고 {n * CRAWL_MAX_UNCHANGED_PAGES}" for n in range(1, 4)
+    ]
+
+
+def test_persist_error_is_reported():
+    class _FailingCrawler(_FakeCrawler):
+        def persist(self, jobs):
+            raise RuntimeError("db down")
+
+    crawler = _FailingCrawler(lambda page: [_job(page)] if page == 1 else [])
+
+    result = crawler.run()
+
+    assert not result.ok
+    assert "db down" in result.errors[-1]
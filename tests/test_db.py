@@ -0,0 +1,148 @@
+import pytest
+
+import db
+from db import ConnectionPool
+
+
+class _FakeConnection:
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+        self.fail_ping = False
+        self.fail_rollback = False
+        self.rollbacks = 0
+
+    def ping(self, reconnect=False):
+        if self.fail_ping:
+            raise ConnectionError("gone away")
+
+    def rollback(self):
+        if self.fail_rollback:
+            raise ConnectionError("lost connection")
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+class _Connector:
+    def __init__(self):
+        self.made = []
+
+    def __call__(self):
+        conn = _FakeConnection(len(self.made) + 1)
+        self.made.append(conn)
+        return conn
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(db.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _pool(connect, **kwargs):
+    options = {"max_size": 2, "timeout": 0.05, "recycle": 3600, "ping_interval": 30}
+    options.update(kwargs)
+    return ConnectionPool(connect=connect, **options)
+
+
+def test_released_connection_is_rolled_back_and_reused():
+    connect = _Connector()
+    pool = _pool(connect)
+
+    with pool.acquire() as conn:
+        assert conn.number == 1
+    with pool.acquire() as conn:
+        assert conn.number == 1
+
+    assert len(connect.made) == 1
+    assert connect.made[0].rollbacks == 2
+
+
+def test_returned_wrapper_cannot_be_used():
+    pool = _pool(_Connector())
+    conn = pool.acquire()
+    conn.close()
+
+    with pytest.raises(Exception, match="반환된 연결"):
+        conn.rollback()
+
+
+def test_acquire_times_out_when_all_connections_are_in_use():
+    pool = _pool(_Connector(), max_size=1)
+    held = pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+    held.close()
+    pool.acquire().close()
+
+
+def test_idle_connection_failing_ping_is_discarded(clock):
+    connect = _Connector()
+    pool = _pool(connect)
+    pool.acquire().close()
+
+    connect.made[0].fail_ping = True
+    clock[0] += 31
+
+    with pool.acquire() as conn:
+        assert conn.number == 2
+    assert connect.made[0].closed
+
+
+def test_recently_used_connection_is_not_pinged(clock):
+    connect = _Connector()
+    pool = _pool(connect)
+    pool.acquire().close()
+
+    connect.made[0].fail_ping = True
+    clock[0] += 29
+
+    with pool.acquire() as conn:
+        assert conn.number == 1
+
+
+def test_connection_older_than_recycle_is_replaced(clock):
+    connect = _Connector()
+    pool = _pool(connect, recycle=60, ping_interval=3600)
+    with pool.acquire():
+        clock[0] += 61
+
+    with pool.acquire() as conn:
+        assert conn.number == 2
+    assert connect.made[0].closed
+
+
+def test_slot_is_released_when_rollback_fails():
+    connect = _Connector()
+    pool = _pool(connect, max_size=1)
+    conn = pool.acquire()
+    connect.made[0].fail_rollback = True
+
+    conn.close()
+
+    # 실패한 연결은 버려지고, 자리는 비어서 바로 새 연결을 빌릴 수 있다
+    with pool.acquire() as conn:
+        assert conn.number == 2
+    assert connect.made[0].closed
+
+
+def test_connect_failure_does_not_leak_a_slot():
+    attempts = []
+
+    def connect():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("refused")
+        return _FakeConnection(len(attempts))
+
+    pool = _pool(connect, max_size=1)
+    with pytest.raises(ConnectionError):
+        pool.acquire()
+
+    with pool.acquire() as conn:
+        assert conn.number == 2
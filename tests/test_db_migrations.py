@@ -0,0 +1,24 @@
+from db_migrations import DISABLE_FULLTEXT_STOPWORDS, MIGRATIONS
+
+
+def test_migration_names_are_unique_and_ordered():
+    names = [name for name, _ in MIGRATIONS]
+
+    assert len(set(names)) == len(names)
+    assert names == sorted(names)
+
+
+def test_fulltext_indexes_are_built_without_stopwords():
+    for name, statements in MIGRATIONS:
+        for i, sql in enumerate(statements):
+            if "FULLTEXT" in sql:
+                assert DISABLE_FULLTEXT_STOPWORDS in statements[:i], name
+
+
+def test_detail_duplicates_are_removed_through_the_hash_index():
+    statements = dict(MIGRATIONS)["001_job_detail_unique"]
+    add_column, delete, add_unique = statements
+
+    assert "ADD KEY ix_job_detail_hash" in add_column and "UNIQUE" not in add_column
+    assert "j1.detail_hash = j2.detail_hash" in delete
+    assert "UNIQUE KEY uq_job_detail_hash" in add_unique
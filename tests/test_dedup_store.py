@@ -0,0 +1,83 @@
+import sqlite3
+
+import pytest
+
+import insert_data
+from dedup_store import DedupStore
+from insert_data import ExistingJob, is_similar_job
+
+
+@pytest.fixture
+def mysql_jobs(monkeypatch):
+    """MySQL job 테이블 대신 쓰는 행 목록 (id 순으로 보이지 않는 commit 을 흉내 낼 수 있게 직접 넣는다)"""
+    rows = []
+
+    def iter_batches(since_id=0, batch_size=1000):
+        batch = sorted((row for row in rows if row.id > since_id), key=lambda row: row.id)
+        if batch:
+            yield batch
+
+    monkeypatch.setattr(insert_data, "iter_existing_job_batches", iter_batches)
+    return rows
+
+
+def _row(job_id, company, title):
+    return ExistingJob(job_id, company, title, insert_data.normalize_company(company))
+
+
+def test_sync_keeps_provisional_rows_of_other_stores(tmp_path, mysql_jobs):
+    path = str(tmp_path / "dedup.sqlite3")
+    mysql_jobs.append(_row(1, "에이", "백엔드 개발자"))
+    saramin, linkareer = DedupStore(path), DedupStore(path)
+
+    saramin.sync()
+    saramin.add({"company_name": "비", "title": "보안 관제 요원"})
+    linkareer.sync()
+
+    # 다른 크롤러가 방금 넣은 임시 행은 남아 있어야 중복으로 잡힌다
+    assert is_similar_job({"company_name": "비", "title": "보안 관제 요원"}, linkareer)
+
+    # 자기 임시 행은 다음 sync 때 MySQL 행으로 대체된다
+    saramin.sync()
+    assert len(saramin) == 1
+    saramin.close()
+    linkareer.close()
+
+
+def test_sync_rescans_margin_below_watermark(tmp_path, mysql_jobs):
+    store = DedupStore(str(tmp_path / "dedup.sqlite3"))
+    mysql_jobs.extend([_row(1, "에이", "백엔드"), _row(3, "씨", "프론트")])
+    assert store.sync() == 2
+
+    # id 2 가 3 보다 늦게 commit 된 경우
+    mysql_jobs.append(_row(2, "비", "데이터"))
+    assert store.sync() == 1
+    assert store.sync() == 0
+    assert len(store) == 3
+    store.close()
+
+
+def test_old_index_file_gets_owner_columns(tmp_path, mysql_jobs):
+    path = str(tmp_path / "dedup.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE jobs (
+            row_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id INTEGER UNIQUE,
+            company_name TEXT NOT NULL,
+            company_norm TEXT NOT NULL,
+            title TEXT NOT NULL
+        );
+        INSERT INTO jobs (job_id, company_name, company_norm, title) VALUES (NULL, '옛', '옛', '임시 행');
+        """
+    )
+    conn.close()
+    mysql_jobs.append(_row(1, "에이", "백엔드"))
+
+    store = DedupStore(path)
+    store.sync()
+
+    # 소유자를 알 수 없는 예전 임시 행은 정리된다
+    assert list(store) == [{"company_name": "에이", "title": "백엔드"}]
+    store.close()
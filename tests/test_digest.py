@@ -0,0 +1,73 @@
+from datetime import datetime, timedelta
+
+from digest import build_digest_messages, build_keyword_digests
+
+NOW = datetime(2026, 10, 18, 12, 0)
+SINCE = NOW - timedelta(hours=24)
+
+
+def _job(job_id, title, company="회사", hours_ago=1):
+    return {
+        "id": job_id,
+        "company_name": company,
+        "title": title,
+        "detail": f"https://example.com/jobs/{job_id}",
+        "created_at": NOW - timedelta(hours=hours_ago),
+    }
+
+
+def _user(user_id, keyword, last_id=None):
+    return {
+        "id": user_id,
+        "email": f"user{user_id}@example.com",
+        "keyword": keyword,
+        "last_notified_job_id": last_id,
+    }
+
+
+def test_keyword_digests_match_title_company_and_detail():
+    jobs = [
+        _job(1, "정보보안 담당자"),
+        _job(2, "백엔드 개발자", company="보안회사"),
+        _job(3, "데이터 분석가"),
+    ]
+
+    digests = build_keyword_digests(jobs, {"보안", "python"})
+    assert [job["id"] for job in digests["보안"]] == [1, 2]
+    assert "python" not in digests
+
+
+def test_messages_follow_each_subscriber_watermark():
+    jobs = [_job(3, "보안 관제"), _job(2, "보안 컨설턴트"), _job(1, "보안 엔지니어", hours_ago=30)]
+    users = [_user(1, "보안", last_id=2), _user(2, "보안")]
+
+    messages, distinct_keywords = build_digest_messages(jobs, users, SINCE)
+
+    by_email = {to_email: (subject, body) for to_email, subject, body in messages}
+    assert distinct_keywords == 1
+    # 워터마크 2 이후 공고만
+    assert "1건" in by_email["user1@example.com"][0]
+    assert "보안 관제" in by_email["user1@example.com"][1]
+    assert "보안 컨설턴트" not in by_email["user1@example.com"][1]
+    # 처음 받는 구독자는 since 이후 공고만 (30시간 전 공고 제외)
+    assert "2건" in by_email["user2@example.com"][0]
+    assert "보안 엔지니어" not in by_email["user2@example.com"][1]
+
+
+def test_subscribers_with_same_keyword_and_watermark_share_a_body():
+    jobs = [_job(5, "백엔드 개발자")]
+    users = [_user(1, "백엔드", last_id=4), _user(2, "백엔드", last_id=4)]
+
+    messages, _ = build_digest_messages(jobs, users, SINCE)
+
+    assert [to_email for to_email, _, _ in messages] == ["user1@example.com", "user2@example.com"]
+    assert messages[0][2] is messages[1][2]
+
+
+def test_no_message_without_matching_jobs():
+    messages, distinct_keywords = build_digest_messages(
+        [_job(1, "백엔드 개발자")], [_user(1, "보안"), _user(2, "AI", last_id=1)], SINCE
+    )
+
+    assert messages == []
+    assert distinct_keywords == 2
@@ -0,0 +1,61 @@
+import threading
+import time
+
+from fetcher import TokenBucket, fetch_pages
+
+
+def test_burst_is_served_immediately_then_rate_limited():
+    bucket = TokenBucket(rate=20, capacity=3)
+
+    started = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - started < 0.03
+
+    for _ in range(2):
+        bucket.acquire()
+    # 버스트 뒤 두 개는 1/20 초 간격으로 나온다
+    assert time.monotonic() - started >= 0.09
+
+
+def test_zero_rate_never_waits():
+    bucket = TokenBucket(rate=0)
+
+    started = time.monotonic()
+    for _ in range(100):
+        bucket.acquire()
+    assert time.monotonic() - started < 0.05
+
+
+def test_waiters_are_served_in_request_order():
+    bucket = TokenBucket(rate=20, capacity=1)
+    bucket.acquire()
+    finished = []
+    lock = threading.Lock()
+
+    def worker(n):
+        bucket.acquire()
+        with lock:
+            finished.append(n)
+
+    threads = []
+    for n in range(5):
+        thread = threading.Thread(target=worker, args=(n,))
+        thread.start()
+        threads.append(thread)
+        # 요청 순서를 분명히 하려고 조금씩 늦게 시작
+        time.sleep(0.005)
+    for thread in threads:
+        thread.join()
+
+    assert finished == list(range(5))
+
+
+def test_fetch_pages_yields_in_page_order():
+    def fetch(page):
+        # 뒤 페이지가 먼저 끝나도 순서는 유지돼야 한다
+        time.sleep(0.02 if page % 2 else 0)
+        return page * 10
+
+    pages = fetch_pages(fetch, range(1, 5), host="test-fetch-pages-order")
+    assert list(pages) == [(page, page * 10) for page in range(1, 5)]
@@ -0,0 +1,161 @@
+import pytest
+
+import html_parser
+
+SARAMIN_HTML = """
+<html><body>
+<div id="search_panel"><div class="content"><div><div class="area_job">
+  <h2><a href="/zf_user/jobs/relay/view?rec_idx=0">광고 공고</a></h2>
+</div></div></div></div>
+<div id="recruit_info_list">
+  <div class="content">
+    <div class="item_recruit">
+      <div class="area_job">
+        <h2 class="job_tit"><a href="/zf_user/jobs/relay/view?rec_idx=1"> <span>정보보호</span> 담당자 </a></h2>
+        <div class="job_date"><span class="date">~ 12/13(토)</span></div>
+      </div>
+      <div class="area_corp"><strong class="corp_name"><a href="/company/1"> (주)에이 <!-- 광고 --></a></strong></div>
+    </div>
+    <div class="item_recruit">
+      <div class="area_job">
+        <h2 class="job_tit"><a href="https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=2">보안관제 요원</a></h2>
+        <div class="job_date"><span class="date">상시채용</span></div>
+      </div>
+      <div class="area_corp"><strong class="corp_name"><a href="/company/2">비 &amp; 씨</a></strong></div>
+    </div>
+  </div>
+</div>
+</body></html>
+"""
+
+
+def _jasoseol_card(job_id, company, title, period):
+    return f"""
+    <div><a href="/recruit/{job_id}">
+      <div><img alt="logo"></div>
+      <div>
+        <h5> {company} </h5>
+        <h4>{title}</h4>
+        <div>태그</div><div>지역</div><div>경력</div>
+        <div><div><div>{period}</div></div></div>
+      </div>
+    </a></div>
+    """
+
+
+# 목록 main 앞에 다른 main(모달)이 먼저 나와도 #__next 아래 목록만 읽어야 한다
+JASOSEOL_HTML = f"""
+<html><body>
+<div id="modal"><main><div class="px-4"><div><main>
+  {_jasoseol_card(999, "모달회사", "모달 공고", "2025.01.01 ~ 2025.01.02")}
+</main></div></div></main></div>
+<div id="__next"><div><div class="responsive-layout">
+  <nav><a href="/menu">메뉴</a></nav>
+  <main><div class="px-4"><div><main>
+    {_jasoseol_card(1, "에이 주식회사", "백엔드 <b>개발자</b>", "2025.03.01 ~ 2025.03.14")}
+    {_jasoseol_card(2, "비", "정보보안 담당자", "상시")}
+  </main></div></div></main>
+</div></div></div>
+</body></html>
+"""
+
+# 백엔드 이름과 그 백엔드가 쓰는 패키지
+BACKENDS = [
+    ("selectolax", ("selectolax",)),
+    ("lxml", ("lxml", "cssselect")),
+    ("bs4", ("bs4",)),
+]
+
+
+@pytest.fixture(params=BACKENDS, ids=[name for name, _ in BACKENDS])
+def backend(request, monkeypatch):
+    name, modules = request.param
+    for module in modules:
+        pytest.importorskip(module)
+    instance = html_parser._BACKENDS[name]()
+    monkeypatch.setattr(html_parser, "backend", instance)
+    return instance
+
+
+def _saramin_jobs():
+    from crawl_saramin import SaraminCrawler
+
+    crawler = SaraminCrawler()
+    return [crawler.normalize(item) for item in crawler.parse(SARAMIN_HTML)]
+
+
+def _jasoseol_jobs():
+    from project01_test import JasoseolCrawler
+
+    crawler = JasoseolCrawler()
+    return [crawler.normalize(item) for item in crawler.parse(JASOSEOL_HTML)]
+
+
+def test_saramin_listing(backend):
+    jobs = _saramin_jobs()
+
+    assert [(job["company_name"], job["title"], job["detail"]) for job in jobs] == [
+        ("(주)에이", "정보보호담당자", "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=1"),
+        ("비 & 씨", "보안관제 요원", "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx=2"),
+    ]
+    assert jobs[0]["end_time"].month == 12 and jobs[0]["end_time"].day == 13
+    assert jobs[1]["end_time"] is None
+
+
+def test_jasoseol_listing_ignores_other_main_elements(backend):
+    jobs = _jasoseol_jobs()
+
+    assert [(job["company_name"], job["title"], job["detail"]) for job in jobs] == [
+        ("에이 주식회사", "백엔드개발자", "https://jasoseol.com/recruit/1"),
+        ("비", "정보보안 담당자", "https://jasoseol.com/recruit/2"),
+    ]
+    assert (jobs[0]["start_time"], jobs[0]["end_time"]) == ("2025.03.01", "2025.03.14")
+
+
+def test_missing_listing_is_none(backend):
+    assert html_parser.parse_listing("<html><body><main></main></body></html>", "#recruit_info_list") is None
+    assert (
+        html_parser.parse_listing(
+            "<html><body></body></html>", "#recruit_info_list", strainer={"id": "recruit_info_list"}
+        )
+        is None
+    )
+
+
+def test_ambiguous_strainer_falls_back_to_container(backend):
+    listing = html_parser.parse_listing(JASOSEOL_HTML, "#__next main", strainer={"name": "main"})
+
+    assert [html_parser.attr(a, "href") for a in html_parser.select(listing, "div > a")] == [
+        "/recruit/1",
+        "/recruit/2",
+    ]
+
+
+def test_attr_default_and_select_one(backend):
+    root = html_parser.parse('<div><a class="x">링크</a></div>')
+
+    link = html_parser.select_one(root, "a.x")
+    assert html_parser.text(link) == "링크"
+    assert html_parser.attr(link, "href", "") == ""
+    assert html_parser.select_one(root, "a.y") is None
+
+
+def test_all_backends_agree():
+    outputs = {}
+    for name, modules in BACKENDS:
+        try:
+            for module in modules:
+                __import__(module)
+        except ImportError:
+            continue
+        original = html_parser.backend
+        html_parser.backend = html_parser._BACKENDS[name]()
+        try:
+            outputs[name] = (_saramin_jobs(), _jasoseol_jobs())
+        finally:
+            html_parser.backend = original
+
+    if len(outputs) < 2:
+        pytest.skip("비교할 HTML 파서 백엔드가 두 개 이상 설치되어 있지 않습니다")
+    first = next(iter(outputs.values()))
+    assert all(output == first for output in outputs.values()), outputs
@@ -0,0 +1,141 @@
+import random
+
+import pytest
+
+import insert_data
+from insert_data import (
+    ExistingJob,
+    JobIndex,
+    _bigrams,
+    _min_shared_bigrams,
+    _ratio_at_least,
+    _shares_enough_bigrams,
+    get_existing_jobs,
+    is_similar_job,
+    is_similar_job_normalize_company,
+    normalize_company,
+    similarity,
+)
+
+ALPHABET = "가나다라마바abc"
+
+
+def _random_text(rng, length):
+    return "".join(rng.choice(ALPHABET) for _ in range(length))
+
+
+def _mutate(rng, text):
+    chars = list(text)
+    for _ in range(rng.randint(0, 2)):
+        roll = rng.random()
+        pos = rng.randrange(len(chars) + 1)
+        if roll < 0.4:
+            chars.insert(pos, rng.choice(ALPHABET))
+        elif roll < 0.8 and chars:
+            del chars[min(pos, len(chars) - 1)]
+        elif chars:
+            chars[min(pos, len(chars) - 1)] = rng.choice(ALPHABET)
+    return "".join(chars)
+
+
+def _shared_bigrams(query: str, key: str) -> int:
+    # JobIndex.candidates 가 행마다 세는 값과 같다
+    key_grams = _bigrams(key)
+    return sum(count for gram, count in _bigrams(query).items() if gram in key_grams)
+
+
+@pytest.mark.parametrize("threshold", [0.81, 0.85, 0.9, 0.95])
+def test_min_shared_bigrams_is_a_lower_bound(threshold):
+    rng = random.Random(1)
+    checked = 0
+    for _ in range(4000):
+        a = _random_text(rng, rng.randint(2, 12))
+        b = _mutate(rng, a)
+        if len(b) < 2 or similarity(a, b) < threshold:
+            continue
+        checked += 1
+        assert _shared_bigrams(a, b) >= _min_shared_bigrams(len(a) + len(b), threshold), (a, b)
+    assert checked > 100
+
+
+@pytest.mark.parametrize("threshold", [0.81, 0.85, 0.9])
+def test_title_bound_and_quick_ratio_never_drop_a_match(threshold):
+    rng = random.Random(3)
+    for _ in range(4000):
+        a = _random_text(rng, rng.randint(0, 12))
+        b = _mutate(rng, a) if rng.random() < 0.8 else _random_text(rng, rng.randint(0, 12))
+        ratio = similarity(a, b)
+        if ratio >= threshold:
+            assert _shares_enough_bigrams(a, _bigrams(a), b, threshold), (a, b)
+            assert _ratio_at_least(a, b, threshold) == ratio
+        else:
+            assert _ratio_at_least(a, b, threshold) is None
+
+
+def test_same_company_with_unrelated_titles_is_not_a_candidate():
+    titles = ["백엔드 개발자", "보안관제 요원", "데이터 분석가", "인프라 운영", "서비스 기획자"]
+    index = JobIndex([{"company_name": "한빛소프트", "title": title} for title in titles * 20])
+
+    candidates = list(index.candidates("보안관제요원", "한빛소프트", 0.85))
+
+    assert candidates == [("보안관제 요원", "한빛소프트")] * 20
+
+
+def _jobs(rng, count):
+    jobs = []
+    for _ in range(count):
+        company = _random_text(rng, rng.randint(1, 8))
+        if rng.random() < 0.3:
+            company = rng.choice(["(주)", "주식회사 ", ""]) + company
+        jobs.append({"company_name": company, "title": _random_text(rng, rng.randint(3, 15))})
+    return jobs
+
+
+@pytest.mark.parametrize(
+    "check, normalize",
+    [(is_similar_job, None), (is_similar_job_normalize_company, normalize_company)],
+)
+def test_index_matches_linear_scan(check, normalize):
+    rng = random.Random(2)
+    existing = _jobs(rng, 150)
+    index = JobIndex(existing, normalize=normalize)
+
+    incoming = _jobs(rng, 50) + [
+        {"company_name": _mutate(rng, job["company_name"]), "title": _mutate(rng, job["title"])}
+        for job in rng.sample(existing, 50)
+    ]
+    duplicates = 0
+    for job in incoming:
+        expected = check(job, existing, threshold=0.85)
+        assert check(job, index, threshold=0.85) == expected, job
+        duplicates += expected
+    assert duplicates > 0
+
+
+def test_index_add_and_iter_keep_insertion_order():
+    index = JobIndex()
+    index.add({"company_name": "에이", "title": "백엔드"})
+    index.add({"company_name": "비", "title": "프론트"})
+
+    assert len(index) == 2
+    assert list(index) == [
+        {"company_name": "에이", "title": "백엔드"},
+        {"company_name": "비", "title": "프론트"},
+    ]
+
+
+def test_one_letter_companies_only_match_exactly():
+    index = JobIndex([{"company_name": "A", "title": "보안 관제 요원"}])
+
+    assert is_similar_job({"company_name": "A", "title": "보안 관제 요원"}, index)
+    assert not is_similar_job({"company_name": "B", "title": "보안 관제 요원"}, index)
+
+
+def test_get_existing_jobs_streams_batches(monkeypatch):
+    batches = [[ExistingJob(1, "에이", "백엔드 개발자", "에이")], [ExistingJob(2, "비", "보안관제 요원")]]
+    monkeypatch.setattr(insert_data, "iter_existing_job_batches", lambda: iter(batches))
+
+    assert get_existing_jobs() == [
+        {"company_name": "에이", "title": "백엔드 개발자"},
+        {"company_name": "비", "title": "보안관제 요원"},
+    ]
@@ -0,0 +1,37 @@
+import random
+
+from keyword_matcher import KeywordMatcher
+
+
+def _brute_force(keywords, text):
+    return {kw for kw in keywords if kw and kw.casefold() in text.casefold()}
+
+
+def test_finds_overlapping_and_nested_keywords():
+    matcher = KeywordMatcher(["보안", "정보보안", "보안관제", "관제"])
+
+    assert matcher.find("정보보안관제 요원") == {"보안", "정보보안", "보안관제", "관제"}
+    assert matcher.find("백엔드 개발") == set()
+
+
+def test_matching_ignores_case_but_returns_original_spelling():
+    matcher = KeywordMatcher(["Python", "AWS"])
+
+    assert matcher.find("python / aws 개발자") == {"Python", "AWS"}
+
+
+def test_empty_inputs():
+    assert KeywordMatcher([]).find("아무 공고") == set()
+    assert KeywordMatcher(["", "보안"]).find("") == set()
+    assert KeywordMatcher(["", "보안"]).find(None) == set()
+
+
+def test_matches_brute_force_on_random_text():
+    rng = random.Random(3)
+    alphabet = "가나다ab"
+    for _ in range(200):
+        keywords = {"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(8)}
+        matcher = KeywordMatcher(keywords)
+        for _ in range(10):
+            text = "".join(rng.choice(alphabet + "AB ") for _ in range(rng.randint(0, 30)))
+            assert matcher.find(text) == _brute_force(keywords, text), (keywords, text)
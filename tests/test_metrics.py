@@ -0,0 +1,66 @@
+import metrics
+
+# metrics 는 프로세스 전역이므로 테스트마다 겹치지 않는 이름을 쓴다
+
+
+def test_render_prometheus_counters_and_timers():
+    metrics.inc("test_render_jobs", 3, source="saramin")
+    metrics.inc("test_render_jobs", 2, source="saramin")
+    metrics.observe("test_render_stage", 0.5, source="saramin")
+    metrics.observe("test_render_stage", 1.5, source="saramin")
+
+    lines = metrics.render_prometheus().splitlines()
+
+    assert "# TYPE test_render_jobs_total counter" in lines
+    assert 'test_render_jobs_total{source="saramin"} 5' in lines
+    assert "# TYPE test_render_stage_seconds summary" in lines
+    assert 'test_render_stage_seconds_count{source="saramin"} 2' in lines
+    assert 'test_render_stage_seconds_sum{source="saramin"} 2.000000' in lines
+    assert 'test_render_stage_seconds_max{source="saramin"} 1.500000' in lines
+
+
+def test_render_prometheus_escapes_label_values():
+    metrics.inc("test_escape", source='a"b\\c\nd')
+
+    assert 'test_escape_total{source="a\\"b\\\\c\\nd"} 1' in metrics.render_prometheus().splitlines()
+
+
+def test_unlabelled_metric_has_no_braces():
+    metrics.inc("test_plain")
+
+    assert "test_plain_total 1" in metrics.render_prometheus().splitlines()
+
+
+def test_timer_records_even_when_block_raises():
+    try:
+        with metrics.timer("test_timer_error"):
+            raise ValueError
+    except ValueError:
+        pass
+
+    assert "test_timer_error_seconds_count 1" in metrics.render_prometheus().splitlines()
+
+
+def test_summary_counts_only_the_delta_since_snapshot():
+    metrics.inc("test_summary_rows", 10, source="linkareer")
+    before = metrics.snapshot()
+    metrics.inc("test_summary_rows", 4, source="linkareer")
+    metrics.observe("test_summary_stage", 2.0)
+    metrics.observe("test_summary_stage", 4.0)
+
+    summary = metrics.summary(since=before, prefixes=("test_summary_",))
+
+    assert summary == {
+        "counters": {"test_summary_rows{source=linkareer}": 4},
+        "timers": {"test_summary_stage": {"count": 2, "total_seconds": 6.0, "avg_seconds": 3.0}},
+    }
+
+
+def test_summary_prefixes_leave_out_other_metrics():
+    before = metrics.snapshot()
+    metrics.inc("test_prefix_crawl", 1)
+    metrics.inc("test_other_search", 1)
+
+    summary = metrics.summary(since=before, prefixes=("test_prefix_",))
+
+    assert summary["counters"] == {"test_prefix_crawl": 1}
@@ -0,0 +1,108 @@
+import pytest
+
+import outbox
+from config import (
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_RETRY_BASE_SECONDS,
+    OUTBOX_VERIFICATION_MAX_ATTEMPTS,
+    OUTBOX_VERIFICATION_RETRY_BASE_SECONDS,
+    VERIFICATION_CODE_TTL_SECONDS,
+)
+from outbox import EXPIRED_ERROR, FAILED, PENDING, is_expired, next_retry
+
+
+def test_digest_retries_back_off_exponentially_until_max_attempts():
+    delays = []
+    for attempts in range(1, OUTBOX_MAX_ATTEMPTS):
+        status, delay = next_retry("digest", attempts, age_seconds=0)
+        assert status == PENDING
+        delays.append(delay)
+
+    assert delays == [OUTBOX_RETRY_BASE_SECONDS * 2 ** n for n in range(OUTBOX_MAX_ATTEMPTS - 1)]
+    assert next_retry("digest", OUTBOX_MAX_ATTEMPTS, age_seconds=0)[0] == FAILED
+
+
+def test_digest_never_expires():
+    assert not is_expired("digest", age_seconds=30 * 24 * 3600)
+
+
+def test_verification_uses_its_own_attempt_limit():
+    assert next_retry("verification", 1, age_seconds=0) == (PENDING, OUTBOX_VERIFICATION_RETRY_BASE_SECONDS)
+    assert next_retry("verification", OUTBOX_VERIFICATION_MAX_ATTEMPTS, age_seconds=0)[0] == FAILED
+
+
+def test_verification_retry_is_not_scheduled_past_code_expiry():
+    age = VERIFICATION_CODE_TTL_SECONDS - OUTBOX_VERIFICATION_RETRY_BASE_SECONDS
+
+    assert next_retry("verification", 1, age_seconds=age - 1) == (PENDING, OUTBOX_VERIFICATION_RETRY_BASE_SECONDS)
+    assert next_retry("verification", 1, age_seconds=age)[0] == FAILED
+
+
+def test_verification_expires_with_the_code():
+    assert not is_expired("verification", VERIFICATION_CODE_TTL_SECONDS - 1)
+    assert is_expired("verification", VERIFICATION_CODE_TTL_SECONDS)
+
+
+@pytest.fixture
+def fake_outbox(monkeypatch):
+    """claim_batch / _record_results 를 DB 없이 흉내 낸다"""
+    state = {"batches": [], "recorded": []}
+
+    def claim_batch(limit=None):
+        return state["batches"].pop(0) if state["batches"] else []
+
+    def record_results(rows, results):
+        state["recorded"].append((rows, results))
+        sent = sum(1 for _, error in results if error is None)
+        return sent, len(results) - sent
+
+    monkeypatch.setattr(outbox, "claim_batch", claim_batch)
+    monkeypatch.setattr(outbox, "_record_results", record_results)
+    return state
+
+
+def _row(row_id, kind, age_seconds):
+    return {
+        "id": row_id,
+        "kind": kind,
+        "to_email": f"user{row_id}@example.com",
+        "subject": "제목",
+        "body": "본문",
+        "attempts": 0,
+        "age_seconds": age_seconds,
+    }
+
+
+def test_drain_skips_expired_verification_mail(fake_outbox):
+    fake_outbox["batches"].append(
+        [_row(1, "verification", VERIFICATION_CODE_TTL_SECONDS + 5), _row(2, "verification", 5), _row(3, "digest", 0)]
+    )
+    sent_to = []
+
+    def send_batch(messages):
+        sent_to.extend(to_email for to_email, _, _ in messages)
+        return [(to_email, None) for to_email, _, _ in messages]
+
+    stats = outbox.drain_outbox(send_batch)
+
+    assert sent_to == ["user2@example.com", "user3@example.com"]
+    assert stats == {"sent": 2, "retried": 1}
+    _, results = fake_outbox["recorded"][0]
+    assert results == [
+        ("user1@example.com", EXPIRED_ERROR),
+        ("user2@example.com", None),
+        ("user3@example.com", None),
+    ]
+
+
+def test_drain_records_send_batch_exception_for_every_message(fake_outbox):
+    fake_outbox["batches"].append([_row(1, "digest", 0), _row(2, "digest", 0)])
+
+    def send_batch(messages):
+        raise ConnectionError("smtp down")
+
+    stats = outbox.drain_outbox(send_batch)
+
+    assert stats == {"sent": 0, "retried": 2}
+    _, results = fake_outbox["recorded"][0]
+    assert [error for _, error in results] == ["ConnectionError('smtp down')"] * 2
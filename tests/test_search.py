@@ -0,0 +1,169 @@
+import base64
+import random
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from search import (
+    SEARCH_COMPANY_WEIGHT,
+    SEARCH_TITLE_WEIGHT,
+    InvalidCursor,
+    build_search_clause,
+    decode_cursor,
+    encode_cursor,
+    search_jobs_page,
+    to_phrase,
+    uses_fulltext,
+)
+
+
+@pytest.mark.parametrize(
+    "keyword, phrase",
+    [
+        ("보안", '"보안"'),
+        ("  정보   보안 ", '"정보 보안"'),
+        ("C++", '"C"'),
+        ('+보안 -"관제"', '"보안 관제"'),
+        ("++", '""'),
+    ],
+)
+def test_to_phrase_strips_boolean_operators(keyword, phrase):
+    assert to_phrase(keyword) == phrase
+
+
+@pytest.mark.parametrize(
+    "keyword, expected",
+    [
+        ("보안", True),
+        ("자바 스프링", True),
+        ("Node.js", True),
+        ("a", False),
+        # 연산자를 지우면 ngram 크기보다 짧은 토큰이 남는다
+        ("C++", False),
+        ("데이터 C", False),
+        ("A B", False),
+        ("++", False),
+    ],
+)
+def test_uses_fulltext_checks_every_cleaned_token(keyword, expected):
+    assert uses_fulltext(keyword) is expected
+
+
+def test_short_keywords_fall_back_to_like():
+    where, where_params, _, _ = build_search_clause(["보안", "C++"], mode="all")
+
+    assert where == (
+        "MATCH(title, company_name) AGAINST (%s IN BOOLEAN MODE)"
+        " AND (title LIKE %s OR company_name LIKE %s)"
+    )
+    assert where_params == ['+"보안"', "%C++%", "%C++%"]
+
+
+def test_any_mode_joins_with_or_without_required_prefix():
+    where, where_params, _, _ = build_search_clause(["보안", "관제"], mode="any")
+
+    assert "+" not in where_params[0]
+    assert where_params == ['"보안" "관제"']
+    assert where == "MATCH(title, company_name) AGAINST (%s IN BOOLEAN MODE)"
+
+
+def test_score_weights_title_above_company_per_keyword():
+    _, _, score, score_params = build_search_clause(["보안", "관제", "C"], mode="any")
+
+    assert SEARCH_TITLE_WEIGHT > SEARCH_COMPANY_WEIGHT
+    # 관련도 값이 아니라 키워드마다 일치 여부(> 0)에 가중치를 곱한다
+    assert score.count(f"{SEARCH_TITLE_WEIGHT} * (MATCH(title) AGAINST (%s IN BOOLEAN MODE) > 0)") == 2
+    assert score.count(f"{SEARCH_COMPANY_WEIGHT} * (MATCH(company_name) AGAINST (%s IN BOOLEAN MODE) > 0)") == 2
+    assert f"{SEARCH_TITLE_WEIGHT} * (title LIKE %s)" in score
+    assert score_params == ['"보안"', '"보안"', '"관제"', '"관제"', "%C%", "%C%"]
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor({"id": 42, "end_time": datetime(2026, 10, 18, 9, 30)})
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("2026-10-18T09:30:00", 42)
+    assert decode_cursor(encode_cursor({"id": 7, "end_time": None})) == (None, 7)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "!!!",
+        base64.urlsafe_b64encode(b"not json").decode(),
+        base64.urlsafe_b64encode(b'{"id": 1}').decode(),
+        base64.urlsafe_b64encode(b'["2026-10-18", "1"]').decode(),
+        base64.urlsafe_b64encode(b"[123, 1]").decode(),
+    ],
+)
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor)
+
+
+class _SQLiteCursor:
+    def __init__(self, conn):
+        self._conn = conn
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql, params):
+        self._rows = self._conn.execute(sql.replace("%s", "?"), params).fetchall()
+
+    def fetchall(self):
+        return [dict(row) for row in self._rows]
+
+
+class _SQLiteJobs:
+    """search_jobs_page 가 쓰는 만큼만 맞춘 pymysql 연결 대용 (SQLite 도 (a, b) > (?, ?) 비교를 지원)"""
+
+    def __init__(self, end_times):
+        self._conn = sqlite3.connect(":memory:")
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute(
+            "CREATE TABLE job (id INTEGER PRIMARY KEY, company_name TEXT, title TEXT,"
+            " start_time TEXT, end_time TEXT, detail TEXT, created_at TEXT)"
+        )
+        self._conn.executemany(
+            "INSERT INTO job (id, company_name, title, end_time) VALUES (?, '회사', '공고', ?)",
+            list(enumerate(end_times, start=1)),
+        )
+
+    def cursor(self):
+        return _SQLiteCursor(self._conn)
+
+
+@pytest.mark.parametrize("page_size", [1, 3, 7, 50])
+def test_keyset_pages_cover_both_segments_in_order(page_size):
+    rng = random.Random(page_size)
+    end_times = [None if rng.random() < 0.3 else f"2026-10-{rng.randint(1, 5):02d}" for _ in range(40)]
+    conn = _SQLiteJobs(end_times)
+
+    seen, cursor = [], None
+    while True:
+        page = search_jobs_page(conn, [], cursor=cursor, page_size=page_size, fields=["id", "end_time"])
+        assert len(page["items"]) <= page_size
+        seen.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    # 마감일 있는 구간 (end_time, id) 순 → 마감일 미정 구간 id 순, 빠지거나 겹치는 행 없이
+    expected = sorted(
+        ({"id": i, "end_time": end} for i, end in enumerate(end_times, start=1)),
+        key=lambda row: (row["end_time"] is None, row["end_time"] or "", row["id"]),
+    )
+    assert seen == expected
+
+
+def test_last_page_has_no_cursor():
+    conn = _SQLiteJobs(["2026-10-01", None])
+
+    page = search_jobs_page(conn, [], page_size=2, fields=["id"])
+    assert page == {"items": [{"id": 1}, {"id": 2}], "next_cursor": None}
@@ -0,0 +1,71 @@
+import search_cache
+from job_store import bump_ingest_generation
+from search_cache import QueryCache
+
+
+class _Loader:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return f"result-{self.calls}"
+
+
+def test_hit_does_not_reload():
+    cache = QueryCache(maxsize=4, ttl=60)
+    load = _Loader()
+
+    assert cache.get_or_load("보안", load) == "result-1"
+    assert cache.get_or_load("보안", load) == "result-1"
+    assert load.calls == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_new_ingest_generation_invalidates():
+    cache = QueryCache(maxsize=4, ttl=60)
+    load = _Loader()
+
+    cache.get_or_load("보안", load)
+    bump_ingest_generation()
+    assert cache.get_or_load("보안", load) == "result-2"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = QueryCache(maxsize=2, ttl=60)
+    loads = {key: _Loader() for key in "abc"}
+
+    cache.get_or_load("a", loads["a"])
+    cache.get_or_load("b", loads["b"])
+    cache.get_or_load("a", loads["a"])  # a 가 최근 사용
+    cache.get_or_load("c", loads["c"])  # b 가 밀려남
+
+    cache.get_or_load("a", loads["a"])
+    cache.get_or_load("b", loads["b"])
+    assert loads["a"].calls == 1
+    assert loads["b"].calls == 2
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(search_cache.time, "monotonic", lambda: now[0])
+    cache = QueryCache(maxsize=4, ttl=10)
+    load = _Loader()
+
+    cache.get_or_load("보안", load)
+    now[0] += 9.9
+    cache.get_or_load("보안", load)
+    assert load.calls == 1
+
+    now[0] += 0.2
+    cache.get_or_load("보안", load)
+    assert load.calls == 2
+
+
+def test_zero_size_disables_cache():
+    cache = QueryCache(maxsize=0, ttl=60)
+    load = _Loader()
+
+    cache.get_or_load("보안", load)
+    cache.get_or_load("보안", load)
+    assert load.calls == 2